@@ -0,0 +1,49 @@
+"""
+Benchmark: dsp.corpus sobre un corpus sintético de WAV (archivos/s).
+
+Uso (desde la raíz del repo):
+    python bench/bench_corpus.py [n_archivos] [segundos_por_archivo]
+Genera los WAV (16 bits, 44.1 kHz: tono + armónicos + ruido) en un
+directorio temporal y corre el análisis con 1, 2, 4, ... procesos hasta
+la cantidad de núcleos; cada corrida escribe su propio CSV.
+"""
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+import numpy as np
+from scipy.io.wavfile import write
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))  # raíz del repo
+from dsp.corpus import correr_corpus
+
+
+def generar_corpus(directorio, n, dur, fs=44_100, seed=0):
+    rng = np.random.default_rng(seed)
+    t = np.arange(int(dur * fs)) / fs
+    for i in range(n):
+        f0 = rng.uniform(220, 880)
+        x = sum(0.5 / h * np.sin(2*np.pi*h*f0*t) for h in range(1, 5))
+        x += 0.01 * rng.standard_normal(t.size)
+        write(os.path.join(directorio, f"toma_{i:05d}.wav"), fs,
+              (x / np.max(np.abs(x)) * 0.8 * 32767).astype(np.int16))
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    dur = float(sys.argv[2]) if len(sys.argv) > 2 else 2.0
+    nucleos = os.cpu_count() or 1
+    with tempfile.TemporaryDirectory() as d:
+        generar_corpus(d, n, dur)
+        print(f"{n} archivos de {dur:.1f} s | {nucleos} núcleos")
+        base = None
+        j = 1
+        while True:
+            r = correr_corpus(d, os.path.join(d, f"res_{j}.csv"), procesos=j, progreso=False)
+            base = base or r["archivos_por_s"]
+            print(f"  {j:>2} procesos: {r['archivos_por_s']:8.1f} archivos/s "
+                  f"(x{r['archivos_por_s'] / base:.2f})")
+            if j >= nucleos:
+                break
+            j = min(2 * j, nucleos)
@@ -0,0 +1,98 @@
+"""
+Benchmark: lazos originales (clase04 / clase07) vs motor de dsp.filtros.
+
+Uso (desde la raíz del repo):
+    python bench/bench_filtros.py [segundos_de_audio]
+Incluye el barrido de parámetros con los bancos (banco_ema / banco_sma).
+"""
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))  # raíz del repo
+from dsp.filtros import ema, sma, banco_ema, banco_sma, HAS_NUMBA
+
+
+# ---------- Referencias: copias de los lazos originales ----------
+def ema_filter_loop(x, alpha):
+    """clase04-09.py::ema_filter"""
+    y = np.empty_like(x)
+    y[0] = alpha * x[0]
+    a1 = 1.0 - alpha
+    for n in range(1, len(x)):
+        y[n] = alpha * x[n] + a1 * y[n-1]
+    return y
+
+def ema_loop(x, alpha):
+    """clase07_13.ipynb::ema"""
+    y = np.empty_like(x, dtype=float)
+    y[0] = x[0]
+    for n in range(1, x.size):
+        y[n] = alpha*x[n] + (1-alpha)*y[n-1]
+    return y
+
+def sma_loop(x, W):
+    """clase07_13.ipynb::sma_diff_eq"""
+    N = x.size
+    y = np.empty_like(x, dtype=float)
+    acc = 0.0
+    for n in range(N):
+        acc += x[n]
+        if n < W:
+            y[n] = acc/(n+1)
+        else:
+            y[n] = y[n-1] + (x[n]-x[n-W])/W
+    return y
+
+
+def cronometrar(fn, *args, rep=3):
+    """Mejor tiempo de `rep` corridas y la salida de la última."""
+    best = np.inf
+    for _ in range(rep):
+        t0 = time.perf_counter()
+        out = fn(*args)
+        best = min(best, time.perf_counter() - t0)
+    return best, out
+
+
+if __name__ == "__main__":
+    fs = 44_100
+    seg = float(sys.argv[1]) if len(sys.argv) > 1 else 10.0
+    rng = np.random.default_rng(0)
+    x64 = rng.standard_normal(int(seg * fs))
+    x32 = x64.astype(np.float32)
+    y64 = np.empty_like(x64)           # salida reutilizada (sin páginas nuevas en cada corrida)
+    print(f"Señal: {seg:.0f} s a {fs} Hz ({x64.size} muestras) | numba: {HAS_NUMBA}\n")
+
+    casos = [
+        ("ema_filter α=0.05 (f32)", lambda: ema_filter_loop(x32, 0.05), lambda: ema(x32, 0.05, inicio="cero")),
+        ("ema α=0.05 (f64)",        lambda: ema_loop(x64, 0.05),        lambda: ema(x64, 0.05)),
+        ("ema α=0.05 (f64, out=)",  lambda: ema_loop(x64, 0.05),        lambda: ema(x64, 0.05, out=y64)),
+        ("sma_diff_eq W=75",        lambda: sma_loop(x64, 75),          lambda: sma(x64, 75)),
+    ]
+    if HAS_NUMBA:
+        ema(x64, 0.05, motor="numba")  # compilar antes de medir
+        casos.append(("ema α=0.05 (numba)", lambda: ema_loop(x64, 0.05),
+                      lambda: ema(x64, 0.05, motor="numba")))
+
+    print(f"{'caso':<26}{'lazo [s]':>10}{'motor [s]':>11}{'x':>8}{'max|Δ|':>11}")
+    for nombre, ref, nuevo in casos:
+        t_ref, y_ref = cronometrar(ref, rep=1)
+        t_new, y_new = cronometrar(nuevo, rep=20)      # ms: más corridas para el mejor tiempo
+        err = float(np.max(np.abs(y_ref - y_new)))
+        print(f"{nombre:<26}{t_ref:>10.3f}{t_new:>11.4f}{t_ref/t_new:>8.0f}{err:>11.2e}")
+
+    # ---------- Bancos: barrido de parámetros en una pasada ----------
+    P = 100
+    alphas = np.linspace(0.01, 0.9, P)
+    ventanas = np.arange(1, P + 1)
+    print(f"\nBarrido de {P} parámetros:")
+    print(f"{'caso':<26}{'por parám. [s]':>15}{'banco [s]':>11}{'x':>6}")
+    t_sep, _ = cronometrar(lambda: [ema(x64, a) for a in alphas], rep=1)
+    t_bank, _ = cronometrar(lambda: banco_ema(x64, alphas), rep=1)
+    print(f"{'EMA (numba)' if HAS_NUMBA else 'EMA (una ema por α)':<26}{t_sep:>15.3f}{t_bank:>11.3f}{t_sep/t_bank:>6.1f}")
+    t_sep, _ = cronometrar(lambda: [sma(x64, W) for W in ventanas], rep=1)
+    t_bank, _ = cronometrar(lambda: banco_sma(x64, ventanas), rep=1)
+    print(f"{'SMA (suma acumulada)':<26}{t_sep:>15.3f}{t_bank:>11.3f}{t_sep/t_bank:>6.1f}")
@@ -0,0 +1,52 @@
+"""
+Verificación: los motores por bloques con estado dan lo mismo con
+cualquier tamaño de bloque (incluidos bloques más cortos que una traza
+o que el retardo de los filtros) que con una sola pasada.
+
+Uso (desde la raíz del repo):
+    python bench/verificar_bloques.py
+Termina con AssertionError en la primera diferencia.
+"""
+import sys
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))  # raíz del repo
+from dsp.modem import Modem
+from dsp.ojo import DensidadOjo
+
+
+def verificar_ojo(M=8, spans=2, n=5000, seed=0):
+    """DensidadOjo: bloques de 1, 17 y spans·M muestras == un solo `actualizar`."""
+    y = np.random.default_rng(seed).standard_normal(n)
+    casos = [{}, {"descarte": 160}, {"descarte": 160, "max_trazas": 100},
+             {"sobremuestreo": 4, "descarte": 3}]
+    for kw in casos:
+        ref = DensidadOjo(M, spans, **kw).actualizar(y)
+        for B in (1, 17, spans * M, 160):
+            d = DensidadOjo(M, spans, **kw)
+            for i in range(0, n, B):
+                d.actualizar(y[i:i + B])
+            assert np.array_equal(d.H, ref.H), (kw, B)
+            assert (d.trazas, d.fuera) == (ref.trazas, ref.fuera), (kw, B)
+        print(f"  DensidadOjo {kw}: {ref.trazas} trazas, iguales con bloques 1/17/{spans * M}/160")
+
+
+def verificar_modem(n=5000, ebn0_db=6.0):
+    """Modem: símbolos, errores, BER y ojo iguales con bloques de 1, 16, 64 y 1000 símbolos."""
+    for taps in (None, [0.1, 1.0, 0.2]):
+        ref = Modem(ebn0_db=ebn0_db, taps=taps, bloque=1000).correr(n)
+        for bloque in (1, 16, 64):
+            r = Modem(ebn0_db=ebn0_db, taps=taps, bloque=bloque).correr(n)
+            for k in ("simbolos", "errores_simbolo", "errores_bit", "ber"):
+                assert r[k] == ref[k], (taps, bloque, k)
+            assert np.array_equal(r["ojo"][2], ref["ojo"][2]), (taps, bloque)
+        print(f"  Modem taps={taps}: {ref['simbolos']} símbolos, BER={ref['ber']:.4f}, "
+              f"iguales con bloques 1/16/64/1000")
+
+
+if __name__ == "__main__":
+    verificar_ojo()
+    verificar_modem()
+    print("OK")
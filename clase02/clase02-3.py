@@ -1,6 +1,12 @@
+import sys
+from pathlib import Path
+
 import numpy as np
 import matplotlib.pyplot as plt
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))  # raíz del repo (paquete dsp)
+from dsp.cuantizacion import Cuantizador
+
 # ----------------------------
 # Parámetros
 # ----------------------------
@@ -30,11 +36,10 @@ x_s = A * np.sin(2*np.pi*f0*t_s)
 # ----------------------------
 # Cuantización uniforme (12 bits, rango -5 a +5)
 # ----------------------------
-levels = 2**bits
-delta  = (Vref_plus - Vref_minus) / levels   # paso
-# mapea cada muestra al nivel más cercano dentro del rango
-q_idx  = np.clip(np.floor((x_s - Vref_minus)/delta + 0.5), 0, levels-1)   # índice 0..4095
-x_q    = Vref_minus + q_idx * delta
+adc    = Cuantizador(bits, Vref_minus, Vref_plus, "adc")
+delta  = adc.delta                            # paso = (V+ - V-) / 2^bits
+# mapea cada muestra al nivel más cercano dentro del rango (códigos uint16)
+x_q, q_idx, _ = adc.cuantizar(x_s, codigos=True)   # índice 0..4095
 
 # (opcional) SNR de cuantización teórica
 sqnr_db = 6.02*bits + 1.76
@@ -1,6 +1,13 @@
+import sys
+from pathlib import Path
+
 import numpy as np
 from scipy.io import wavfile
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))  # raíz del repo (paquete dsp)
+from dsp.cuantizacion import Cuantizador, sqnr_ponderado
+from dsp.sintesis import renderizar
+
 try:
     import sounddevice as sd   # opcional para reproducir
     HAS_SD = True
@@ -14,24 +21,18 @@ fs = 44100        # frecuencia de muestreo
 dur_note = 0.5    # duración de cada nota (s)
 gap = 0.05        # silencio entre notas (s)
 A = 0.8           # amplitud
+BITS_WAV = 16     # 16 → PCM 16 bits (dither TPDF + conformado de 1er orden); None → float32
 
 # -----------------------------
 # Utilidades
 # -----------------------------
-def tone(f, dur, fs, A=1.0):
-    """Seno con pequeña envolvente para evitar clicks."""
-    t = np.arange(0, dur, 1/fs)
-    y = A * np.sin(2*np.pi*f*t)
-    # Envolvente (fade in/out ~10 ms o 10% si la nota es muy corta)
-    n = len(y)
-    nfade = max(1, int(min(0.01, dur*0.1) * fs))
-    fade = 0.5*(1 - np.cos(np.linspace(0, np.pi, nfade)))
-    y[:nfade] *= fade
-    y[-nfade:] *= fade[::-1]
-    return y
+def tone(f, dur, A=1.0):
+    """Evento de nota: seno con envolvente (fade ~10 ms o 10% si es muy corta)."""
+    return (f, dur, A)
 
-def silence(dur, fs):
-    return np.zeros(int(dur*fs), dtype=np.float32)
+def silence(dur):
+    """Evento de silencio."""
+    return (None, dur)
 
 # -----------------------------
 # Pentatónica menor de La
@@ -55,17 +56,25 @@ for name, f in zip(pattern_names, freqs):
 # -----------------------------
 # Construcción del audio
 # -----------------------------
-audio = []
+# Un solo buffer float32 con fase continua (sin concatenar notas)
+eventos = []
 for f in freqs:
-    audio.append(tone(f, dur_note, fs, A))
-    audio.append(silence(gap, fs))
+    eventos += [tone(f, dur_note, A), silence(gap)]
 
-audio = np.concatenate(audio).astype(np.float32)
+audio = renderizar(eventos, fs)
 
 # -----------------------------
 # Guardar y (opcional) reproducir
 # -----------------------------
-wavfile.write("la_pentatonica_menor.wav", fs, audio)
+if BITS_WAV == 16:
+    cz = Cuantizador(16, -1.0, 1.0, "adc")                 # código k ↔ muestra int16 k - 2^15
+    _, codigos, sqnr = cz.cuantizar(audio, codigos=True, dither="tpdf", conformado=1)
+    pcm = (codigos.astype(np.int32) - 2**15).astype(np.int16)
+    sqnr_a = sqnr_ponderado(audio, pcm / 2**15, fs)
+    print(f"PCM 16 bits: SQNR = {sqnr:.1f} dB | ponderado A = {sqnr_a:.1f} dB")
+    wavfile.write("la_pentatonica_menor.wav", fs, pcm)
+else:
+    wavfile.write("la_pentatonica_menor.wav", fs, audio)
 print("\nGuardado: la_pentatonica_menor.wav")
 
 if HAS_SD:
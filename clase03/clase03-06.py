@@ -1,9 +1,16 @@
+import sys
+from pathlib import Path
+
 import numpy as np
 import matplotlib.pyplot as plt
 from scipy.io.wavfile import write
-from scipy.signal import get_window
 import sounddevice as sd
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))  # raíz del repo (paquete dsp)
+from dsp.espectro import espectro, nfft_pot2
+from dsp.graficos import espectrograma
+from dsp.preproceso import recortar_y_normalizar, pico_parabolico as peak_interp_parabolic
+
 # =============================
 # Config: detectar FS real del dispositivo
 # =============================
@@ -23,26 +30,6 @@ DTYPE = "float32"  # sounddevice dtype
 # =============================
 # Utilidades
 # =============================
-def trim_silence(x, fs, thr_db=-40.0, pad_ms=20.0):
-    """Recorta inicio/fin con nivel < umbral relativo (thr_db)."""
-    x = np.asarray(x, dtype=np.float32)
-    thr = 10 ** (thr_db / 20.0) * (np.max(np.abs(x)) + 1e-12)
-    idx = np.where(np.abs(x) > thr)[0]
-    if idx.size == 0:
-        return x
-    pad = int((pad_ms / 1000.0) * fs)
-    s = max(0, idx[0] - pad)
-    e = min(len(x), idx[-1] + pad)
-    return x[s:e]
-
-def remove_dc_and_normalize(x, target_dbfs=-1.0):
-    """Quita DC y normaliza SIEMPRE a -1 dBFS para comparación justa."""
-    x = x.astype(np.float32)
-    x -= np.mean(x)
-    peak = np.max(np.abs(x)) + 1e-12
-    target = 10 ** (target_dbfs / 20.0)
-    return x * (target / peak)
-
 def record_take(prompt, fs=FS, dur=DUR, ch=CH, dtype=DTYPE):
     input(f"\n{prompt}\n   > Prepará la fuente y presioná ENTER para grabar {dur:.1f} s...")
     print("Grabando…")
@@ -54,45 +41,17 @@ def record_take(prompt, fs=FS, dur=DUR, ch=CH, dtype=DTYPE):
     if np.max(np.abs(x)) >= 0.999:
         print("⚠ Posible clipping (nivel muy alto). Bajá volumen o alejate un poco.")
 
-    x = trim_silence(x, fs)
-    x = remove_dc_and_normalize(x, target_dbfs=-1.0)
+    x = recortar_y_normalizar(x, fs, target_dbfs=-1.0, en_sitio=True)  # trim + DC + -1 dBFS, 2 pasadas
     return x
 
 def rfft_db(x, fs, nfft=None, window="hann"):
     """FFT con ventana Hann y normalización aprox; devuelve f, |X|, dB."""
     if nfft is None:
-        nfft = 1 << max(14, int(np.ceil(np.log2(len(x)))))
-    w = get_window(window, len(x), fftbins=True).astype(np.float32)
-    xw = x * w
-    if len(xw) < nfft:
-        xw = np.pad(xw, (0, nfft - len(xw)))
-    X = np.fft.rfft(xw, n=nfft)
-    f = np.fft.rfftfreq(nfft, d=1 / fs)
-    mag = np.abs(X) / (np.sum(w) / 2 + 1e-12)
+        nfft = nfft_pot2(len(x), 14)
+    f, mag = espectro(x, fs, nfft=nfft, ventana=window)   # |X| / (Σw/2)
     mag_db = 20 * np.log10(mag + 1e-12)
     return f, mag, mag_db
 
-def peak_interp_parabolic(f, mag, fmin=None, fmax=None):
-    """Pico con búsqueda opcional en banda y ajuste parabólico sub-bin."""
-    if fmin is not None or fmax is not None:
-        mask = np.ones_like(f, dtype=bool)
-        if fmin is not None: mask &= (f >= fmin)
-        if fmax is not None: mask &= (f <= fmax)
-        idx = np.where(mask)[0]
-        if idx.size == 0:  # sin banda válida
-            k = np.argmax(mag)
-        else:
-            k_local = np.argmax(mag[idx])
-            k = idx[k_local]
-    else:
-        k = np.argmax(mag)
-
-    if 1 <= k < len(mag) - 1:
-        a, b, c = mag[k - 1], mag[k], mag[k + 1]
-        p = 0.5 * (a - c) / (a - 2 * b + c + 1e-12)
-        return f[k] + p * (f[1] - f[0])
-    return f[k]
-
 def annotate_harmonics(ax, f0, upto_hz=2000, color="tab:green"):
     h = 1
     while h * f0 <= upto_hz:
@@ -127,7 +86,7 @@ def plot_take_all(x, fs, title, save_prefix=None):
     annotate_harmonics(axes[1], f_est, upto_hz=2000, color="tab:green")
 
     # Espectrograma
-    Pxx, freqs, bins, im = axes[2].specgram(x, NFFT=2048, Fs=fs, noverlap=1024, cmap="jet")
+    Pxx, freqs, bins, im = espectrograma(axes[2], x, fs, nfft=2048, noverlap=1024, cmap="jet")
     axes[2].set_ylim(0, 2000)
     axes[2].set_title("Espectrograma")
     axes[2].set_xlabel("Tiempo [s]")
@@ -5,40 +5,36 @@ try:
 except Exception:
     pass  # si falla, igual guardaremos imágenes
 
+import sys
+from pathlib import Path
+
 import numpy as np
 import matplotlib.pyplot as plt
-from scipy.io import wavfile
 import sounddevice as sd
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))  # raíz del repo (paquete dsp)
+from dsp.wav import WavPCM
+from dsp.espectro import espectro, nfft_pot2
+from dsp.graficos import espectrograma
+
 WAV_FILE = "audio.wav"   # tu archivo
 
 # ---- utils ----
-def to_float(audio):
-    if np.issubdtype(audio.dtype, np.integer):
-        return audio.astype(np.float32) / np.iinfo(audio.dtype).max
-    return audio.astype(np.float32)
-
 def to_mono(x):
     return x.mean(axis=1) if x.ndim == 2 else x
 
 def rfft_db(y, sr):
-    n = len(y)
-    nfft = 1 << max(12, int(np.ceil(np.log2(n))))
-    win = np.hanning(n)
-    yw = y * win
-    if n < nfft:
-        yw = np.pad(yw, (0, nfft - n))
-    Y = np.fft.rfft(yw, n=nfft)
-    f = np.fft.rfftfreq(nfft, 1/sr)
-    mag_db = 20*np.log10(np.abs(Y)/(np.sum(win)/2) + 1e-12)
-    return f, mag_db
+    nfft = nfft_pot2(len(y), 12)
+    # Hann simétrica (= np.hanning), |Y| / (Σw/2) en dB
+    return espectro(y, sr, nfft=nfft, simetrica=True, db=True)
 
 # ---- carga y repro ----
-sr, data = wavfile.read(WAV_FILE)
-audio_f = to_float(data)       # conserva estéreo si existe
+wav = WavPCM(WAV_FILE)         # sólo encabezado + memmap, sin leer muestras
+sr = wav.fs
+audio_f = wav[:]               # una única conversión a float32, conserva estéreo
 mono = to_mono(audio_f)        # mono para análisis
 
-print(f"SR: {sr} Hz | canales: {1 if data.ndim==1 else data.shape[1]} | duración: {len(data)/sr:.2f} s")
+print(f"SR: {sr} Hz | canales: {wav.canales} | duración: {wav.duracion:.2f} s")
 print("Reproduciendo…")
 sd.play(audio_f, sr); sd.wait()
 
@@ -66,7 +62,7 @@ plt.show(block=True)
 
 # ---- GRAFICO 3: espectrograma ----
 fig3 = plt.figure(figsize=(10,4))
-Pxx, freqs, bins, im = plt.specgram(mono, NFFT=2048, Fs=sr, noverlap=1024, cmap="jet")
+Pxx, freqs, bins, im = espectrograma(plt.gca(), mono, sr, nfft=2048, noverlap=1024, cmap="jet")
 plt.ylim(0, 8000)
 plt.title("Espectrograma")
 plt.xlabel("Tiempo [s]"); plt.ylabel("Frecuencia [Hz]")
@@ -1,35 +1,43 @@
-import numpy as np
+import sys
+from pathlib import Path
+
 import matplotlib.pyplot as plt
-from scipy import signal
 from IPython.display import Audio, display
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))  # raíz del repo (paquete dsp)
+from dsp.cuantizacion import Cuantizador
+from dsp.formas_onda import eje_tiempo, generar, mezcla, n_zoom
+
 # ===== Parámetros base =====
 fs  = 44_100     # frecuencia de muestreo [Hz]
 dur = 3.0        # duración [s]
-t   = np.arange(int(fs*dur)) / fs
+n   = int(fs*dur)  # muestras (sin vector de tiempo completo)
 
 A       = 0.8    # amplitud común (igual para ambas)
 f_sq    = 400    # cuadrada (audible)
 f_tri   = 800    # triangular (audible y distinta)
-t_short = t[t <= 0.01]  # ventana de 10 ms para ver detalles
+BLEP    = False  # True → variantes de banda limitada (PolyBLEP), sin aliasing
+n_short = n_zoom(0.01, fs)           # ventana de 10 ms para ver detalles (por índice)
+t_short = eje_tiempo(n_short, fs)
 
 # ===== Señales =====
-square   = A * signal.square(2*np.pi*f_sq*t)
-triangle = A * signal.sawtooth(2*np.pi*f_tri*t, width=0.5)  # width=0.5 -> triangular pura
-mix      = square + triangle
+# Buffers float32 escritos por bloques (fase acumulada, sin t float64)
+square   = generar("cuadrada", f_sq, fs, n, A, blep=BLEP)
+triangle = generar("triangular", f_tri, fs, n, A, blep=BLEP)     # = sawtooth con width=0.5
 
-# Normalizamos la mezcla para evitar clip al escuchar
-mix = 0.9 * mix / np.max(np.abs(mix))
+# Mezcla normalizada a pico 0.9 para evitar clip al escuchar
+# (el pico sale de un período de la mezcla, sin otra pasada completa)
+mix = mezcla([("cuadrada", f_sq, A), ("triangular", f_tri, A)], fs, n, normalizar=0.9, blep=BLEP)
 
 # ===== Gráficos (una figura por señal) =====
 plt.figure(); plt.title("Onda cuadrada (400 Hz)")
-plt.plot(t_short, square[:len(t_short)]); plt.xlabel("Tiempo [s]"); plt.ylabel("Amplitud"); plt.show()
+plt.plot(t_short, square[:n_short]); plt.xlabel("Tiempo [s]"); plt.ylabel("Amplitud"); plt.show()
 
 plt.figure(); plt.title("Onda triangular (800 Hz)")
-plt.plot(t_short, triangle[:len(t_short)]); plt.xlabel("Tiempo [s]"); plt.ylabel("Amplitud"); plt.show()
+plt.plot(t_short, triangle[:n_short]); plt.xlabel("Tiempo [s]"); plt.ylabel("Amplitud"); plt.show()
 
 plt.figure(); plt.title("Mezcla: cuadrada + triangular")
-plt.plot(t_short, mix[:len(t_short)]); plt.xlabel("Tiempo [s]"); plt.ylabel("Amplitud"); plt.show()
+plt.plot(t_short, mix[:n_short]); plt.xlabel("Tiempo [s]"); plt.ylabel("Amplitud"); plt.show()
 
 print("► Audio: cuadrada");   display(Audio(square,   rate=fs))
 print("► Audio: triangular"); display(Audio(triangle, rate=fs))
@@ -42,24 +50,11 @@ def uniform_quantize(x, bits, vref_plus, vref_minus, mid_tread=True):
       - bits: cantidad de bits (niveles = 2**bits)
       - vref_plus/vref_minus: rango de cuantización [VRef-, VRef+)
       - mid_tread=True: niveles centrados en 0 (centro de celda)
-    Devuelve: (señal cuantizada, códigos, Δ, SQNR_dB)
+    Devuelve: (señal cuantizada, códigos, Δ, SQNR_dB) — motor de dsp.cuantizacion
     """
-    assert vref_plus > vref_minus, "VRef+ debe ser mayor que VRef-"
-    L = 2**bits
-    vmin, vmax = vref_minus, vref_plus
-    delta = (vmax - vmin) / L
-
-    # recorte al rango
-    x_clip = np.clip(x, vmin, vmax - 1e-12)
-    indices = np.floor((x_clip - vmin) / delta).astype(int)
-    q = vmin + (indices + 0.5) * delta  # centro de celda
-
-    # métrica SQNR
-    noise = x - q
-    sig_pow = np.mean(x**2)
-    noise_pow = np.mean(noise**2)
-    sqnr_db = np.inf if noise_pow == 0 else 10*np.log10(sig_pow / noise_pow)
-    return q, indices, delta, sqnr_db
+    cz = Cuantizador(bits, vref_minus, vref_plus, "mid-rise")   # códigos uint8/uint16
+    q, indices, sqnr_db = cz.cuantizar(x, codigos=True)           # una pasada por bloques
+    return q, indices, cz.delta, sqnr_db
 
 # ===== Demo de cuantización =====
 bits = 8
@@ -69,8 +64,8 @@ q_mix, codes, delta, sqnr_db = uniform_quantize(mix, bits, Vref_plus, Vref_minus
 print(f"Bits={bits} | Niveles={2**bits} | Δ={delta:.6f} | SQNR≈{sqnr_db:.2f} dB")
 
 plt.figure(); plt.title("Original vs Cuantizada (10 ms)")
-plt.plot(t_short, mix[:len(t_short)], label="Original")
-plt.plot(t_short, q_mix[:len(t_short)], "--", label="Cuantizada")
+plt.plot(t_short, mix[:n_short], label="Original")
+plt.plot(t_short, q_mix[:n_short], "--", label="Cuantizada")
 plt.xlabel("Tiempo [s]"); plt.ylabel("Amplitud"); plt.legend(); plt.show()
 
 print("► Audio: mezcla cuantizada")
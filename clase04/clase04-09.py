@@ -7,40 +7,40 @@ Original file is located at
     https://colab.research.google.com/drive/1uKHMfzNIGIV_UjYrylEbPwZ8Ql9IhfCK
 """
 
+import sys
+from pathlib import Path
+
 import numpy as np
 import matplotlib.pyplot as plt
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))  # raíz del repo (paquete dsp)
+from dsp.filtros import ema, banco_ema
+from dsp.espectro import espectro
+from dsp.stream import ventanas_mas_fuertes
+
 TIME_ZOOM = 0.06    # 60 ms
 FMAX_PLOT = 8000    # 0–8 kHz
 
 def ema_filter(x, alpha: float):
-    """y[n] = α x[n] + (1-α) y[n-1]"""
-    y = np.empty_like(x)
-    y[0] = alpha * x[0]
-    a1 = 1.0 - alpha
-    for n in range(1, len(x)):
-        y[n] = alpha * x[n] + a1 * y[n-1]
-    return y
+    """y[n] = α x[n] + (1-α) y[n-1], con y[-1] = 0 (motor vectorizado de dsp)."""
+    return ema(x, alpha, inicio="cero")
 
 def espectro_db(sig, fs):
     """FFT en dB con ventana de Hann (magnitud)"""
-    N = len(sig)
-    w = np.hanning(N)
     # normalización suave usando suma de la ventana
-    X = np.fft.rfft(sig * w) / (np.sum(w)/2)
-    f = np.fft.rfftfreq(N, d=1/fs)
-    mag = 20*np.log10(np.abs(X) + 1e-12)
-    return f, mag
+    return espectro(sig, fs, simetrica=True, norm="ventana", db=True)
 
 def find_loudest_window(x, fs, win_s=0.06):
-    """Índices [i0,i1) de la ventana de 'win_s' con mayor energía."""
-    N = len(x)
+    """Índices [i0,i1) de la ventana de 'win_s' con mayor energía (suma acumulada, O(N))."""
+    W = max(8, int(win_s * fs))
+    i0, i1, _ = ventanas_mas_fuertes(x, W)[0]
+    return i0, i1
+
+def find_loudest_windows(x, fs, win_s=0.06, k=3):
+    """Las k ventanas de 'win_s' más enérgicas sin solape (la más fuerte, se
+    descartan sus vecinas a menos de una ventana, y así k veces): [(i0, i1), ...]."""
     W = max(8, int(win_s * fs))
-    if W >= N:
-        return 0, N
-    p = np.convolve(x.astype(np.float32)**2, np.ones(W, dtype=np.float32), mode='valid')
-    i0 = int(np.argmax(p))
-    return i0, i0 + W
+    return [(i0, i1) for i0, i1, _ in ventanas_mas_fuertes(x, W, k)]
 
 def plot_tiempo_zoom(x, y, fs, alpha, win_s=TIME_ZOOM):
     """Tiempo (zoom) usando la ventana más enérgica para que no quede “plano”."""
@@ -139,8 +139,8 @@ dur = len(x)/fs
 rms = float(np.sqrt(np.mean(x**2)))
 print(f"fs = {fs} Hz | duración = {dur:.2f} s | RMS = {rms:.3e}")
 
-# filtrar y graficar
-for a in ALPHAS:
-    y = ema_filter(x, a)
+# filtrar (todos los α en un banco, una fila por α) y graficar
+Y = banco_ema(x, ALPHAS, inicio="cero")
+for a, y in zip(ALPHAS, Y):
     plot_tiempo_zoom(x, y, fs, a)     # tiempo (ventana más enérgica)
     plot_espectro(x, y, fs, a)        # espectro 0–8 kHz
\ No newline at end of file
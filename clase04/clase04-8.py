@@ -1,7 +1,13 @@
+import sys
+from pathlib import Path
+
 import numpy as np
 import matplotlib.pyplot as plt
-from scipy.signal import resample
-from numpy.fft import rfft, rfftfreq
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))  # raíz del repo (paquete dsp)
+from dsp.espectro import espectro
+from dsp.remuestreo import remuestrear as remuestrear_poli
+from dsp.aliasing import barrido_aliasing, tabla
 
 # ==================================================
 # Parámetros base
@@ -25,26 +31,29 @@ fs_alto   = 8000                      # Sobre-Nyquist: fs > 2*f_max
 # ==================================================
 # Funciones auxiliares
 # ==================================================
-def remuestrear(x_high, fs_high, fs_target, dur):
-    """Remuestrea x_high (a fs_high) a un nuevo fs_target usando scipy.signal.resample"""
+def remuestrear(x_high, fs_high, fs_target, dur, antialias=True):
+    """
+    Remuestrea x_high (a fs_high) a fs_target con el remuestreador polifásico
+    de dsp (L/M = fs_target/fs_high). antialias=False no filtra antes de bajar
+    fs: el aliasing queda a la vista, como al muestrear la señal original.
+    """
     n_new = int(round(dur * fs_target))
-    x_new = resample(x_high, n_new)
-    t_new = np.arange(n_new) / fs_target
+    x_new = remuestrear_poli(x_high, fs_high, fs_target, antialias=antialias)[:n_new]
+    t_new = np.arange(len(x_new)) / fs_target
     return t_new, x_new
 
 def espectro_db(x, fs):
     """Magnitud en dB del espectro unilateral"""
-    X = rfft(x) / len(x)
-    f = rfftfreq(len(x), 1/fs)
-    mag = 20*np.log10(np.abs(X) + 1e-12)  # evitar log(0)
-    return f, mag
+    return espectro(x, fs, ventana=None, norm="n", db=True)  # |X|/N, +1e-12 evita log(0)
+
+# Espectro de referencia: no depende del caso, se calcula una sola vez
+f_ref, mag_ref = espectro_db(x_ref, fs_ref)
 
-def dibujar_caso(nombre, fs_target, color_tiempo=None):
+def dibujar_caso(nombre, fs_target, color_tiempo=None, antialias=True):
     # --- Remuestreo ---
-    t, x = remuestrear(x_ref, fs_ref, fs_target, dur)
+    t, x = remuestrear(x_ref, fs_ref, fs_target, dur, antialias)
 
-    # --- Espectros ---
-    f_ref, mag_ref = espectro_db(x_ref, fs_ref)
+    # --- Espectro (la referencia ya está en f_ref, mag_ref) ---
     f_new, mag_new = espectro_db(x, fs_target)
 
     # ================================
@@ -79,8 +88,14 @@ def dibujar_caso(nombre, fs_target, color_tiempo=None):
 # ==================================================
 # Dibujar los 3 casos (3 ventanas *dobles*: tiempo + espectro)
 # ==================================================
-dibujar_caso("Sub-Nyquist (2000 Hz)", fs_bajo)
+dibujar_caso("Sub-Nyquist (2000 Hz)", fs_bajo, antialias=False)   # 1500 Hz → alias en 500 Hz
 dibujar_caso("Límite Nyquist (3000 Hz)", fs_limite)
 dibujar_caso("Muestreo alto (8000 Hz)", fs_alto)
 
+# ==================================================
+# Barrido: alias predicho vs observado para muchas fs (tabla)
+# ==================================================
+filas = barrido_aliasing(x_ref, fs_ref, range(1000, 8001, 250), tonos=(f1, f2, f3))
+print(tabla(filas))
+
 plt.show()
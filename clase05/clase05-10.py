@@ -1,6 +1,12 @@
+import sys
+from pathlib import Path
+
 import numpy as np
 import matplotlib.pyplot as plt
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))  # raíz del repo (paquete dsp)
+from dsp.cuantizacion import barrido_bits, cuantificar
+
 # ---------------- Parámetros de la señal ----------------
 fs  = 44100            # Hz
 dur = 2.0              # s
@@ -10,23 +16,10 @@ t = np.arange(0, dur, 1/fs)
 x = A*np.sin(2*np.pi*f0*t)
 
 # ---------------- Cuantificador uniforme (mid-tread) ----------------
-def cuantificar(x, Nbits, xmax=1.0):
-    """
-    Cuantificador uniforme simétrico (mid-tread: incluye 0)
-    Rango: [-xmax, xmax]
-    Paso:  Δ = 2*xmax / (2^N - 1)
-    """
-    L = 2**Nbits
-    Delta = 2*xmax/(L - 1)
-    x_clip = np.clip(x, -xmax, xmax)
-    xq = np.round(x_clip/Delta)*Delta
-    return xq, Delta
+# cuantificar(x, Nbits, xmax) → (xq, Δ), Δ = 2*xmax/(2^N - 1): dsp.cuantizacion
 
 # ---------------- SNR (tiempo) ----------------
-def snr_db(x, e):
-    Ps = np.mean(x**2)
-    Pe = np.mean(e**2)
-    return 10*np.log10(Ps/(Pe + 1e-20))
+# barrido_bits: 10·log10(P_señal / P_error) por profundidad, en dsp.cuantizacion
 
 # ---------------- Config de gráficos ----------------
 zoom_ini = 0.0
@@ -52,19 +45,24 @@ def plot_error(e, t, Nbits):
     plt.ylabel('Error')
     plt.grid(True, alpha=0.3)
 
+# ---------------- Barrido 1–24 bits (una pasada, sin arrays de error) ----------------
+r = barrido_bits(x, range(1, 25), -A, A, "mid-tread")
+print(' N |   Δ        | SNR teo [dB] | SNR real [dB] | error máx')
+for N, D, st, sr, em in zip(r['bits'], r['delta'], r['snr_teorico'], r['snr_real'], r['error_max']):
+    print(f'{N:2d} | {D:.3e}  | {st:12.2f} | {sr:13.2f} | {em:.3e}')
+
 # ---------------- Experimento ----------------
+nz = int(np.ceil(zoom_fin*fs)) + 1          # sólo lo que se grafica
 for Nbits in [8, 4, 2]:
-    xq, Delta = cuantificar(x, Nbits, xmax=A)
-    e = xq - x
-
-    snr_teo  = 6.02*Nbits + 1.76
-    snr_real = snr_db(x, e)
+    xq, Delta = cuantificar(x[:nz], Nbits, xmax=A)
+    e = xq - x[:nz]
 
+    i = int(np.flatnonzero(r['bits'] == Nbits)[0])   # fila del barrido con esos bits
     print(f'Nbits = {Nbits}')
-    print(f'  SNR teórico: {snr_teo:5.2f} dB')
-    print(f'  SNR real:    {snr_real:5.2f} dB')
+    print(f'  SNR teórico: {r["snr_teorico"][i]:5.2f} dB')
+    print(f'  SNR real:    {r["snr_real"][i]:5.2f} dB')
 
-    plot_tiempo(x, xq, t, Nbits)
-    plot_error(e, t, Nbits)
+    plot_tiempo(x[:nz], xq, t[:nz], Nbits)
+    plot_error(e, t[:nz], Nbits)
 
 plt.show()
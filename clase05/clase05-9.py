@@ -1,20 +1,23 @@
+import sys
+from pathlib import Path
+
 import numpy as np
 import matplotlib.pyplot as plt
 plt.style.use('seaborn-darkgrid')
-from scipy.fft import fft
-from scipy.io import wavfile
 import librosa
 from IPython.display import Audio, display
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))  # raíz del repo (paquete dsp)
+from dsp.wav import WavPCM
+from dsp.espectro import espectro
+from dsp.graficos import espectrograma
+
 # ------------------- FFT + Plots -------------------
 def fourier_calculation(y, sample_rate=44100):
     """FFT unilateral con magnitud lineal."""
     N = len(y)
-    w = np.hanning(N)
-    Y = fft(y * w)
-    Y = 2.0 / N * np.abs(Y[:N // 2])
-    f = np.linspace(0.0, sample_rate/2, N // 2, endpoint=False)
-    return Y, f
+    f, Y = espectro(y, sample_rate, simetrica=True, norm="2n")  # 2/N·|Y|
+    return Y[:N // 2], f[:N // 2]
 
 def plot_tiempo_frecuencia_espectrograma(
         y, sample_rate=44100, tiempo_max=-1,
@@ -52,8 +55,8 @@ def plot_tiempo_frecuencia_espectrograma(
 
     # Espectrograma
     ax3 = plt.subplot(3, 1, 3)
-    Pxx, freqs, bins, im = ax3.specgram(
-        y_plot, NFFT=1024, Fs=sample_rate, noverlap=512, cmap='jet')
+    Pxx, freqs, bins, im = espectrograma(
+        ax3, y_plot, sample_rate, nfft=1024, noverlap=512, cmap='jet')
     ax3.set_ylim(0, f_max_espectrograma)
     ax3.set_title(f"{titulo} - Espectrograma")
     ax3.set_xlabel("Tiempo [s]")
@@ -77,34 +80,15 @@ def describe_audio(y, sr, source_name=""):
     print(f"[{source_name}] Duración: {dur:.3f} s")
     return ch, dur
 
-def infer_wav_bit_depth_from_dtype(data):
-    """Estima bits por muestra del WAV PCM por su dtype."""
-    dt = data.dtype
-    if np.issubdtype(dt, np.integer):
-        bits = np.iinfo(dt).bits
-        if bits == 32:
-            maxabs = np.max(np.abs(data))
-            full24 = 2**23 - 1
-            return 24 if maxabs <= full24 else 32
-        return bits
-    elif np.issubdtype(dt, np.floating):
-        return "float (no aplica bit ADC)"
-    else:
-        return "desconocido"
-
 def load_wav(path):
-    """Devuelve y(float en [-1,1]), sr, bits."""
-    sr, data = wavfile.read(path)  # (N,) o (N,C)
-    if data.dtype == np.int16:
-        y = data.astype(np.float32) / 32768.0
-    elif data.dtype == np.int32:
-        y = data.astype(np.float32) / 2147483648.0
-    elif data.dtype == np.uint8:
-        y = (data.astype(np.float32) - 128.0) / 128.0
-    else:  # float32/64
-        y = data.astype(np.float32)
-    bits = infer_wav_bit_depth_from_dtype(data)
-    return y, sr, bits
+    """
+    Devuelve y(float en [-1,1]), sr, bits.
+    Los bits salen del encabezado WAV (no se recorren las muestras) y el
+    audio se lee mapeado en memoria con una única conversión a float32.
+    """
+    wav = WavPCM(path)             # (N,) o (N,C) al indexar
+    bits = "float (no aplica bit ADC)" if wav.es_float else wav.bits
+    return wav[:], wav.fs, bits
 
 def load_mp3(path, target_sr=None):
     """Carga MP3 con librosa (decodifica a PCM float)."""
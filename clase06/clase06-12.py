@@ -5,9 +5,16 @@
 #   - Lámina B (3x2) exactamente como tu maqueta
 # ============================================================
 
+import sys
+from pathlib import Path
+
 import numpy as np
 import matplotlib.pyplot as plt
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))  # raíz del repo (paquete dsp)
+from dsp.espectro import espectro
+from dsp.hilbert import analitica
+
 # ---------------- Parámetros ----------------
 fs  = 100_000              # muestreo 100 kHz
 dur = 0.025                # 25 ms (coincide con tus tiempos)
@@ -26,24 +33,16 @@ y_sc = m * c                         # DSB-SC (mensaje·portadora en tiempo)
 
 # -------------- Utilidades -----------------
 def analytic_signal_fft(x):
-    """Señal analítica por método espectral (equiv. a Hilbert)."""
-    N = len(x)
-    X = np.fft.rfft(x)
-    H = np.ones_like(X, dtype=complex)
-    H[1:-1] *= 2.0                   # duplica positivas (salvo DC/Nyquist)
-    Xa = X * H
-    xa = np.fft.irfft(Xa, n=N)
-    return xa                        # x + j x_hat
+    """Señal analítica x + j·x̂ (compleja) por método espectral — dsp.hilbert:
+    máscara cacheada por largo, igual a scipy.signal.hilbert."""
+    return analitica(x)
 
 def fft_mag_norm(x, fs, fmax=8000):
-    """Magnitud normalizada de la rFFT, con ventana Hann y recorte a fmax."""
-    N = len(x)
-    X = np.fft.rfft(x * np.hanning(N))
-    f = np.fft.rfftfreq(N, 1/fs)
-    mag = np.abs(X)
-    mag = mag / (mag.max() + 1e-12)
+    """Magnitud normalizada de la rFFT, con ventana Hann y recorte a fmax.
+    x puede ser una señal (L,) o una pila (N, L): una sola rFFT por lotes."""
+    f, mag = espectro(x, fs, simetrica=True, norm="max")
     sel = f <= fmax
-    return f[sel], mag[sel]
+    return f[sel], mag[..., sel]
 
 # -------------- Modulación SSB -------------
 # SSB-SC banda superior (USB) vía señal analítica
@@ -52,11 +51,11 @@ y_ssb_sc_upper = np.real(ma * np.exp(1j*2*np.pi*fc*t))   # USB (sin portadora)
 y_ssb_fc       = y_ssb_sc_upper + c                      # USB + portadora (con portadora)
 
 # -------------- FFTs necesarias ------------
-f_y,   M_y   = fft_mag_norm(y,   fs, 8000)               # FFT de y(t) (DSB-FC)
-f_sc,  M_sc  = fft_mag_norm(y_sc, fs, 8000)              # FFT de m(t)·c(t) (DSB-SC)
-f_dsb, M_dsb = fft_mag_norm(y_sc, fs, 8000)              # para la lámina 3x2
-f_ssbfc, M_ssbfc = fft_mag_norm(y_ssb_fc, fs, 8000)
-f_ssbsc, M_ssbsc = fft_mag_norm(y_ssb_sc_upper, fs, 8000)
+# las 4 señales en una sola rFFT por lotes (misma longitud y mismo fs)
+f_y, M_all = fft_mag_norm(np.stack([y, y_sc, y_ssb_fc, y_ssb_sc_upper]), fs, 8000)
+M_y, M_sc, M_ssbfc, M_ssbsc = M_all        # DSB-FC, DSB-SC, SSB-FC, SSB-SC
+f_sc = f_dsb = f_ssbfc = f_ssbsc = f_y
+M_dsb = M_sc                                             # para la lámina 3x2
 
 # ============================================================
 # LÁMINA A — 6 paneles (vertical)
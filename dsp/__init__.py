@@ -0,0 +1,6 @@
+"""
+dsp — utilidades compartidas entre las clases (filtros, espectros, audio).
+
+Los scripts de cada clase importan desde acá; ejecutarlos desde la raíz del
+repo (o agregar la raíz al PYTHONPATH).
+"""
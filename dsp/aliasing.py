@@ -0,0 +1,164 @@
+"""
+Barrido de aliasing sobre muchas frecuencias de muestreo (clase04-8).
+
+`dibujar_caso` estudia tres fs fijas y en cada llamada vuelve a calcular
+el espectro de referencia, que nunca cambia. Acá:
+  - los tonos salen UNA vez del espectro de referencia (o se dan),
+  - la predicción es analítica: un tono f muestreado a fs aparece en
+    |f - fs·round(f/fs)| (plegado en [0, fs/2]), vectorizada tonos × fs,
+  - la observación remuestrea sin antialias (dsp.remuestreo, como
+    muestrear la señal original) y busca los picos del espectro Hann con
+    ajuste parabólico; cada fs es una tarea de un pool de hilos (o de
+    procesos con procesos=True),
+  - analitico=True no remuestrea nada: sólo la predicción.
+El resultado es una tabla (una fila por fs y tono): predicho, observado,
+error y si el tono supera fs/2.
+
+Uso:
+    python -m dsp.aliasing 1000:8000:100 [--tonos 300,800,1500] [--analitico] [-o tabla.csv]
+"""
+import argparse
+import csv
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+
+import numpy as np
+from scipy.signal import find_peaks
+
+from dsp.espectro import espectro, nfft_pot2
+from dsp.pitch import parabola
+from dsp.remuestreo import remuestrear
+
+COLUMNAS = ["fs", "tono", "alias_pred", "alias_obs", "error_hz", "aliasado"]
+
+
+def frecuencia_alias(f, fs):
+    """Frecuencia aparente de f muestreada a fs, en [0, fs/2] (f y fs se difunden)."""
+    f, fs = np.asarray(f, dtype=np.float64), np.asarray(fs, dtype=np.float64)
+    return np.abs(f - fs * np.round(f / fs))
+
+
+def picos(x, fs, umbral_db=-40.0, relleno=2):
+    """
+    Frecuencias (sub-bin, parábola sobre dB) de los picos a menos de
+    |umbral_db| del máximo, separados al menos un lóbulo principal de Hann
+    (4 bins): los lóbulos laterales (-31 dB) no cuentan como tonos.
+    """
+    nfft = nfft_pot2(len(x)) * relleno
+    f, M = espectro(x, fs, nfft=nfft, db=True)
+    k, _ = find_peaks(M, height=M.max() + umbral_db, distance=max(1, 4 * nfft // len(x)))
+    k = k[(k > 0) & (k < len(M) - 1)]
+    if not k.size:
+        return np.zeros(0)
+    return (k + parabola(M[None, :].repeat(k.size, 0), k)) * (f[1] - f[0])
+
+
+def _observar(fs, x_ref, fs_ref, tonos, umbral_db):
+    """
+    Alias observado de cada tono a `fs`: el pico más cercano al predicho,
+    o NaN si no hay ninguno a menos de 3 bins (p. ej. un tono justo en
+    fs/2 muestreado en sus cruces por cero, o dos alias que se cancelan).
+    """
+    y = remuestrear(x_ref, fs_ref, fs, antialias=False)
+    obs = picos(y, fs, umbral_db)
+    pred = frecuencia_alias(tonos, fs)
+    if not obs.size:
+        return np.full(len(tonos), np.nan)
+    d = np.abs(obs[None, :] - pred[:, None])
+    j = np.argmin(d, axis=1)
+    cerca = d[np.arange(len(pred)), j] <= 3 * fs / len(y)
+    return np.where(cerca, obs[j], np.nan)
+
+
+def _iniciar_proceso():
+    from dsp import cache
+    cache.WORKERS = 1
+
+
+def barrido_aliasing(x_ref, fs_ref, fs_lista, tonos=None, analitico=False, hilos=None,
+                     procesos=False, umbral_db=-40.0, lote=8, tolerancia_hz=None):
+    """
+    Aliasing de x_ref (muestreada a fs_ref) para cada fs de `fs_lista`.
+      - tonos:     frecuencias de la señal; None → picos del espectro de referencia.
+      - analitico: True → sólo la predicción (alias_obs = NaN), sin remuestrear.
+      - hilos:     tamaño del pool (por defecto, núcleos); procesos=True usa
+                   procesos en lugar de hilos (lotes de `lote` fs por tarea).
+      - tolerancia_hz: `aliasado` es tono > fs/2 + tolerancia. None → 0 con
+                   tonos nominales y medio bin del espectro de `picos` con
+                   tonos estimados (1500.0004 Hz a fs = 3000 no es alias).
+    Devuelve una lista de filas (dict con COLUMNAS), ordenada por fs y tono.
+    """
+    fs_v = np.asarray(list(fs_lista), dtype=np.float64)
+    if tonos is None:
+        tonos = picos(x_ref, fs_ref, umbral_db)
+        if tolerancia_hz is None:                                  # medio bin de `picos`
+            tolerancia_hz = fs_ref / (4 * nfft_pot2(len(x_ref)))
+    tonos = np.asarray(tonos, dtype=np.float64)
+    tol = tolerancia_hz or 0.0
+    pred = frecuencia_alias(tonos[None, :], fs_v[:, None])          # (n_fs, n_tonos)
+    if analitico:
+        obs = np.full(pred.shape, np.nan)
+    else:
+        tarea = partial(_observar, x_ref=np.asarray(x_ref), fs_ref=fs_ref, tonos=tonos,
+                        umbral_db=umbral_db)
+        if procesos:
+            with ProcessPoolExecutor(max_workers=hilos, initializer=_iniciar_proceso) as ex:
+                obs = np.array(list(ex.map(tarea, fs_v, chunksize=lote)))
+        else:
+            with ThreadPoolExecutor(max_workers=hilos or os.cpu_count()) as ex:
+                obs = np.array(list(ex.map(tarea, fs_v)))
+        obs = obs.reshape(pred.shape)
+    filas = []
+    for i, fs in enumerate(fs_v):
+        for j, f in enumerate(tonos):
+            filas.append({"fs": float(fs), "tono": float(f), "alias_pred": float(pred[i, j]),
+                          "alias_obs": float(obs[i, j]), "error_hz": float(obs[i, j] - pred[i, j]),
+                          "aliasado": bool(f > fs / 2 + tol)})
+    return filas
+
+
+def tabla(filas):
+    """Texto con una fila por (fs, tono)."""
+    lineas = ["     fs [Hz] |   tono [Hz] | predicho [Hz] | observado [Hz] | error [Hz] | alias"]
+    for r in filas:
+        lineas.append(f"{r['fs']:12.1f} | {r['tono']:11.2f} | {r['alias_pred']:13.2f} | "
+                      f"{r['alias_obs']:14.2f} | {r['error_hz']:10.3f} | {'sí' if r['aliasado'] else 'no'}")
+    return "\n".join(lineas)
+
+
+def guardar_csv(filas, ruta):
+    with open(ruta, "w", newline="", encoding="utf-8") as fh:
+        w = csv.DictWriter(fh, fieldnames=COLUMNAS)
+        w.writeheader()
+        w.writerows(filas)
+
+
+def _rango(texto):
+    """"a:b:paso" (b incluido) o "a,b,c" → lista de fs."""
+    if ":" in texto:
+        a, b, p = (float(v) for v in texto.split(":"))
+        return list(np.arange(a, b + p / 2, p))
+    return [float(v) for v in texto.split(",")]
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description="Barrido de aliasing sobre muchas fs.")
+    ap.add_argument("fs", help="fs a evaluar: 'inicio:fin:paso' o lista 'a,b,c'")
+    ap.add_argument("--tonos", default="300,800,1500", help="tonos de la señal [Hz]")
+    ap.add_argument("--fs-ref", type=int, default=44100, help="fs de la señal de referencia")
+    ap.add_argument("--dur", type=float, default=1.0, help="duración [s]")
+    ap.add_argument("--analitico", action="store_true", help="sólo la predicción (sin remuestrear)")
+    ap.add_argument("-j", "--hilos", type=int, default=None, help="tamaño del pool")
+    ap.add_argument("--procesos", action="store_true", help="pool de procesos en vez de hilos")
+    ap.add_argument("-o", "--salida", default=None, help="CSV de salida (si no, tabla en pantalla)")
+    a = ap.parse_args()
+    tonos = [float(v) for v in a.tonos.split(",")]
+    t = np.arange(int(a.dur * a.fs_ref)) / a.fs_ref
+    x = sum(np.sin(2 * np.pi * f * t) for f in tonos)
+    filas = barrido_aliasing(x, a.fs_ref, _rango(a.fs), tonos, a.analitico, a.hilos, a.procesos)
+    if a.salida:
+        guardar_csv(filas, a.salida)
+        print(f"{len(filas)} filas → {a.salida}")
+    else:
+        print(tabla(filas))
@@ -0,0 +1,179 @@
+"""
+Análisis sin gráficos: cada función devuelve sus números en un dict.
+
+Los scripts construyen las figuras al importarse y llaman a plt.show();
+sobre un corpus, crear y rasterizar figuras (savefig dpi=150) se lleva
+casi todo el tiempo. Acá el cálculo no importa matplotlib: graficar=True
+arma la lámina con `dsp.graficos` (backend Agg): con `guardar` la guarda
+y r["figura"] es la ruta; sin `guardar`, r["figura"] es la Figure abierta.
+
+    from dsp.analisis import analizar_toma
+    r = analizar_toma(x, fs)                     # {'f_pico': 440.1, ...}
+    r = analizar_toma(x, fs, graficar=True, guardar="toma1.png")
+
+Uso:
+    python -m dsp.analisis archivo.wav [salida.png]
+"""
+import json
+import sys
+
+import numpy as np
+from scipy.signal import find_peaks
+
+from dsp.cuantizacion import barrido_bits
+from dsp.espectro import espectro, nfft_pot2
+from dsp.filtros import banco_ema
+from dsp.modulacion import senales_am
+from dsp.ojo import densidad_ojo, metricas_ojo
+from dsp.pam import apertura_ojo, pulso_rc, senal_pam, simbolos_pam
+from dsp.preproceso import pico_parabolico, recortar_y_normalizar
+from dsp.stream import VentanaMasFuerte
+
+
+def _armonicos_db(f, mag, f0, n, tol=0.03):
+    """Nivel [dB] de h·f0 (h = 2..n+1) relativo al pico en f0; máximo en ±tol·h·f0."""
+    if f0 <= 0:
+        return []
+    df = f[1] - f[0]
+    ref = mag[int(round(f0 / df))] + 1e-12
+    out = []
+    for h in range(2, n + 2):
+        if h * f0 * (1 + tol) > f[-1]:
+            break
+        k0, k1 = int(h * f0 * (1 - tol) / df), int(np.ceil(h * f0 * (1 + tol) / df)) + 1
+        out.append(float(20 * np.log10(np.max(mag[k0:k1]) / ref + 1e-12)))
+    return out
+
+
+def analizar_toma(x, fs, preprocesar=False, fmin=200, fmax=900, armonicos=5,
+                  graficar=False, guardar=None, titulo="Toma"):
+    """
+    Toma de clase03-06: pico espectral (Hann, nfft ≥ 2^14, ajuste
+    parabólico en [fmin, fmax]), nivel, duración y nivel de los primeros
+    `armonicos` armónicos relativo a la fundamental.
+    preprocesar=True aplica recorte de silencio + DC + -1 dBFS como record_take.
+    """
+    x = recortar_y_normalizar(x, fs) if preprocesar else np.asarray(x, dtype=np.float32)
+    f, mag = espectro(x, fs, nfft=nfft_pot2(len(x), 14))
+    mag_db = 20 * np.log10(mag + 1e-12)
+    f_est = float(pico_parabolico(f, mag, fmin=fmin, fmax=fmax))
+    r = {"fs": fs, "n": len(x), "duracion": len(x) / fs, "f_pico": f_est,
+         "rms": float(np.sqrt(np.mean(np.square(x, dtype=np.float64)))),
+         "pico": float(np.max(np.abs(x))) if len(x) else 0.0,
+         "mag_max_db": float(mag_db.max()),
+         "armonicos_db": _armonicos_db(f, mag, f_est, armonicos)}
+    if graficar:
+        from dsp.graficos import figura_toma
+        r["figura"] = figura_toma(x, fs, f, mag_db, f_est, titulo, guardar)
+    return r
+
+
+def _fc_ema(alpha, fs):
+    """Corte a -3 dB de la EMA: |H|² = α² / (1 - 2β·cos ω + β²) = 1/2, β = 1-α."""
+    b = 1.0 - alpha
+    if b == 0:
+        return fs / 2
+    c = (1 + b**2 - 2 * alpha**2) / (2 * b)
+    return float(np.arccos(np.clip(c, -1.0, 1.0)) * fs / (2 * np.pi))
+
+
+def comparar_ema(x, fs, alphas=(0.6, 0.2, 0.05), inicio="cero", win_s=0.06,
+                 fmax=8000, graficar=False, guardar=None):
+    """
+    Comparación original vs EMA de clase04-09 (sin DC, todos los α en un
+    banco). Por α: RMS de salida, atenuación en dB y corte a -3 dB.
+    """
+    x = np.asarray(x, dtype=np.float32)
+    x = x - np.mean(x)
+    Y = banco_ema(x, alphas, inicio=inicio)
+    rms_x = float(np.sqrt(np.mean(np.square(x, dtype=np.float64))))
+    rms_y = np.sqrt(np.mean(np.square(Y, dtype=np.float64), axis=1))
+    vm = VentanaMasFuerte(max(8, int(win_s * fs))).actualizar(x)
+    r = {"fs": fs, "duracion": len(x) / fs, "rms": rms_x,
+         "ventana": vm.resultado(), "alphas": list(alphas),
+         "rms_filtrada": rms_y.tolist(),
+         "atenuacion_db": (20 * np.log10(rms_y / (rms_x + 1e-20) + 1e-20)).tolist(),
+         "fc_3db": [_fc_ema(a, fs) for a in alphas]}
+    if graficar:
+        from dsp.graficos import figura_ema
+        f, M = espectro(np.vstack([x, Y]), fs, simetrica=True, db=True)
+        r["figura"] = figura_ema(x, Y, fs, alphas, r["ventana"], f, M[0], M[1:], fmax, guardar)
+    return r
+
+
+def barrido_snr(bits=(8, 4, 2), f0=440, fs=44100, dur=2.0, A=1.0,
+                graficar=False, guardar=None):
+    """
+    SNR de cuantización de clase05-10 (senoidal a plena escala, mid-tread):
+    por cada Nbits, Δ, SNR teórico, SNR medido, error máximo e histograma
+    de e/Δ (todas las profundidades en una pasada, `barrido_bits`).
+    """
+    t = np.arange(0, dur, 1/fs)
+    x = A*np.sin(2*np.pi*f0*t)
+    b = barrido_bits(x, bits, -A, A, "mid-tread")
+    filas = [{"bits": int(b["bits"][i]), "delta": float(b["delta"][i]),
+              "snr_teorico": float(b["snr_teorico"][i]), "snr_real": float(b["snr_real"][i]),
+              "error_max": float(b["error_max"][i]), "histograma": b["histograma"][i].tolist()}
+             for i in range(len(b["bits"]))]
+    r = {"f0": f0, "fs": fs, "filas": filas}
+    if graficar:
+        from dsp.graficos import figura_snr
+        r["figura"] = figura_snr([d["bits"] for d in filas], [d["snr_teorico"] for d in filas],
+                                 [d["snr_real"] for d in filas], guardar)
+    return r
+
+
+def analizar_am(fs=100_000, dur=0.025, fm=200.0, fc=5_000.0, Am=1.0, Ac=1.0,
+                fmax=8000, umbral=0.1, graficar=False, guardar=None):
+    """
+    Modulaciones de clase06-12 (DSB-FC, DSB-SC, SSB-FC, SSB-SC): potencia
+    media y picos del espectro normalizado (> umbral) hasta fmax.
+    """
+    t = np.arange(0, dur, 1/fs)
+    s = senales_am(t, fm, fc, Am, Ac)
+    nombres = ["dsb_fc", "dsb_sc", "ssb_fc", "ssb_sc"]
+    f, M = espectro(np.stack([s[k] for k in nombres]), fs, simetrica=True, norm="max")
+    sel = f <= fmax
+    f, M = f[sel], M[:, sel]
+    r = {"fs": fs, "fm": fm, "fc": fc}
+    for k, Mk in zip(nombres, M):
+        picos, _ = find_peaks(Mk, height=umbral)
+        r[k] = {"potencia": float(np.mean(s[k]**2)),
+                "picos_hz": [float(pico_parabolico(f, Mk, f[p - 1], f[p + 1])) if 0 < p < len(f) - 1
+                             else float(f[p]) for p in picos]}
+    if graficar:
+        from dsp.graficos import figura_am
+        r["figura"] = figura_am(t, s, f, dict(zip(nombres, M)), fmax, guardar)
+    return r
+
+
+def ojo_pam4(Nsym=2000, M=8, alpha=0.1, L=20, seed=123, spans=2, ntraces=900,
+             sobremuestreo=4, graficar=False, guardar=None):
+    """
+    Ojo PAM4 de clase09 (pulso raised-cosine): fase de muestreo óptima,
+    apertura vertical de los 3 sub-ojos, excursión pico a pico y alto/ancho
+    de cada sub-ojo medidos sobre la densidad del ojo (ntraces=None: todas).
+    """
+    gn = pulso_rc(M, alpha, L)
+    simb = simbolos_pam(Nsym, seed=seed)
+    yn = senal_pam(simb, gn, M)
+    x, bordes, H = densidad_ojo(yn[:len(yn) - L*M], M, spans=spans, start_sym=L,
+                                max_trazas=ntraces, sobremuestreo=sobremuestreo)
+    m = metricas_ojo(x, bordes, H)
+    r = {"M": M, "alpha": alpha, "Nsym": Nsym,
+         **apertura_ojo(yn, simb, M, descarte=L),
+         "pico_a_pico": float(np.ptp(yn[L*M:len(yn) - L*M])),
+         "alturas_ojo": m["alturas"], "anchos_ojo": m["anchos"]}
+    if graficar:
+        from dsp.graficos import figura_densidad_ojo
+        r["figura"] = figura_densidad_ojo(x, bordes, H, "PAM4 — diagrama de ojo", guardar=guardar)
+    return r
+
+
+if __name__ == "__main__":
+    from dsp.wav import WavPCM
+    wav = WavPCM(sys.argv[1])
+    salida = sys.argv[2] if len(sys.argv) > 2 else None
+    r = analizar_toma(wav.leer(), wav.fs, preprocesar=True,
+                      graficar=salida is not None, guardar=salida, titulo=sys.argv[1])
+    print(json.dumps(r, indent=2, ensure_ascii=False))
@@ -0,0 +1,257 @@
+"""
+BER/SER de Monte-Carlo del enlace PAM de clase09 (pulso conformador,
+AWGN, filtro adaptado, decisión en la fase óptima, mapeo Gray).
+
+clase09 llega hasta el ojo. Para puntos de BER ~1e-6 hacen falta ~1e8
+símbolos: la simulación se parte en lotes independientes que se reparten
+en un ProcessPoolExecutor.
+  - Cada lote tiene su propio generador `np.random.default_rng` con una
+    semilla hija de `SeedSequence(seed)` (una por punto de Eb/N0 y, dentro
+    de él, una por lote): los flujos son independientes y el resultado no
+    depende de cuántos procesos haya.
+  - TX: `pam.senal_pam` polifásico con el pulso RRC; RX: filtro adaptado
+    evaluado sólo en las muestras de decisión (un producto matriz-vector
+    por lote sobre una vista con strides). Los primeros y últimos L
+    símbolos de cada lote (transitorio) no se cuentan.
+  - Parada temprana: un punto termina cuando junta `min_errores` errores de
+    bit (o `max_simbolos`). Los lotes se suman en orden de índice, así que
+    la parada —y el resultado— son reproducibles con la misma semilla.
+  - Intervalos de confianza de Wilson para SER y BER, y la curva teórica
+    (PAM con Gray: BER ≈ SER/log2(m)) para comparar.
+
+Uso:
+    python -m dsp.ber 0:12:2 [--niveles 4] [-j 8] [--min-errores 200] [-o ber.csv]
+"""
+import argparse
+import csv
+import os
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+from scipy.special import erfc
+from scipy.stats import norm
+
+from dsp.pam import PULSOS, senal_pam
+
+COLUMNAS = ["ebn0_db", "simbolos", "errores_simbolo", "ser", "ser_ic_inf", "ser_ic_sup",
+            "bits", "errores_bit", "ber", "ber_ic_inf", "ber_ic_sup", "ser_teorico", "ber_teorico",
+            "lotes"]
+
+
+def niveles_pam(m):
+    """Niveles de PAM-m: -(m-1), ..., -1, +1, ..., m-1."""
+    return np.arange(-(m - 1), m, 2, dtype=np.float64)
+
+
+def codigo_gray(m):
+    """Palabra Gray de cada nivel (índice 0 = nivel más bajo): niveles vecinos difieren en 1 bit."""
+    i = np.arange(m)
+    return i ^ (i >> 1)
+
+
+def tabla_errores_bit(m):
+    """(m, m): bits distintos entre las palabras Gray del nivel enviado y el decidido."""
+    g = codigo_gray(m)
+    x = g[:, None] ^ g[None, :]
+    return np.array([[bin(v).count("1") for v in fila] for fila in x], dtype=np.int64)
+
+
+def ser_teorico(ebn0_db, m):
+    """SER de PAM-m en AWGN: 2(1 - 1/m)·Q(√(6·Es/((m²-1)·N0))), Es = log2(m)·Eb."""
+    esn0 = np.log2(m) * 10 ** (np.asarray(ebn0_db, dtype=np.float64) / 10)
+    x = np.sqrt(6 * esn0 / (m * m - 1))
+    return 2 * (1 - 1 / m) * 0.5 * erfc(x / np.sqrt(2))
+
+
+def intervalo_wilson(k, n, conf=0.95):
+    """Intervalo de Wilson para una proporción k/n."""
+    if n == 0:
+        return 0.0, 1.0
+    z = norm.ppf(1 - (1 - conf) / 2)
+    p = k / n
+    den = 1 + z * z / n
+    centro = (p + z * z / (2 * n)) / den
+    mitad = z * np.sqrt(p * (1 - p) / n + z * z / (4 * n * n)) / den
+    return float(max(0.0, centro - mitad)), float(min(1.0, centro + mitad))
+
+
+def respuesta(g, M):
+    """Cascada pulso ⊛ filtro adaptado centrada: h[k] para k = -(len-1)..(len-1)."""
+    return np.convolve(g, g[::-1])
+
+
+def fase_optima(g, M, m):
+    """
+    Fase de decisión φ ∈ (-M/2, M/2] (muestras respecto del centro del
+    símbolo) que maximiza la apertura en el peor caso de ISI:
+    h[φ] - (m-1)·Σ_k≠0 |h[φ + kM]|. Devuelve (φ, ganancia h[φ]).
+    """
+    h = respuesta(g, M)
+    c = len(g) - 1                                       # centro de la cascada
+    mejor = None
+    for fase in range(-(M // 2) + 1, M // 2 + 1):
+        taps = h[(c + fase) % M::M]
+        k0 = (c + fase) // M
+        isi = np.sum(np.abs(taps)) - abs(taps[k0])
+        apertura = taps[k0] - (m - 1) * isi
+        if mejor is None or apertura > mejor[0]:
+            mejor = (apertura, fase, float(taps[k0]))
+    return mejor[1], mejor[2]
+
+
+def filtro_adaptado(r, g, M, fase, n):
+    """
+    Salida del filtro adaptado (g invertido, alineación "same") sólo en
+    las muestras de decisión j·M + fase, j = 0..n-1.
+    """
+    Lg, c = len(g), (len(g) - 1) // 2
+    pad_izq = Lg - 1 - c + M                             # + M: admite fase negativa
+    rp = np.concatenate([np.zeros(pad_izq), r, np.zeros(c + M)])
+    W = sliding_window_view(rp, Lg)[M + fase::M][:n]      # W[j] termina en r[j·M + fase + c]
+    return W @ np.ascontiguousarray(g[::-1])
+
+
+def _simular_lote(ebn0_db, semilla, n, cfg):
+    """Un lote: (símbolos contados, errores de símbolo, errores de bit)."""
+    rng = np.random.default_rng(semilla)
+    m, M, g = cfg["m"], cfg["M"], cfg["g"]
+    niveles = niveles_pam(m)
+    idx = rng.integers(0, m, size=n)
+    tx = senal_pam(niveles[idx], g, M)
+    es = np.mean(niveles ** 2) * np.sum(g ** 2)          # energía media por símbolo
+    n0 = es / (np.log2(m) * 10 ** (ebn0_db / 10))
+    tx += np.sqrt(n0 / 2) * rng.standard_normal(tx.size)
+    z = filtro_adaptado(tx, g, M, cfg["fase"], n) / cfg["ganancia"]
+    dec = np.clip(np.rint((z + (m - 1)) / 2), 0, m - 1).astype(np.intp)
+    s = slice(cfg["guarda"], n - cfg["guarda"])
+    return (n - 2 * cfg["guarda"], int(np.count_nonzero(dec[s] != idx[s])),
+            int(cfg["bits"][idx[s], dec[s]].sum()))
+
+
+def _iniciar_proceso():
+    from dsp import cache
+    cache.WORKERS = 1
+
+
+class _EnProceso:
+    """Ejecutor trivial (procesos=0): corre cada tarea al enviarla."""
+
+    def submit(self, f, *args):
+        fut = Future()
+        fut.set_result(f(*args))
+        return fut
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+def simular_ber(ebn0_db, m=4, M=8, alpha=0.1, L=20, pulso="rrc", fase=None, min_errores=100,
+                max_simbolos=10**7, lote=1 << 16, procesos=None, seed=0, conf=0.95):
+    """
+    BER/SER para cada Eb/N0 [dB] de `ebn0_db` (PAM-m, M muestras/símbolo,
+    pulso "rrc" (con filtro adaptado RRC: cascada raised-cosine) o "rc").
+      - fase:        muestra de decisión respecto del centro (None → fase_optima).
+      - min_errores: errores de bit que cierran un punto; max_simbolos, su tope.
+      - procesos:    tamaño del pool (None → núcleos; 0 → en este proceso).
+    Devuelve una fila (dict con COLUMNAS) por punto.
+    """
+    assert lote > 2 * L, "el lote debe ser más largo que las guardas"
+    g = np.array(PULSOS[pulso](M, alpha, L))
+    f, ganancia = fase_optima(g, M, m)
+    fase = f if fase is None else fase
+    if fase != f:
+        ganancia = float(respuesta(g, M)[len(g) - 1 + fase])
+    cfg = {"m": m, "M": M, "g": g, "fase": fase, "ganancia": ganancia, "guarda": L,
+           "bits": tabla_errores_bit(m)}
+    puntos = [float(e) for e in np.atleast_1d(ebn0_db)]
+    semillas = np.random.SeedSequence(seed).spawn(len(puntos))
+    por_lote = lote - 2 * L
+    tope = -(-max_simbolos // por_lote)                  # lotes como máximo por punto
+    est = [{"sig": 0, "hechos": {}, "pref": 0, "sim": 0, "es": 0, "eb": 0, "activo": True}
+           for _ in puntos]
+
+    ex = _EnProceso() if procesos == 0 else \
+        ProcessPoolExecutor(max_workers=procesos, initializer=_iniciar_proceso)
+    en_vuelo = 1 if procesos == 0 else 2 * (procesos or os.cpu_count() or 1)
+    futs = {}
+    with ex:
+        while any(e["activo"] for e in est):
+            for p, e in enumerate(est):                  # llenar el pool, por turnos
+                while (e["activo"] and e["sig"] < tope and len(futs) < en_vuelo
+                       and e["sig"] - e["pref"] < en_vuelo):
+                    s = semillas[p].spawn(1)[0]
+                    futs[ex.submit(_simular_lote, puntos[p], s, lote, cfg)] = (p, e["sig"])
+                    e["sig"] += 1
+            listos, _ = wait(futs, return_when=FIRST_COMPLETED)
+            for fut in listos:
+                p, k = futs.pop(fut)
+                e = est[p]
+                e["hechos"][k] = fut.result()
+                while e["activo"] and e["pref"] in e["hechos"]:   # suma en orden de lote
+                    n, es, eb = e["hechos"].pop(e["pref"])
+                    e["sim"] += n; e["es"] += es; e["eb"] += eb
+                    e["pref"] += 1
+                    if e["eb"] >= min_errores or e["pref"] >= tope:
+                        e["activo"] = False
+        for fut in futs:
+            fut.cancel()
+
+    filas = []
+    k = np.log2(m)
+    for x, e in zip(puntos, est):
+        bits = int(e["sim"] * k)
+        ser_t = float(ser_teorico(x, m))
+        filas.append({"ebn0_db": x, "simbolos": e["sim"], "errores_simbolo": e["es"],
+                      "ser": e["es"] / e["sim"] if e["sim"] else float("nan"),
+                      **dict(zip(("ser_ic_inf", "ser_ic_sup"), intervalo_wilson(e["es"], e["sim"], conf))),
+                      "bits": bits, "errores_bit": e["eb"],
+                      "ber": e["eb"] / bits if bits else float("nan"),
+                      **dict(zip(("ber_ic_inf", "ber_ic_sup"), intervalo_wilson(e["eb"], bits, conf))),
+                      "ser_teorico": ser_t, "ber_teorico": ser_t / k, "lotes": e["pref"]})
+    return filas
+
+
+def tabla(filas):
+    """Texto con una fila por punto de Eb/N0."""
+    lineas = ["Eb/N0 [dB] |    símbolos |   SER      [IC 95%]            |   BER      [IC 95%]"
+              "            | BER teórico"]
+    for r in filas:
+        lineas.append(f"{r['ebn0_db']:10.1f} | {r['simbolos']:11d} | {r['ser']:.3e} "
+                      f"[{r['ser_ic_inf']:.2e}, {r['ser_ic_sup']:.2e}] | {r['ber']:.3e} "
+                      f"[{r['ber_ic_inf']:.2e}, {r['ber_ic_sup']:.2e}] | {r['ber_teorico']:.3e}")
+    return "\n".join(lineas)
+
+
+def guardar_csv(filas, ruta):
+    with open(ruta, "w", newline="", encoding="utf-8") as fh:
+        w = csv.DictWriter(fh, fieldnames=COLUMNAS)
+        w.writeheader()
+        w.writerows(filas)
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description="BER/SER de Monte-Carlo para PAM con pulso RRC.")
+    ap.add_argument("ebn0", help="Eb/N0 [dB]: 'inicio:fin:paso' (fin incluido) o 'a,b,c'")
+    ap.add_argument("--niveles", type=int, default=4, help="PAM-m (2 o 4)")
+    ap.add_argument("--alpha", type=float, default=0.1, help="roll-off")
+    ap.add_argument("--min-errores", type=int, default=100, help="errores de bit por punto")
+    ap.add_argument("--max-simbolos", type=float, default=1e7, help="tope de símbolos por punto")
+    ap.add_argument("-j", "--procesos", type=int, default=None, help="procesos (por defecto, núcleos)")
+    ap.add_argument("--seed", type=int, default=0, help="semilla")
+    ap.add_argument("-o", "--salida", default=None, help="CSV de salida")
+    a = ap.parse_args()
+    if ":" in a.ebn0:
+        i, f, p = (float(v) for v in a.ebn0.split(":"))
+        ebn0 = np.arange(i, f + p / 2, p)
+    else:
+        ebn0 = [float(v) for v in a.ebn0.split(",")]
+    filas = simular_ber(ebn0, m=a.niveles, alpha=a.alpha, min_errores=a.min_errores,
+                        max_simbolos=int(a.max_simbolos), procesos=a.procesos, seed=a.seed)
+    print(tabla(filas))
+    if a.salida:
+        guardar_csv(filas, a.salida)
+        print(f"{len(filas)} puntos → {a.salida}")
@@ -0,0 +1,146 @@
+"""
+Caché LRU de proceso para ventanas, constantes de normalización, ejes de
+frecuencia y planes de FFT.
+
+Todas estas piezas dependen sólo de (tipo de ventana, N, nfft, fs) y en
+un lote de señales se repiten unas pocas longitudes: se calculan una vez,
+se guardan como arrays de sólo lectura y se reutilizan. La caché está
+acotada en cantidad de entradas y en bytes, y cuenta aciertos/fallos:
+    from dsp import cache
+    cache.estadisticas()   # {'aciertos': ..., 'fallos': ..., ...}
+
+FFT: si pyFFTW está instalado se cachean sus planes (un plan por forma,
+dtype, nfft e hilo); si no, se usa scipy.fft con `workers` hilos.
+"""
+import os
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import scipy.fft as sfft
+from scipy.signal import get_window
+
+try:
+    import pyfftw   # opcional: planes FFTW reutilizables
+    import pyfftw.builders
+    HAS_PYFFTW = True
+except Exception:
+    HAS_PYFFTW = False
+
+WORKERS = os.cpu_count() or 1   # hilos por defecto de scipy.fft / FFTW
+
+
+class CacheLRU:
+    """LRU acotado por número de entradas y por bytes, seguro entre hilos."""
+
+    def __init__(self, max_entradas=256, max_bytes=64 << 20):
+        self.max_entradas = max_entradas
+        self.max_bytes = max_bytes
+        self._datos = OrderedDict()          # clave -> (valor, bytes)
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.aciertos = self.fallos = self.desalojos = 0
+
+    def obtener(self, clave, crear):
+        """Devuelve el valor de `clave`; si no está lo crea con crear()."""
+        with self._lock:
+            if clave in self._datos:
+                self._datos.move_to_end(clave)
+                self.aciertos += 1
+                return self._datos[clave][0]
+            self.fallos += 1
+        valor = crear()                      # fuera del lock: puede ser caro
+        tam = _tamano(valor)
+        with self._lock:
+            if clave not in self._datos:
+                self._datos[clave] = (valor, tam)
+                self._bytes += tam
+                self._desalojar()
+            return self._datos[clave][0]
+
+    def _desalojar(self):
+        while self._datos and (len(self._datos) > self.max_entradas or self._bytes > self.max_bytes):
+            _, (_, tam) = self._datos.popitem(last=False)
+            self._bytes -= tam
+            self.desalojos += 1
+
+    def limpiar(self):
+        with self._lock:
+            self._datos.clear()
+            self._bytes = 0
+            self.aciertos = self.fallos = self.desalojos = 0
+
+    def estadisticas(self):
+        with self._lock:
+            return {"aciertos": self.aciertos, "fallos": self.fallos,
+                    "desalojos": self.desalojos, "entradas": len(self._datos),
+                    "bytes": self._bytes}
+
+
+def _tamano(valor):
+    if isinstance(valor, np.ndarray):
+        return valor.nbytes
+    if HAS_PYFFTW and isinstance(valor, pyfftw.FFTW):
+        return valor.input_array.nbytes + valor.output_array.nbytes
+    return 64
+
+
+def _solo_lectura(a):
+    a.setflags(write=False)
+    return a
+
+
+CACHE = CacheLRU()
+
+
+def ventana(tipo, L, simetrica=False, dtype=np.float64):
+    """Ventana de L muestras (sólo lectura). tipo=None → rectangular."""
+    dtype = np.dtype(dtype)
+
+    def crear():
+        w = np.ones(L) if tipo is None else get_window(tipo, L, fftbins=not simetrica)
+        return _solo_lectura(w.astype(dtype))
+    return CACHE.obtener(("ventana", tipo, int(L), bool(simetrica), dtype.str), crear)
+
+
+def norm_ventana(tipo, L, simetrica=False):
+    """Constante Σw/2 (normalización de amplitud de rfft_db / espectro_db)."""
+    return CACHE.obtener(("norm", tipo, int(L), bool(simetrica)),
+                         lambda: float(np.sum(ventana(tipo, L, simetrica))) / 2)
+
+
+def eje_frec(nfft, fs):
+    """rfftfreq(nfft, 1/fs) de sólo lectura."""
+    return CACHE.obtener(("rfftfreq", int(nfft), float(fs)),
+                         lambda: _solo_lectura(sfft.rfftfreq(int(nfft), d=1.0 / fs)))
+
+
+def _plan_fftw(forma, dtype, n, workers):
+    def crear():
+        a = pyfftw.empty_aligned(forma, dtype=dtype)
+        return pyfftw.builders.rfft(a, n=n, axis=-1, threads=workers,
+                                    planner_effort="FFTW_MEASURE")
+    clave = ("plan_rfft", forma, np.dtype(dtype).str, n, workers, threading.get_ident())
+    return CACHE.obtener(clave, crear)
+
+
+def rfft(x, n=None, workers=None):
+    """
+    rFFT sobre el último eje. Con pyFFTW usa (y cachea) un plan por forma;
+    sin pyFFTW llama a scipy.fft.rfft con `workers` hilos.
+    """
+    workers = WORKERS if workers is None else workers
+    n = x.shape[-1] if n is None else int(n)
+    if HAS_PYFFTW and x.dtype in (np.float32, np.float64):
+        plan = _plan_fftw(x.shape, x.dtype, n, workers)
+        return plan(x).copy()                # el plan reutiliza su buffer de salida
+    return sfft.rfft(x, n=n, axis=-1, workers=workers)
+
+
+def estadisticas():
+    """Contadores de la caché de proceso."""
+    return CACHE.estadisticas()
+
+
+def limpiar():
+    CACHE.limpiar()
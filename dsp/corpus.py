@@ -0,0 +1,170 @@
+"""
+Análisis de tomas (plot_take_all de clase03-06, sin figuras) sobre un
+directorio con miles de WAV, repartido en un ProcessPoolExecutor.
+
+  - Trabajo en lotes de `lote` archivos por tarea (menos IPC por archivo).
+  - Cada proceso usa 1 hilo de FFT: la escala la dan los procesos.
+  - Resultados incrementales: CSV (una fila por archivo, se agrega al
+    terminar cada lote) o, si la salida termina en .parquet y está
+    pyarrow, un directorio con una parte .parquet por lote.
+  - Reanudable: al arrancar se leen los archivos ya escritos y se saltan.
+    Un error en un archivo queda en la columna `error` y no corta la corrida;
+    esos archivos NO cuentan como hechos y se reintentan en la próxima
+    corrida (reintentar_errores=False / --sin-reintentar los salta). La
+    salida sólo se agrega: el reintento suma otra fila, vale la última.
+
+Uso:
+    python -m dsp.corpus grabaciones/ -o resultados.csv [-j 8] [--lote 16]
+"""
+import argparse
+import csv
+import io
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+try:
+    import pyarrow as pa   # opcional: salida Parquet
+    import pyarrow.parquet as pq
+    HAS_PYARROW = True
+except Exception:
+    HAS_PYARROW = False
+
+COLUMNAS = ["archivo", "fs", "n", "duracion", "f_pico", "rms", "pico",
+            "mag_max_db", "armonicos_db", "error"]
+
+
+def buscar_wavs(directorio, patron="**/*.wav"):
+    """Rutas (str) de los WAV bajo `directorio`, ordenadas."""
+    return sorted(str(p) for p in Path(directorio).glob(patron))
+
+
+def analizar_archivo(path, **kw):
+    """Fila de resultados de un WAV (trim → DC/normalizar → rfft_db → pico → armónicos)."""
+    from dsp.analisis import analizar_toma
+    from dsp.wav import WavPCM
+    try:
+        wav = WavPCM(path)
+        r = analizar_toma(wav.leer(), wav.fs, preprocesar=True, **kw)
+        r["armonicos_db"] = json.dumps(r["armonicos_db"])
+        return {"archivo": path, **{k: r[k] for k in COLUMNAS[1:-1]}, "error": ""}
+    except Exception as e:
+        return {"archivo": path, "error": f"{type(e).__name__}: {e}"}
+
+
+def _analizar_lote(rutas, kw):
+    return [analizar_archivo(p, **kw) for p in rutas]
+
+
+def _iniciar_proceso():
+    from dsp import cache
+    cache.WORKERS = 1
+
+
+# ---------------- salida ----------------
+class _SalidaCSV:
+    def __init__(self, path):
+        self.path = path
+
+    def hechos(self, con_error=False):
+        if not os.path.exists(self.path):
+            return set()
+        with open(self.path, "r+b") as f:
+            datos = f.read()
+            fin = datos.rfind(b"\n") + 1         # descarta una fila cortada por un corte
+            if fin < len(datos):
+                f.truncate(fin)
+        texto = datos[:fin].decode("utf-8")
+        return {fila["archivo"] for fila in csv.DictReader(io.StringIO(texto, newline=""))
+                if con_error or not fila.get("error")}
+
+    def escribir(self, filas):
+        nuevo = not os.path.exists(self.path) or os.path.getsize(self.path) == 0
+        buf = io.StringIO()
+        w = csv.DictWriter(buf, fieldnames=COLUMNAS, lineterminator="\n")
+        if nuevo:
+            w.writeheader()
+        w.writerows(filas)
+        with open(self.path, "a", newline="", encoding="utf-8") as f:
+            f.write(buf.getvalue())              # un solo write por lote
+            f.flush()
+            os.fsync(f.fileno())
+
+
+class _SalidaParquet:
+    def __init__(self, path):
+        self.dir = Path(path)
+        self.dir.mkdir(parents=True, exist_ok=True)
+        self.k = len(list(self.dir.glob("parte-*.parquet")))
+
+    def hechos(self, con_error=False):
+        hechos = set()
+        for p in self.dir.glob("parte-*.parquet"):
+            t = pq.read_table(p, columns=["archivo", "error"]).to_pydict()
+            hechos.update(a for a, e in zip(t["archivo"], t["error"]) if con_error or not e)
+        return hechos
+
+    def escribir(self, filas):
+        tabla = pa.Table.from_pylist([{c: f.get(c) for c in COLUMNAS} for f in filas])
+        tmp = self.dir / f".parte-{self.k:06d}.tmp"
+        pq.write_table(tabla, tmp)
+        os.replace(tmp, self.dir / f"parte-{self.k:06d}.parquet")   # atómico
+        self.k += 1
+
+
+def _salida(path):
+    if str(path).endswith(".parquet"):
+        if not HAS_PYARROW:
+            raise RuntimeError("salida .parquet requiere pyarrow; usar .csv")
+        return _SalidaParquet(path)
+    return _SalidaCSV(path)
+
+
+def correr_corpus(entrada, salida="corpus.csv", procesos=None, lote=16, progreso=True,
+                  reintentar_errores=True, **kw):
+    """
+    Analiza `entrada` (directorio o lista de rutas) y escribe en `salida`.
+    Se saltan los archivos ya escritos sin error (con reintentar_errores=False,
+    también los que fallaron).
+    Devuelve {'archivos', 'saltados', 'errores', 'segundos', 'archivos_por_s'}.
+    """
+    rutas = buscar_wavs(entrada) if isinstance(entrada, (str, Path)) else list(entrada)
+    out = _salida(salida)
+    hechos = out.hechos(con_error=not reintentar_errores)
+    pendientes = [p for p in rutas if p not in hechos]
+    lotes = [pendientes[i:i + lote] for i in range(0, len(pendientes), lote)]
+
+    t0 = time.perf_counter()
+    n = errores = 0
+    with ProcessPoolExecutor(max_workers=procesos, initializer=_iniciar_proceso) as ex:
+        futuros = [ex.submit(_analizar_lote, l, kw) for l in lotes]
+        for fut in as_completed(futuros):
+            filas = fut.result()
+            out.escribir(filas)
+            n += len(filas)
+            errores += sum(1 for f in filas if f.get("error"))
+            if progreso:
+                print(f"\r{n}/{len(pendientes)} archivos", end="", file=sys.stderr)
+    if progreso and pendientes:
+        print(file=sys.stderr)
+    dt = time.perf_counter() - t0
+    return {"archivos": n, "saltados": len(rutas) - len(pendientes), "errores": errores,
+            "segundos": dt, "archivos_por_s": n / dt if dt > 0 else 0.0}
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description="Análisis de tomas sobre un directorio de WAV.")
+    ap.add_argument("entrada", help="directorio con archivos .wav")
+    ap.add_argument("-o", "--salida", default="corpus.csv", help=".csv o .parquet (directorio)")
+    ap.add_argument("-j", "--procesos", type=int, default=None, help="procesos (por defecto, núcleos)")
+    ap.add_argument("--lote", type=int, default=16, help="archivos por tarea")
+    ap.add_argument("--sin-reintentar", action="store_true",
+                    help="no reintentar los archivos que fallaron en corridas anteriores")
+    a = ap.parse_args()
+    r = correr_corpus(a.entrada, a.salida, a.procesos, a.lote,
+                      reintentar_errores=not a.sin_reintentar)
+    print(f"{r['archivos']} archivos ({r['saltados']} ya hechos, {r['errores']} con error) "
+          f"en {r['segundos']:.1f} s → {r['archivos_por_s']:.1f} archivos/s")
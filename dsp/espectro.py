@@ -0,0 +1,59 @@
+"""
+Servicio de espectros compartido (rFFT por lotes).
+
+Unifica las variantes que estaban repetidas en las clases:
+  - clase03-06 / clase03-07  rfft_db
+  - clase04-09 / clase04-8   espectro_db
+  - clase05-9                fourier_calculation
+  - clase06-12               fft_mag_norm
+Acepta una señal (L,) o una pila (N, L) y hace UNA rFFT por lotes; la
+ventana, Σw/2, el eje de frecuencias y (con pyFFTW) el plan de FFT salen
+de la caché LRU de `dsp.cache`. Con dtype=np.float32 todo el cálculo es
+en simple precisión.
+"""
+import numpy as np
+
+from dsp import cache
+
+EPS = 1e-12
+
+
+def nfft_pot2(L, minimo=0):
+    """Potencia de 2 >= L y >= 2**minimo (criterio de rfft_db)."""
+    return 1 << max(minimo, int(np.ceil(np.log2(max(L, 1)))))
+
+
+def espectro(x, fs, nfft=None, ventana="hann", simetrica=False, norm="ventana",
+             db=False, dtype=np.float64, workers=None):
+    """
+    Magnitud del espectro unilateral de una señal (L,) o de una pila (N, L).
+      - nfft:      None → L (sin relleno); si es mayor se rellena con ceros.
+      - ventana:   nombre de scipy.signal.get_window ("hann", ...) o None.
+      - simetrica: True → ventana simétrica (= np.hanning); False → periódica.
+      - norm:      "ventana" |X|/(Σw/2) · "n" |X|/L · "2n" 2|X|/L ·
+                   "max" |X|/max|X| (por fila) · None sin normalizar.
+      - db:        True → 20·log10(mag + 1e-12).
+      - dtype:     np.float32 para cálculo en simple precisión.
+      - workers:   hilos de la FFT (por defecto, todos los núcleos).
+    Devuelve (f, mag) con mag de shape (nfft//2+1,) o (N, nfft//2+1).
+    """
+    x = np.asarray(x, dtype=dtype)
+    L = x.shape[-1]
+    nfft = L if nfft is None else int(nfft)
+    xw = x * cache.ventana(ventana, L, simetrica, dtype) if ventana is not None else x
+    mag = np.abs(cache.rfft(xw, n=nfft, workers=workers))
+
+    if norm == "ventana":
+        mag /= cache.norm_ventana(ventana, L, simetrica)
+    elif norm == "n":
+        mag /= L
+    elif norm == "2n":
+        mag *= 2.0 / L
+    elif norm == "max":
+        mag /= np.max(mag, axis=-1, keepdims=True) + EPS
+    elif norm is not None:
+        raise ValueError(f"norm desconocida: {norm!r}")
+
+    if db:
+        mag = 20 * np.log10(mag + EPS)
+    return cache.eje_frec(nfft, fs), mag
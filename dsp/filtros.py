@@ -0,0 +1,209 @@
+"""
+Filtros de media móvil (EMA y SMA) sin lazos muestra a muestra.
+
+Reemplazan a `ema_filter` (clase04) y a `ema` / `sma_diff_eq` (clase07)
+con las mismas salidas y el mismo arranque:
+  - EMA: recursión de 1er orden resuelta con `scipy.signal.lfilter` (C).
+  - SMA: suma acumulada, O(N) sin importar el tamaño de ventana W.
+  - Camino JIT opcional con numba (motor="numba") si está instalado.
+  - Bancos (`banco_ema`, `banco_sma`, `banco_filtros`): todos los α / W
+    juntos, salida 2-D (parámetro × muestra). El de SMA comparte una
+    suma acumulada entre todos los W en una sola pasada; el de EMA hace
+    una sola pasada con numba y, sin numba, una `ema` por α.
+"""
+import numpy as np
+from scipy.signal import lfilter
+
+try:
+    import numba   # opcional: camino JIT
+    HAS_NUMBA = True
+except Exception:
+    HAS_NUMBA = False
+
+BLOQUE_EMA = 1 << 15   # ema: bloques que entran en caché, menos llamadas a lfilter
+
+
+def _como_float(x):
+    """float32/float64 se respetan; enteros u otros pasan a float64."""
+    x = np.asarray(x)
+    if not np.issubdtype(x.dtype, np.floating):
+        x = x.astype(np.float64)
+    return x
+
+
+def _y_previo(x, inicio):
+    """Valor de y[-1] que reproduce el arranque pedido."""
+    if inicio == "x0":      # y[0] = x[0]    (clase07)
+        return x[0]
+    if inicio == "cero":    # y[0] = α x[0]  (clase04)
+        return 0.0
+    raise ValueError(f"inicio desconocido: {inicio!r} (usar 'x0' o 'cero')")
+
+
+if HAS_NUMBA:
+    @numba.njit(cache=True)
+    def _ema_jit(x, alpha, y_prev, y):
+        a1 = 1.0 - alpha
+        for n in range(x.size):
+            y_prev = alpha * x[n] + a1 * y_prev
+            y[n] = y_prev
+        return y
+
+    @numba.njit(cache=True)
+    def _banco_ema_jit(x, alphas, y_prev, Y):
+        for n in range(x.size):
+            xn = x[n]
+            for p in range(alphas.size):
+                y_prev[p] = alphas[p] * xn + (1.0 - alphas[p]) * y_prev[p]
+                Y[p, n] = y_prev[p]
+        return Y
+
+
+def ema(x, alpha: float, inicio="x0", motor="auto", out=None):
+    """
+    Media móvil exponencial: y[n] = α x[n] + (1-α) y[n-1].
+      - inicio="x0":   y[0] = x[0]    (como `ema` de clase07)
+      - inicio="cero": y[0] = α x[0]  (como `ema_filter` de clase04)
+      - motor: "auto" | "lfilter" | "numba"
+      - out: array destino (puede ser x; si no, se reserva uno nuevo).
+        lfilter corre por bloques de BLOQUE_EMA con el estado entre
+        bloques: cada bloque de entrada y salida queda en caché, y con un
+        buffer reutilizado además se evita tocar páginas nuevas.
+    Devuelve el mismo dtype flotante que x (float32 se mantiene).
+    """
+    if not 0.0 < alpha <= 1.0:
+        raise ValueError(f"α debe estar en (0, 1]: {alpha!r}")
+    x = _como_float(x)
+    if x.size == 0:
+        return np.empty_like(x) if out is None else out
+    y_prev = _y_previo(x, inicio)
+
+    if motor == "numba":
+        if not HAS_NUMBA:
+            raise RuntimeError("numba no está instalado; usar motor='lfilter'")
+        return _ema_jit(x, x.dtype.type(alpha), x.dtype.type(y_prev),
+                        np.empty_like(x) if out is None else out)
+    if motor not in ("auto", "lfilter"):
+        raise ValueError(f"motor desconocido: {motor!r}")
+
+    dt = x.dtype
+    b = np.array([alpha], dtype=dt)
+    a = np.array([1.0, alpha - 1.0], dtype=dt)
+    zi = np.array([(1.0 - alpha) * y_prev], dtype=dt)
+    out = np.empty_like(x) if out is None else out
+    for i0 in range(0, x.size, BLOQUE_EMA):
+        out[i0:i0 + BLOQUE_EMA], zi = lfilter(b, a, x[i0:i0 + BLOQUE_EMA], zi=zi)
+    return out
+
+
+def sma(x, W: int):
+    """
+    Media móvil simple con el arranque de `sma_diff_eq`:
+      - n < W : promedio de lo disponible, acc / (n+1)
+      - n >= W: promedio de las últimas W muestras
+    Usa la suma acumulada en float64: y[n] = (c[n] - c[n-W]) / W.
+    """
+    if W < 1:
+        raise ValueError(f"W debe ser >= 1: {W!r}")
+    x = np.asarray(x)
+    N = x.size
+    c = np.cumsum(x, dtype=np.float64)
+    y = np.empty(N, dtype=np.float64)
+    k = min(W, N)
+    y[:k] = c[:k] / np.arange(1, k + 1)
+    if N > W:
+        y[W:] = (c[W:] - c[:-W]) / W
+    return y
+
+
+def banco_ema(x, alphas, inicio="x0", motor="auto", out=None):
+    """
+    Banco de EMAs: fila p = ema(x, alphas[p], inicio).
+    Con numba (motor="auto" si está instalado, o motor="numba") la señal
+    se recorre UNA vez y el lazo interno avanza todos los α en cada
+    muestra. Sin numba la recursión no se vectoriza sobre el eje de α
+    (las formas cerradas por tramos con potencias de (1-α) no le ganan a
+    lfilter, que ya está cerca del costo de escribir las salidas): cada
+    fila es una llamada a `ema` sobre su fila de la salida.
+    Devuelve un array (len(alphas), len(x)) del dtype flotante de x
+    (o escribe en `out`, si se pasa).
+    """
+    x = _como_float(x)
+    dt = x.dtype
+    alphas = np.asarray(alphas, dtype=dt).ravel()
+    if not np.all((alphas > 0) & (alphas <= 1)):
+        raise ValueError("cada α debe estar en (0, 1]")
+    P, N = alphas.size, x.size
+    Y = np.empty((P, N), dtype=dt) if out is None else out
+    if P == 0 or N == 0:
+        return Y
+
+    if motor == "numba" or (motor == "auto" and HAS_NUMBA):
+        if not HAS_NUMBA:
+            raise RuntimeError("numba no está instalado; usar motor='lfilter'")
+        y_prev = np.full(P, _y_previo(x, inicio), dtype=dt)
+        return _banco_ema_jit(x, alphas, y_prev, Y)
+    if motor not in ("auto", "lfilter"):
+        raise ValueError(f"motor desconocido: {motor!r}")
+    for p in range(P):
+        ema(x, alphas[p], inicio, out=Y[p])
+    return Y
+
+
+def banco_sma(x, ventanas, bloque=1 << 16, out=None):
+    """
+    Banco de SMAs: fila p = sma(x, ventanas[p]) (mismo arranque parcial).
+    Una sola suma acumulada por bloques, compartida por todos los W: cada
+    fila es una resta de dos tramos de esa suma (y[n] = (c[n]-c[n-W]) / W).
+    Entre bloques sólo se guardan las últimas max(W) sumas.
+    Devuelve un array float64 (len(ventanas), len(x)) (o escribe en `out`).
+    """
+    x = np.asarray(x)
+    W = np.asarray(ventanas, dtype=np.int64).ravel()
+    if not np.all(W >= 1):
+        raise ValueError("cada W debe ser >= 1")
+    P, N = W.size, x.size
+    Y = np.empty((P, N), dtype=np.float64) if out is None else out
+    if P == 0 or N == 0:
+        return Y
+    Wmax = int(W.max())
+
+    # cz[k - off] = x[0] + ... + x[k-1]  (suma hasta k, con cz global [0] = 0)
+    cola = np.zeros(1)
+    off = 0
+    for i0 in range(0, N, bloque):
+        i1 = min(i0 + bloque, N)
+        nb = i1 - i0
+        cz = np.concatenate([cola, cola[-1] + np.cumsum(x[i0:i1], dtype=np.float64)])
+        actual = cz[i0 + 1 - off:]                          # suma hasta n, n en [i0, i1)
+        for p in range(P):
+            w = int(W[p])
+            fila = Y[p, i0:i1]
+            k = min(max(w - i0, 0), nb)                    # muestras aún en arranque
+            if k:
+                np.divide(actual[:k], np.arange(i0 + 1, i0 + k + 1), out=fila[:k])
+            if k < nb:
+                s = i0 + k + 1 - w - off
+                np.subtract(actual[k:], cz[s:s + nb - k], out=fila[k:])
+                fila[k:] /= w
+        cola = cz[-(Wmax + 1):]
+        off = i1 + 1 - cola.size
+    return Y
+
+
+def banco_filtros(x, alphas=(), ventanas=(), inicio="x0"):
+    """
+    Banco combinado: primero una fila por cada α (EMA) y luego una por
+    cada W (SMA). Devuelve un array float64 (len(alphas)+len(ventanas), N).
+    """
+    x = _como_float(x).astype(np.float64, copy=False)
+    Pe = len(alphas)
+    Y = np.empty((Pe + len(ventanas), x.size), dtype=np.float64)
+    banco_ema(x, alphas, inicio=inicio, out=Y[:Pe])
+    banco_sma(x, ventanas, out=Y[Pe:])
+    return Y
+
+
+def alpha_from_W(W):
+    """Elección clásica: EMA con suavizado parecido al de SMA(W)."""
+    return 2.0 / (W + 1.0)
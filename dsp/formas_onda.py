@@ -0,0 +1,184 @@
+"""
+Formas de onda de prueba por bloques (antes `signal.square` /
+`signal.sawtooth` sobre un `t` float64 completo en clase03).
+
+El camino original arma un vector de tiempo float64 de toda la señal,
+una onda float64 por forma, la mezcla, otra pasada completa para
+normalizarla, y para el zoom recorre todo `t` con una máscara
+(`t[t <= 0.01]`): minutos de estímulo son cientos de MB. Acá:
+  - `Generador` lleva la fase normalizada (ciclos, float64) de una
+    forma ("seno", "cuadrada", "triangular", "sierra") entre bloques y
+    escribe (o suma) en un buffer float32 del llamador: no hay vector de
+    tiempo y la memoria de trabajo es de un bloque,
+  - blep=True: variantes de banda limitada con PolyBLEP (saltos de la
+    cuadrada y la sierra) y PolyBLAMP (quiebres de la triangular): se
+    corrigen sólo las muestras a menos de un paso de cada
+    discontinuidad. Es de 2º orden: el peor alias (armónicos plegados
+    cerca de Nyquist) baja sólo ~8-12 dB (sierra de 3 kHz a 44.1 kHz:
+    -18 → -27 dB respecto de la fundamental), pero los que caen por
+    debajo de la fundamental bajan 50-85 dB (-23 → -75 dB),
+  - `mezcla` escribe la suma de varias formas en un único buffer; si la
+    mezcla es periódica dentro de la señal, el pico para normalizar sale
+    de un solo período (sin la pasada extra),
+  - `bloques` es un generador de bloques de la mezcla sobre un buffer
+    reutilizado (memoria constante para estímulos largos),
+  - `n_zoom(t_max, fs)`: la ventana de zoom es aritmética de índices.
+Sin blep, las formas coinciden con `scipy.signal.square(2πft)` y
+`sawtooth(2πft, width)` (width=0.5 triangular, 1 sierra), salvo en las
+muestras que caen justo al inicio de un ciclo: ahí el `mod 2π` flotante
+de scipy queda apenas por debajo de 2π y da el valor del final del ciclo.
+"""
+from fractions import Fraction
+from math import lcm
+
+import numpy as np
+
+from dsp.wav import BLOQUE
+
+FORMAS = ("seno", "cuadrada", "triangular", "sierra")
+
+
+def n_zoom(t_max, fs):
+    """Muestras con t = n/fs ≤ t_max (como `t[t <= t_max]`, sin recorrer t)."""
+    return int(np.floor(t_max * fs * (1 + 1e-12))) + 1
+
+
+def eje_tiempo(n, fs, dtype=np.float64):
+    """Eje de tiempo de las primeras n muestras (para graficar un zoom)."""
+    return np.arange(n, dtype=dtype) / fs
+
+
+def _residuo_blep(tau):
+    """Escalón de banda limitada (núcleo triangular de 2 muestras) - escalón ideal."""
+    return np.where(tau >= 0, -0.5 * (1 - tau) ** 2, 0.5 * (1 + tau) ** 2)
+
+
+def _residuo_blamp(tau):
+    """Integral del residuo BLEP: corrección de un quiebre de pendiente unitaria."""
+    return np.where(tau >= 0, (1 - tau) ** 3, (1 + tau) ** 3) / 6
+
+
+def _corregir(y, p, dt, en, salto, residuo):
+    """Suma salto·residuo(τ) en las muestras a menos de dt ciclos de la fase `en`."""
+    d = (p - en + 0.5) % 1.0 - 0.5                       # distancia con signo [ciclos]
+    i = np.flatnonzero(np.abs(d) < dt)
+    if i.size:
+        y[i] += salto * residuo(d[i] / dt)
+
+
+def forma_onda(forma, p, dt=None):
+    """
+    Forma de onda en la fase p (ciclos en [0, 1)); con dt (= f/fs) aplica
+    PolyBLEP/PolyBLAMP. → float64 del largo de p.
+    """
+    if forma == "seno":
+        return np.sin(2 * np.pi * p)
+    if forma == "cuadrada":
+        y = np.where(p < 0.5, 1.0, -1.0)
+        if dt:
+            _corregir(y, p, dt, 0.0, 2.0, _residuo_blep)
+            _corregir(y, p, dt, 0.5, -2.0, _residuo_blep)
+        return y
+    if forma == "triangular":
+        y = 1.0 - 4.0 * np.abs(p - 0.5)
+        if dt:                                           # pendiente ±4·dt por muestra
+            _corregir(y, p, dt, 0.0, 8.0 * dt, _residuo_blamp)
+            _corregir(y, p, dt, 0.5, -8.0 * dt, _residuo_blamp)
+        return y
+    if forma == "sierra":
+        y = 2.0 * p - 1.0
+        if dt:
+            _corregir(y, p, dt, 0.0, -2.0, _residuo_blep)
+        return y
+    raise ValueError(f"forma desconocida: {forma!r} (use {FORMAS})")
+
+
+class Generador:
+    """
+    Una forma de onda de frecuencia f y amplitud A con la fase (en ciclos)
+    acumulada entre llamadas: `generar(out)` llena out con las próximas
+    out.size muestras; sumar=True las suma a lo que ya hay (mezclas).
+    """
+
+    def __init__(self, forma, f, fs, A=1.0, fase=0.0, blep=False, bloque=BLOQUE):
+        if forma not in FORMAS:
+            raise ValueError(f"forma desconocida: {forma!r} (use {FORMAS})")
+        assert 0 <= f < fs / 2 or not blep, "blep requiere f < fs/2"
+        self.forma, self.f, self.fs, self.A = forma, f, fs, A
+        self.dt = f / fs                                 # ciclos por muestra
+        self.fase = fase % 1.0
+        self.blep = blep
+        self.bloque = bloque
+
+    def generar(self, out, sumar=False):
+        for i0 in range(0, out.size, self.bloque):
+            m = min(self.bloque, out.size - i0)
+            p = np.arange(m, dtype=np.float64)
+            p *= self.dt
+            p += self.fase
+            p %= 1.0
+            y = forma_onda(self.forma, p, self.dt if self.blep else None)
+            y *= self.A
+            if sumar:
+                out[i0:i0 + m] += y
+            else:
+                out[i0:i0 + m] = y
+            self.fase = (self.fase + self.dt * m) % 1.0
+        return out
+
+    def periodo(self):
+        """Período exacto en muestras: denominador de f/fs (racional exacto del float)."""
+        return (Fraction(self.f) / Fraction(self.fs)).denominator
+
+
+def _generadores(componentes, fs, blep):
+    """componentes: [(forma, f) | (forma, f, A), ...] → lista de Generador."""
+    return [Generador(c[0], c[1], fs, c[2] if len(c) > 2 else 1.0, blep=blep) for c in componentes]
+
+
+def generar(forma, f, fs, n, A=1.0, blep=False, out=None, dtype=np.float32):
+    """n muestras de una forma de onda en `out` (o un buffer nuevo de dtype)."""
+    out = np.empty(n, dtype) if out is None else out
+    return Generador(forma, f, fs, A, blep=blep).generar(out)
+
+
+def _llenar(gens, y):
+    y[:] = 0
+    for g in gens:
+        g.generar(y, sumar=True)
+    return y
+
+
+def bloques(componentes, fs, n, bloque=BLOQUE, blep=False, out=None, dtype=np.float32):
+    """
+    Generador de bloques de la mezcla de `componentes` (n muestras en
+    total). Reutiliza un único buffer (`out` o uno de `bloque` muestras):
+    cada bloque entregado es válido hasta pedir el siguiente.
+    """
+    gens = _generadores(componentes, fs, blep)
+    buf = np.empty(bloque, dtype) if out is None else out
+    for i0 in range(0, n, buf.size):
+        yield _llenar(gens, buf[:min(buf.size, n - i0)])
+
+
+def mezcla(componentes, fs, n, normalizar=None, blep=False, out=None, dtype=np.float32,
+           bloque=BLOQUE):
+    """
+    Suma de `componentes` ([(forma, f, A), ...]) en n muestras de `out`,
+    por bloques. normalizar=a escala la mezcla a pico a: si la mezcla se
+    repite dentro de las n muestras el pico sale de un solo período; si
+    no, de una pasada sobre lo escrito.
+    """
+    out = np.empty(n, dtype) if out is None else out
+    gens = _generadores(componentes, fs, blep)
+    periodo = lcm(*(g.periodo() for g in gens)) if gens else 1
+    exacto = normalizar is not None and periodo <= min(n, 1 << 22)
+    if exacto:
+        pico = np.max(np.abs(_llenar(_generadores(componentes, fs, blep), np.empty(periodo))))
+        for g in gens:
+            g.A *= normalizar / pico
+    for i0 in range(0, n, bloque):
+        _llenar(gens, out[i0:i0 + bloque])
+    if normalizar is not None and not exacto:
+        out *= normalizar / np.max(np.abs(out))
+    return out
@@ -0,0 +1,167 @@
+"""
+Capa de gráficos sobre los motores de `dsp`.
+
+Los cálculos (dsp.stft, dsp.espectro, ...) no importan matplotlib; este
+módulo sólo dibuja arrays ya calculados. `espectrograma` dibuja sobre el
+`ax` que le pasa el script; las láminas `figura_*` (usadas por
+dsp.analisis con graficar=True) importan pyplot recién al llamarlas, con
+backend Agg si el proceso todavía no eligió otro.
+"""
+import sys
+
+import numpy as np
+
+from dsp.stft import stft
+
+
+def graficar_espectrograma(ax, freqs, times, Pxx, cmap="jet", **kw):
+    """
+    Dibuja Pxx (PSD) en dB con el mismo aspecto que plt.specgram
+    (imshow, extensión medio salto a cada lado). Devuelve la imagen
+    para fig.colorbar(im, ...).
+    """
+    Z = 10 * np.log10(Pxx + 1e-20)
+    med = (times[1] - times[0]) / 2 if times.size > 1 else times[0]
+    extent = (times[0] - med, times[-1] + med, freqs[0], freqs[-1])
+    im = ax.imshow(Z, origin="lower", aspect="auto", extent=extent, cmap=cmap, **kw)
+    ax.axis("auto")
+    return im
+
+
+def espectrograma(ax, x, fs, nfft=2048, noverlap=1024, cmap="jet", **kw):
+    """Reemplazo de ax.specgram: (Pxx, freqs, times, im) calculados con dsp.stft."""
+    freqs, times, Pxx = stft(x, fs, nfft=nfft, noverlap=noverlap)
+    im = graficar_espectrograma(ax, freqs, times, Pxx, cmap=cmap, **kw)
+    return Pxx, freqs, times, im
+
+
+# ------------------------------------------------------------------
+# Láminas de dsp.analisis (sólo se usan con graficar=True)
+# ------------------------------------------------------------------
+def _plt():
+    """pyplot importado recién al graficar; si nadie eligió backend, Agg."""
+    import matplotlib
+    if "matplotlib.pyplot" not in sys.modules:
+        matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    return plt
+
+
+def _cerrar(fig, guardar, dpi=150):
+    """
+    Con ruta: guarda, libera la figura y devuelve la ruta. Sin ruta:
+    devuelve la Figure abierta (para fig.show() / fig.savefig() del llamador).
+    """
+    if not guardar:
+        return fig
+    fig.savefig(guardar, dpi=dpi)
+    _plt().close(fig)
+    return guardar
+
+
+def figura_toma(x, fs, f, mag_db, f_est, titulo="Toma", guardar=None):
+    """Lámina de plot_take_all (clase03-06): tiempo 50 ms, espectro y espectrograma."""
+    plt = _plt()
+    fig, axes = plt.subplots(3, 1, figsize=(11, 9))
+    fig.suptitle(titulo)
+
+    nmax = int(min(len(x), 0.05 * fs))
+    axes[0].plot(np.arange(nmax) / fs, x[:nmax], linewidth=1.0)
+    axes[0].set_title("Tiempo (50 ms)")
+    axes[0].set_xlabel("Tiempo [s]"); axes[0].set_ylabel("Amplitud")
+    axes[0].grid(True, alpha=0.3)
+
+    axes[1].plot(f, mag_db)
+    axes[1].set_xlim(0, 2000)
+    axes[1].set_ylim(mag_db.max() - 80, mag_db.max() + 3)
+    axes[1].set_title(f"Espectro (0–2 kHz) — pico ≈ {f_est:.1f} Hz")
+    axes[1].set_xlabel("Frecuencia [Hz]"); axes[1].set_ylabel("Magnitud [dB]")
+    axes[1].grid(True, alpha=0.3)
+    axes[1].axvline(f_est, color="tab:red", linestyle="--", alpha=0.7)
+    if f_est > 0:                                     # armónicos (annotate_harmonics)
+        for h in range(1, int(2000 // f_est) + 1):
+            axes[1].axvline(h * f_est, color="tab:green", linestyle=":", alpha=0.5)
+
+    _, _, _, im = espectrograma(axes[2], x, fs, nfft=2048, noverlap=1024)
+    axes[2].set_ylim(0, 2000)
+    axes[2].set_title("Espectrograma")
+    axes[2].set_xlabel("Tiempo [s]"); axes[2].set_ylabel("Frecuencia [Hz]")
+    fig.colorbar(im, ax=axes[2]).set_label("dB")
+    fig.tight_layout(rect=[0, 0, 1, 0.96])
+    return _cerrar(fig, guardar)
+
+
+def figura_ema(x, Y, fs, alphas, ventana, f, Mx, MY, fmax=8000, guardar=None):
+    """Original vs EMA: tiempo (ventana más enérgica) y espectro en dB."""
+    plt = _plt()
+    i0, i1 = ventana
+    fig, axs = plt.subplots(2, 1, figsize=(10, 8))
+    t = np.arange(i1 - i0) / fs
+    s = max(np.max(np.abs(x[i0:i1])), 1e-12)          # norma local para visualizar
+    axs[0].plot(t, x[i0:i1] / s, "--", lw=1.1, label="Original (norm. local)")
+    axs[1].plot(f, Mx, "--", lw=1.0, label="Original")
+    for a, y, M in zip(alphas, Y, MY):
+        axs[0].plot(t, y[i0:i1] / s, lw=1.3, label=f"EMA (α={a})")
+        axs[1].plot(f, M, lw=1.2, label=f"EMA (α={a})")
+    axs[0].set_xlabel("Tiempo [s]"); axs[0].set_ylabel("Amplitud (norm)")
+    axs[1].set_xlim(0, fmax)
+    axs[1].set_xlabel("Frecuencia [Hz]"); axs[1].set_ylabel("Magnitud [dB]")
+    for ax in axs:
+        ax.grid(True, alpha=0.3); ax.legend()
+    fig.tight_layout()
+    return _cerrar(fig, guardar)
+
+
+def figura_snr(bits, snr_teo, snr_real, guardar=None):
+    """SNR teórico vs medido en función de los bits."""
+    plt = _plt()
+    fig, ax = plt.subplots(figsize=(8, 5))
+    ax.plot(bits, snr_teo, "--o", label="Teórico (6.02·N + 1.76)")
+    ax.plot(bits, snr_real, "-s", label="Medido")
+    ax.set_xlabel("Nbits"); ax.set_ylabel("SNR [dB]")
+    ax.grid(True, alpha=0.3); ax.legend()
+    fig.tight_layout()
+    return _cerrar(fig, guardar)
+
+
+def figura_am(t, senales, f, espectros, fmax=8000, guardar=None):
+    """Una fila por modulación: tiempo (10 ms) | espectro normalizado."""
+    plt = _plt()
+    fig, axs = plt.subplots(len(espectros), 2, figsize=(12, 2.5 * len(espectros)), squeeze=False)
+    for (nombre, M), ax in zip(espectros.items(), axs):
+        ax[0].plot(t, senales[nombre], linewidth=1.0)
+        ax[0].set_xlim(0.0, 0.010)
+        ax[0].set_title(f"{nombre} - tiempo")
+        ax[1].plot(f, M, linewidth=1.0)
+        ax[1].set_xlim(0, fmax)
+        ax[1].set_title(f"{nombre} - espectro")
+        for a in ax:
+            a.grid(True, alpha=0.35)
+    fig.tight_layout()
+    return _cerrar(fig, guardar)
+
+
+def figura_ojo(x_eye, Y, titulo="Diagrama de ojo", alpha_lines=0.08, guardar=None):
+    """Diagrama de ojo: todas las trazas en una sola llamada a plot."""
+    plt = _plt()
+    fig, ax = plt.subplots(figsize=(10, 4))
+    ax.plot(x_eye, Y.T, lw=1.0, alpha=alpha_lines)
+    ax.grid(True); ax.set_xlabel("Tiempo [símbolos]"); ax.set_ylabel("Amplitud")
+    ax.set_title(f"{titulo} (trazas={len(Y)})")
+    fig.tight_layout()
+    return _cerrar(fig, guardar)
+
+
+def figura_densidad_ojo(x, bordes, H, titulo="Diagrama de ojo", log=True, cmap="inferno",
+                        guardar=None):
+    """Ojo como UNA imagen: densidad (columnas × bins) de dsp.ojo, escala log opcional."""
+    plt = _plt()
+    fig, ax = plt.subplots(figsize=(10, 4))
+    D = np.log1p(H.T) if log else H.T
+    dx = x[1] - x[0] if len(x) > 1 else 1.0
+    ax.imshow(D, origin="lower", aspect="auto", cmap=cmap, interpolation="nearest",
+              extent=(x[0], x[-1] + dx, bordes[0], bordes[-1]))
+    ax.set_xlabel("Tiempo [símbolos]"); ax.set_ylabel("Amplitud")
+    ax.set_title(f"{titulo} (trazas={int(H[0].sum())})")
+    fig.tight_layout()
+    return _cerrar(fig, guardar)
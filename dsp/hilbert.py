@@ -0,0 +1,137 @@
+"""
+Señal analítica / transformada de Hilbert (antes `analytic_signal_fft`
+de clase06-12 y `scipy.signal.hilbert` en dsp.modulacion).
+
+`analytic_signal_fft` arma una máscara compleja en cada llamada y vuelve
+con `irfft`: el resultado es REAL (≈ 2·x, no x + j·x̂), y la "SSB" de
+clase06-12 salía doble banda lateral. Acá:
+  - `analitica(x)`: modo espectral completo y complejo, igual a
+    `scipy.signal.hilbert`: rFFT (mitad del costo de la FFT compleja de
+    entrada), máscara real 1, 2, ..., 2, (1) cacheada por largo en
+    dsp.cache, y una iFFT compleja. Acepta lotes (N, L) como `espectro`.
+  - `AnaliticaFIR`: modo de baja latencia para flujos por bloques. FIR
+    de Hilbert (ideal 2/(πn) en n impar, ventana de Kaiser, cacheado por
+    (taps, beta)) aplicado por overlap-add con la cola entre bloques; la
+    parte real es la entrada demorada (T-1)/2 muestras. La salida queda
+    alineada con la entrada (la demora se descuenta) y la memoria es la
+    de un bloque. Vale en la banda [≈ 4·fs/T, fs/2 - 4·fs/T]: para
+    mensajes graves hacen falta más taps.
+  - `ssb_bloques`: SSB (USB/LSB, con o sin portadora) de una señal
+    larga por bloques, con la fase de la portadora acumulada.
+"""
+import numpy as np
+import scipy.fft as sfft
+from scipy.signal import oaconvolve
+from scipy.signal.windows import kaiser
+
+from dsp import cache
+
+
+def mascara_analitica(N):
+    """Pesos sobre la rFFT de largo N: 1 en DC, 2 en las positivas, 1 en Nyquist (N par)."""
+    def crear():
+        h = np.full(N // 2 + 1, 2.0)
+        h[0] = 1.0
+        if N % 2 == 0:
+            h[-1] = 1.0
+        return cache._solo_lectura(h)
+    return cache.CACHE.obtener(("analitica", int(N)), crear)
+
+
+def analitica(x, N=None, workers=None):
+    """
+    Señal analítica x + j·x̂ por FFT sobre el último eje (como
+    scipy.signal.hilbert; N > len rellena con ceros). → complejo de largo N.
+    """
+    x = np.asarray(x)
+    N = x.shape[-1] if N is None else N
+    workers = cache.WORKERS if workers is None else workers
+    X = sfft.rfft(x, n=N, axis=-1, workers=workers)
+    X *= mascara_analitica(N)
+    Z = np.zeros(x.shape[:-1] + (N,), dtype=X.dtype)
+    Z[..., :X.shape[-1]] = X                             # frecuencias negativas en 0
+    return sfft.ifft(Z, axis=-1, workers=workers, overwrite_x=True)
+
+
+def transformada_hilbert(x, N=None):
+    """x̂: parte imaginaria de la señal analítica."""
+    return analitica(x, N).imag
+
+
+def fir_hilbert(taps=255, beta=8.0):
+    """
+    FIR de Hilbert de `taps` coeficientes (impar): 2/(πn) en n impar y 0
+    en n par, con ventana de Kaiser (sólo lectura, cacheado).
+    """
+    assert taps % 2 == 1, "taps debe ser impar (demora entera)"
+
+    def crear():
+        n = np.arange(taps) - (taps - 1) // 2
+        h = np.zeros(taps)
+        impar = n % 2 != 0
+        h[impar] = 2.0 / (np.pi * n[impar])
+        return cache._solo_lectura(h * kaiser(taps, beta))
+    return cache.CACHE.obtener(("fir_hilbert", int(taps), float(beta)), crear)
+
+
+class AnaliticaFIR:
+    """
+    Señal analítica por bloques con el FIR de Hilbert: `procesar(x)`
+    devuelve las muestras complejas ya calculables y `fin()` las últimas
+    (la demora de (taps-1)/2 se descuenta: salida k ↔ entrada k).
+    """
+
+    def __init__(self, taps=255, beta=8.0):
+        self.h = fir_hilbert(taps, beta)
+        self.D = (taps - 1) // 2
+        self.cola = np.zeros(taps - 1)                   # overlap-add pendiente
+        self.linea = np.zeros(self.D)                    # entrada demorada D muestras
+        self.saltar = self.D                             # salidas de arranque a descartar
+
+    def _bloque(self, x):
+        y = oaconvolve(x, self.h) if x.size else np.zeros(self.cola.size)
+        y[:self.cola.size] += self.cola
+        imag, self.cola = y[:x.size], y[x.size:].copy()
+        real = np.concatenate([self.linea, x])
+        real, self.linea = real[:x.size], real[x.size:]
+        z = real + 1j * imag
+        k = min(self.saltar, z.size)
+        self.saltar -= k
+        return z[k:]
+
+    def procesar(self, x):
+        return self._bloque(np.asarray(x, dtype=np.float64))
+
+    def fin(self):
+        return self._bloque(np.zeros(self.D))
+
+
+def ssb_bloques(bloques, fs, fc, banda="usb", Ac=0.0, taps=255, beta=8.0):
+    """
+    Generador: SSB de un flujo de bloques del mensaje, Re{m_a·e^{j2πfc·t}}
+    (banda="lsb": con el conjugado) + Ac·sin(2πfc·t), con la fase de la
+    portadora acumulada entre bloques. Misma cantidad de muestras que la entrada.
+    """
+    if banda not in ("usb", "lsb"):
+        raise ValueError(f"banda desconocida: {banda!r} (use 'usb' o 'lsb')")
+    a = AnaliticaFIR(taps, beta)
+    dt, fase = fc / fs, 0.0                              # ciclos por muestra
+
+    def modular(z):
+        nonlocal fase
+        p = fase + dt * np.arange(z.size)
+        fase = (fase + dt * z.size) % 1.0
+        if banda == "lsb":
+            z = np.conj(z)
+        y = np.real(z * np.exp(2j * np.pi * p))
+        if Ac:
+            y += Ac * np.sin(2 * np.pi * p)
+        return y
+
+    for b in bloques:
+        z = a.procesar(b)
+        if z.size:
+            yield modular(z)
+    z = a.fin()
+    if z.size:
+        yield modular(z)
@@ -0,0 +1,166 @@
+"""
+Enlace PAM por bloques (fuente → conformador → canal → receptor/ojo)
+con memoria que no depende del largo de la secuencia.
+
+clase09 arma de una vez los símbolos, la secuencia extendida `xn` y la
+señal `yn` completas, y en cada corrida descarta el transitorio
+(`start_sym = L`). Con fB = 32e9 y M = 8, unos microsegundos de enlace ya
+son millones de muestras float64. Acá cada etapa procesa un bloque y
+guarda su estado:
+  - fuente: bloques de índices de nivel de un único `default_rng`,
+  - transmisor: `pam.Conformador` (polifásico, arrastra los últimos
+    símbolos entre bloques),
+  - canal: AWGN (Eb/N0) y, opcional, un FIR de ISI con el estado de
+    `lfilter` (zi) entre bloques,
+  - receptor: filtro adaptado causal (también con zi) y decisión cada M
+    muestras en la fase óptima; el ojo (`ojo.DensidadOjo`) se acumula
+    sobre la misma salida y los errores se cuentan contra una cola de
+    los símbolos enviados que sólo guarda los aún no decididos.
+El transitorio aparece una sola vez, al arrancar el flujo: los bordes de
+bloque no tienen transitorio porque ningún filtro se reinicia.
+
+    from dsp.modem import Modem
+    r = Modem(ebn0_db=10).correr(10**7)      # {'ser': ..., 'ber': ..., 'ojo': ...}
+"""
+import numpy as np
+from scipy.signal import lfilter
+
+from dsp.ber import fase_optima, niveles_pam, tabla_errores_bit
+from dsp.ojo import DensidadOjo, metricas_ojo
+from dsp.pam import Conformador, PULSOS
+
+
+def fuente_simbolos(n, m=4, bloque=1 << 14, rng=None):
+    """Generador de bloques de índices de nivel (0..m-1), n en total."""
+    rng = np.random.default_rng(rng)
+    for i in range(0, n, bloque):
+        yield rng.integers(0, m, size=min(bloque, n - i))
+
+
+class Canal:
+    """AWGN de desvío `sigma` sobre un FIR de ISI opcional (`taps`), con estado entre bloques."""
+
+    def __init__(self, sigma=0.0, taps=None, rng=None):
+        self.sigma = sigma
+        self.taps = None if taps is None else np.asarray(taps, dtype=np.float64)
+        self.zi = None if self.taps is None else np.zeros(self.taps.size - 1)
+        self.rng = np.random.default_rng(rng)
+
+    @property
+    def retardo(self):
+        """Muestras de retardo del camino principal del FIR (0 sin FIR)."""
+        return 0 if self.taps is None else int(np.argmax(np.abs(self.taps)))
+
+    def procesar(self, y):
+        if not y.size:                                   # bloque vacío: el estado no cambia
+            return y
+        if self.taps is not None:
+            y, self.zi = lfilter(self.taps, 1.0, y, zi=self.zi)
+        if self.sigma:
+            y = y + self.sigma * self.rng.standard_normal(y.size)
+        return y
+
+
+class Receptor:
+    """
+    Filtro adaptado causal (g invertido, estado zi entre bloques) y
+    decisión en las muestras k = j·M + D (D = retardo total + fase):
+    `procesar(r)` → (z normalizada, j0, decisiones de los símbolos j0, j0+1, ...).
+    """
+
+    def __init__(self, g, M, fase, ganancia, m, retardo=0):
+        self.b = np.ascontiguousarray(g[::-1])
+        self.zi = np.zeros(len(g) - 1)
+        self.M, self.m = M, m
+        self.D = (len(g) - 1) // 2 + retardo + fase      # (len-1)/2: retardo del filtro causal
+        self.ganancia = ganancia
+        self.k = 0                                       # índice global de la próxima muestra
+
+    def procesar(self, r):
+        if not r.size:                                   # bloque vacío: el estado no cambia
+            return r, 0, np.zeros(0, np.intp)
+        z, self.zi = lfilter(self.b, 1.0, r, zi=self.zi)
+        z /= self.ganancia
+        s0 = max(0, self.D - self.k)                     # primera muestra de decisión del bloque
+        s0 += (-(self.k + s0 - self.D)) % self.M
+        j0 = (self.k + s0 - self.D) // self.M
+        v = z[s0::self.M]
+        dec = np.clip(np.rint((v + (self.m - 1)) / 2), 0, self.m - 1).astype(np.intp)
+        self.k += r.size
+        return z, j0, dec
+
+
+class Modem:
+    """
+    Enlace PAM-m completo por bloques. `correr(n)` cuenta n símbolos
+    después de `descarte` (transitorio inicial, por defecto 2L) y devuelve
+    {'simbolos', 'errores_simbolo', 'ser', 'errores_bit', 'ber', 'ojo': (x, bordes, H),
+     'metricas_ojo': {...}}. ebn0_db=None → canal sin ruido.
+    """
+
+    def __init__(self, m=4, M=8, alpha=0.1, L=20, pulso="rrc", ebn0_db=None, taps=None,
+                 seed=0, bloque=1 << 14, ojo=True, nbins=256, descarte=None):
+        self.m, self.M, self.L = m, M, L
+        self.g = np.array(PULSOS[pulso](M, alpha, L))
+        self.fase, self.ganancia = fase_optima(self.g, M, m)
+        self.niveles = niveles_pam(m)
+        self.bits = tabla_errores_bit(m)
+        self.ebn0_db, self.taps = ebn0_db, taps
+        self.seed, self.bloque = seed, bloque
+        self.ojo, self.nbins = ojo, nbins
+        self.descarte = 2 * L if descarte is None else descarte
+
+    def _sigma(self):
+        if self.ebn0_db is None:
+            return 0.0
+        es = np.mean(self.niveles ** 2) * np.sum(self.g ** 2)
+        n0 = es / (np.log2(self.m) * 10 ** (self.ebn0_db / 10))
+        return float(np.sqrt(n0 / 2))
+
+    def correr(self, n):
+        rng_fuente, rng_canal = (np.random.default_rng(s)
+                                 for s in np.random.SeedSequence(self.seed).spawn(2))
+        M, L = self.M, self.L
+        total = self.descarte + n + L                    # + L: la cola del último contado
+        tx = Conformador.desde_pulso(self.g, M)
+        canal = Canal(self._sigma(), self.taps, rng_canal)
+        rx = Receptor(self.g, M, self.fase, self.ganancia, self.m, canal.retardo)
+        a = self.m - 1
+        ojo = DensidadOjo(M, 2, (-a - 3.0, a + 3.0), self.nbins,
+                          descarte=rx.D + (self.descarte - 1) * M, max_trazas=n) if self.ojo else None
+
+        pend, base = np.zeros(0, np.intp), 0             # símbolos enviados aún sin decidir
+        cont = {"simbolos": 0, "errores_simbolo": 0, "errores_bit": 0}
+
+        def recibir(y):
+            nonlocal pend, base
+            if not y.size:                               # el conformador aún no tiene salidas
+                return
+            z, j0, dec = rx.procesar(canal.procesar(y))
+            if ojo is not None:
+                ojo.actualizar(z)
+            j = j0 + np.arange(dec.size)
+            ok = (j >= self.descarte) & (j < self.descarte + n) & (j - base < pend.size)
+            if np.any(ok):
+                s = pend[j[ok] - base]
+                d = dec[ok]
+                cont["simbolos"] += int(s.size)
+                cont["errores_simbolo"] += int(np.count_nonzero(s != d))
+                cont["errores_bit"] += int(self.bits[s, d].sum())
+            if dec.size:                                 # lo decidido ya no hace falta
+                hasta = max(0, min(j0 + dec.size - base, pend.size))
+                pend, base = pend[hasta:], base + hasta
+
+        for idx in fuente_simbolos(total, self.m, self.bloque, rng_fuente):
+            pend = np.concatenate([pend, idx])
+            recibir(tx.procesar(self.niveles[idx]))
+        recibir(tx.fin())
+
+        k = np.log2(self.m)
+        bits = int(cont["simbolos"] * k)
+        r = {**cont, "ser": cont["errores_simbolo"] / max(cont["simbolos"], 1),
+             "ber": cont["errores_bit"] / max(bits, 1), "bits": bits}
+        if ojo is not None:
+            r["ojo"] = ojo.resultado()
+            r["metricas_ojo"] = metricas_ojo(*r["ojo"], niveles=self.niveles)
+        return r
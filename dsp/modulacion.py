@@ -0,0 +1,22 @@
+"""
+Modulaciones AM (antes en clase06-12): DSB-FC, DSB-SC y SSB (USB).
+
+La banda lateral única se arma con la señal analítica de dsp.hilbert
+(complejo x + j·x̂, igual a scipy.signal.hilbert; para señales largas
+por bloques, `hilbert.ssb_bloques`).
+"""
+import numpy as np
+
+from dsp.hilbert import analitica
+
+
+def senales_am(t, fm=200.0, fc=5_000.0, Am=1.0, Ac=1.0):
+    """
+    Mensaje, portadora y las cuatro modulaciones sobre el eje t:
+      m, c, dsb_fc = (1+m)·c, dsb_sc = m·c, ssb_sc (USB), ssb_fc = ssb_sc + c.
+    """
+    m = Am * np.sin(2*np.pi*fm*t)
+    c = Ac * np.sin(2*np.pi*fc*t)
+    ssb_sc = np.real(analitica(m) * np.exp(1j*2*np.pi*fc*t))
+    return {"m": m, "c": c, "dsb_fc": (1 + m) * c, "dsb_sc": m * c,
+            "ssb_fc": ssb_sc + c, "ssb_sc": ssb_sc}
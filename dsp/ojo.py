@@ -0,0 +1,149 @@
+"""
+Diagrama de ojo como densidad (histograma 2-D) en lugar de trazas.
+
+clase09 dibuja el ojo con un `plt.plot` por traza: el tiempo crece con
+la cantidad de trazas y la memoria se va en objetos Line2D (2000-3000
+trazas ya pesan). Acá:
+  - las trazas son una vista con strides (trazas × spans·M) de la señal,
+    sin copiar; con sobremuestreo=U se interpolan linealmente U puntos
+    por muestra (como la persistencia de un osciloscopio),
+  - cada bloque de trazas se acumula en un histograma 2-D (columna de
+    tiempo × bin de amplitud) con un solo `np.bincount`: millones de
+    trazas en menos de un segundo, y el resultado es UNA imagen,
+  - `DensidadOjo` acumula por bloques con estado (p. ej. la salida de
+    `pam.senal_pam_bloques`): la memoria no depende del largo,
+  - `metricas_ojo` mide alto y ancho de cada sub-ojo PAM4 directo sobre
+    la densidad: en cada columna, el hueco vacío alrededor del umbral
+    entre niveles contiguos.
+"""
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from dsp.pam import NIVELES_PAM4
+
+
+class DensidadOjo:
+    """
+    Histograma 2-D del ojo acumulado por bloques: `actualizar(y)` suma las
+    trazas completas del bloque (guarda la cola para el próximo) y
+    `resultado()` devuelve (x [símbolos], bordes_y, H (columnas, nbins)).
+    Las trazas arrancan cada M muestras desde la muestra `descarte`; los
+    puntos fuera de `rango` no se cuentan (quedan en `fuera`).
+    """
+
+    def __init__(self, M, spans=2, rango=(-6.0, 6.0), nbins=256, sobremuestreo=1,
+                 descarte=0, max_trazas=None, bloque_trazas=1 << 14):
+        self.M, self.spans, self.U = M, spans, sobremuestreo
+        self.seg = spans * M
+        self.largo = self.seg + (1 if sobremuestreo > 1 else 0)   # +1: interpolar la última
+        self.ncol = self.seg * sobremuestreo
+        self.bordes = np.linspace(rango[0], rango[1], nbins + 1)
+        self.nbins = nbins
+        self.escala = nbins / (rango[1] - rango[0])
+        self.H = np.zeros(self.ncol * nbins, dtype=np.int64)
+        self.trazas = 0
+        self.fuera = 0                                   # puntos fuera de `rango`
+        self.max_trazas = max_trazas
+        self.bloque_trazas = bloque_trazas
+        self._saltar = descarte
+        self._cola = np.zeros(0)
+        a = np.arange(sobremuestreo) / sobremuestreo     # posición dentro de cada muestra
+        self._a = a[None, None, :].astype(np.float32)
+        self._col = (np.arange(self.ncol) * nbins)[None, :]
+
+    def _acumular(self, Y):
+        Y = (Y - self.bordes[0]) * self.escala           # en unidades de bin
+        if self.U > 1:                                   # (n, seg+1) → (n, seg·U) lineal
+            Y = Y.astype(np.float32)
+            d = Y[:, 1:] - Y[:, :-1]
+            Y = (Y[:, :-1, None] + d[:, :, None] * self._a).reshape(len(Y), -1)
+        b = np.floor(Y, out=Y).astype(np.intp)
+        ok = (b >= 0) & (b < self.nbins)
+        self.fuera += int(ok.size - np.count_nonzero(ok))
+        b += self._col
+        self.H += np.bincount(b[ok], minlength=self.H.size)
+
+    def actualizar(self, y):
+        y = np.asarray(y, dtype=np.float64)
+        if self._saltar:
+            k = min(self._saltar, y.size)
+            y, self._saltar = y[k:], self._saltar - k
+        buf = np.concatenate([self._cola, y]) if self._cola.size else y
+        n = (buf.size - self.largo) // self.M + 1 if buf.size >= self.largo else 0
+        if self.max_trazas is not None:
+            n = max(0, min(n, self.max_trazas - self.trazas))
+        if n == 0:                                       # menos de una traza: todo a la cola
+            lleno = self.max_trazas is not None and self.trazas >= self.max_trazas
+            self._cola = np.zeros(0) if lleno else buf.copy()
+            return self
+        W = sliding_window_view(buf, self.largo)[::self.M][:n]
+        for i in range(0, n, self.bloque_trazas):
+            self._acumular(W[i:i + self.bloque_trazas])
+        self.trazas += n
+        lleno = self.max_trazas is not None and self.trazas >= self.max_trazas
+        self._cola = np.zeros(0) if lleno else buf[n * self.M:].copy()
+        return self
+
+    def resultado(self):
+        x = np.arange(self.ncol) / (self.M * self.U)
+        return x, self.bordes, self.H.reshape(self.ncol, self.nbins)
+
+
+def densidad_ojo(y, M, spans=2, start_sym=0, max_trazas=None, rango=None, nbins=256,
+                 sobremuestreo=1):
+    """
+    Histograma 2-D del ojo de y (M muestras/símbolo, trazas de `spans`
+    símbolos desde start_sym; rango=None → mínimo y máximo de y).
+    → (x [símbolos], bordes_y, H (columnas, nbins)).
+    """
+    if rango is None:
+        v = np.asarray(y)[start_sym * M:]
+        lo, hi = float(v.min()), float(v.max())
+        rango = (lo, hi + (hi - lo) * 1e-9 + 1e-12)          # el máximo cae dentro del último bin
+    d = DensidadOjo(M, spans, rango, nbins, sobremuestreo, descarte=start_sym * M,
+                    max_trazas=max_trazas)
+    return d.actualizar(y).resultado()
+
+
+def _hueco(ocupado, k):
+    """(abajo, arriba): bins ocupados más cercanos a k por debajo y por encima (-1/n si no hay)."""
+    n = ocupado.shape[-1]
+    idx = np.arange(n)
+    abajo = np.where(ocupado & (idx <= k), idx, -1).max(axis=-1)
+    arriba = np.where(ocupado & (idx > k), idx, n).min(axis=-1)
+    return abajo, arriba
+
+
+def metricas_ojo(x, bordes, H, niveles=NIVELES_PAM4, min_cuentas=1):
+    """
+    Alto y ancho de cada sub-ojo (entre niveles contiguos) sobre la
+    densidad. Alto en cada columna: hueco sin puntos (bins con menos de
+    `min_cuentas`) alrededor del umbral (lo + hi)/2. Alto del sub-ojo: el
+    máximo sobre las columnas (en su fase, en símbolos); ancho: columnas
+    contiguas con hueco abierto alrededor de esa fase, en símbolos.
+    Devuelve {'fases', 'alturas', 'anchos', 'altura_min', 'ancho_min'}.
+    """
+    ocupado = H >= min_cuentas
+    dx = x[1] - x[0] if len(x) > 1 else 1.0
+    fases, alturas, anchos = [], [], []
+    for lo, hi in zip(niveles[:-1], niveles[1:]):
+        k = int(np.clip(np.searchsorted(bordes, (lo + hi) / 2) - 1, 0, H.shape[1] - 1))
+        abajo, arriba = _hueco(ocupado, k)
+        alto = np.where(ocupado[:, k], 0.0,
+                        bordes[np.minimum(arriba, H.shape[1])] - bordes[abajo + 1])
+        c = int(np.argmax(alto))
+        abierto = alto > 0
+        n, i0, i1 = len(abierto), 0, 0                   # columnas abiertas a cada lado de c,
+        if abierto[c]:                                   # circular: la traza repite cada símbolo
+            while i0 < n - 1 and abierto[(c - i0 - 1) % n]:
+                i0 += 1
+            while i0 + i1 < n - 1 and abierto[(c + i1 + 1) % n]:
+                i1 += 1
+            ancho = (i0 + i1 + 1) * dx
+        else:
+            ancho = 0.0
+        fases.append(float(x[c]))
+        alturas.append(float(alto[c]))
+        anchos.append(float(ancho))
+    return {"fases": fases, "alturas": alturas, "anchos": anchos,
+            "altura_min": min(alturas), "ancho_min": min(anchos)}
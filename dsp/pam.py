@@ -0,0 +1,194 @@
+"""
+PAM con pulso raised-cosine y diagrama de ojo (antes en clase09).
+
+Transmisión: clase09 arma la secuencia extendida (`xn[0::M] = símbolos`,
+ceros en el resto) y la convoluciona con g[n]: 7 de cada 8 productos son
+por cero y la secuencia extendida ocupa M veces la de símbolos. Acá el
+conformador es polifásico: g[n] partido en M sub-filtros (uno por fase
+de salida, ≈ 2L+1 coeficientes cada uno) que actúan directo sobre los
+símbolos; un producto matriz-vector por bloque de símbolos da las M
+fases juntas. `Conformador` procesa por bloques con estado y la salida
+es la misma que `np.convolve(xn, gn, "same")`. Los pulsos RC/RRC quedan
+en dsp.cache por (M, alpha, L).
+"""
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from dsp import cache
+
+NIVELES_PAM4 = np.array([-3, -1, +1, +3], dtype=float)
+
+
+def pulso_rc(M=8, alpha=0.1, L=20):
+    """Raised-cosine g[n] de ±L símbolos con M muestras/símbolo, pico 1 (cacheado, sólo lectura)."""
+    def crear():
+        x = np.arange(-L, L + 1/M, 1/M)                 # t/T
+        gn = np.zeros_like(x, dtype=float)
+        num = np.sinc(x) * np.cos(np.pi * alpha * x)
+        den = 1 - (2*alpha*x)**2
+        ok = np.abs(den) > 1e-12
+        gn[ok] = num[ok] / den[ok]
+        sing = np.isclose(np.abs(x), 1/(2*alpha), atol=1e-12)
+        gn[sing] = (np.pi/4.0) * np.sinc(1/(2*alpha))
+        return cache._solo_lectura(gn / np.max(gn))
+    return cache.CACHE.obtener(("pulso_rc", int(M), float(alpha), int(L)), crear)
+
+
+def pulso_rrc(M=8, alpha=0.1, L=20):
+    """
+    Root raised-cosine de ±L símbolos (cacheado, sólo lectura), con energía
+    Σg² = 1: la cascada TX ⊛ filtro adaptado es un raised-cosine de pico 1.
+    """
+    def crear():
+        x = np.arange(-L, L + 1/M, 1/M)                 # t/T
+        a = alpha
+        with np.errstate(divide="ignore", invalid="ignore"):
+            gn = (np.sin(np.pi*x*(1 - a)) + 4*a*x*np.cos(np.pi*x*(1 + a))) / \
+                 (np.pi*x*(1 - (4*a*x)**2))
+        gn[np.isclose(x, 0, atol=1e-12)] = 1 - a + 4*a/np.pi
+        if a > 0:
+            sing = np.isclose(np.abs(x), 1/(4*a), atol=1e-12)
+            gn[sing] = a/np.sqrt(2) * ((1 + 2/np.pi)*np.sin(np.pi/(4*a)) +
+                                       (1 - 2/np.pi)*np.cos(np.pi/(4*a)))
+        return cache._solo_lectura(gn / np.sqrt(np.sum(gn**2)))
+    return cache.CACHE.obtener(("pulso_rrc", int(M), float(alpha), int(L)), crear)
+
+
+PULSOS = {"rc": pulso_rc, "rrc": pulso_rrc}
+
+
+def fases_pulso(gn, M):
+    """
+    g[n] partido en M sub-filtros para la alineación "same": la salida
+    y[j·M + φ] = Σ_k H[φ, k]·s[j + m_max - k], con H[φ, k] = g[(m_max-k)·M + φ + c]
+    (c = (len(g)-1)//2, ceros fuera de g). Devuelve (H (M, K), m_max).
+    """
+    Lg, c = len(gn), (len(gn) - 1) // 2
+    m_min = -((c + M - 1) // M)                        # ceil(-(c + φ)/M), mínimo en φ = M-1
+    m_max = (Lg - 1 - c) // M
+    m = np.arange(m_max, m_min - 1, -1)                # K coeficientes, de m_max a m_min
+    idx = m[None, :] * M + np.arange(M)[:, None] + c   # (M, K) índices en g
+    ok = (idx >= 0) & (idx < Lg)
+    H = np.where(ok, np.asarray(gn)[np.clip(idx, 0, Lg - 1)], 0.0)
+    return H, int(m_max)
+
+
+def banco_pulso(M=8, alpha=0.1, L=20, tipo="rc"):
+    """fases_pulso del pulso `tipo` ("rc" o "rrc"), cacheado por (M, alpha, L)."""
+    if tipo not in PULSOS:
+        raise ValueError(f"tipo de pulso desconocido: {tipo!r} (use {tuple(PULSOS)})")
+
+    def crear():
+        H, m_max = fases_pulso(PULSOS[tipo](M, alpha, L), M)
+        return cache._solo_lectura(H), m_max
+    return cache.CACHE.obtener(("banco_pulso", tipo, int(M), float(alpha), int(L)), crear)
+
+
+def simbolos_pam(Nsym, niveles=NIVELES_PAM4, seed=123):
+    """Nsym símbolos equiprobables de `niveles`."""
+    rng = np.random.default_rng(seed)
+    return niveles[rng.integers(0, len(niveles), size=Nsym)]
+
+
+class Conformador:
+    """
+    Transmisor PAM polifásico por bloques: `procesar(simbolos)` devuelve las
+    muestras ya calculables (M por símbolo) y `fin()` las últimas (cola de
+    símbolos en cero). En total salen N·M muestras, alineadas como
+    `np.convolve(xn, gn, "same")`. H: banco (M, K) de `fases_pulso`.
+    """
+
+    def __init__(self, H, m_max, dtype=np.float64):
+        self.H = np.asarray(H, dtype=dtype)
+        self.M, self.K = self.H.shape
+        self.m_max = m_max                              # símbolos de "pasado" por salida
+        self.futuro = self.K - 1 - m_max                # símbolos de "futuro" por salida
+        self.dtype = np.dtype(dtype)
+        self.n_in = 0                                   # símbolos recibidos
+        self.j = 0                                      # próximo símbolo de salida
+        self.buf = np.zeros(m_max, self.dtype)          # s[j - m_max .. ] (ceros a la izquierda)
+
+    @classmethod
+    def desde_pulso(cls, gn, M, dtype=np.float64):
+        return cls(*fases_pulso(gn, M), dtype=dtype)
+
+    @classmethod
+    def rc(cls, M=8, alpha=0.1, L=20, tipo="rc", dtype=np.float64):
+        return cls(*banco_pulso(M, alpha, L, tipo), dtype=dtype)
+
+    def _salidas(self, j1):
+        n = max(j1 - self.j, 0)
+        if not n:
+            return np.zeros(0, self.dtype)
+        W = sliding_window_view(self.buf, self.K)[:n]   # W[i] = s[j+i-m_max .. j+i+futuro]
+        y = (W @ self.H.T).ravel()                      # (n, M) → n·M muestras
+        self.buf = self.buf[n:]
+        self.j += n
+        return y
+
+    def procesar(self, simbolos):
+        s = np.asarray(simbolos, dtype=self.dtype)
+        self.buf = np.concatenate([self.buf, s])
+        self.n_in += s.size
+        return self._salidas(self.n_in - self.futuro)
+
+    def fin(self):
+        self.buf = np.concatenate([self.buf, np.zeros(self.futuro, self.dtype)])
+        return self._salidas(self.n_in)
+
+
+def senal_pam(simbolos, gn, M, bloque=1 << 14, out=None):
+    """
+    Símbolos conformados con g[n] (M muestras/símbolo): igual a convolucionar
+    la secuencia extendida con g ("same"), pero polifásico y por bloques.
+    """
+    c = Conformador.desde_pulso(gn, M)
+    simbolos = np.asarray(simbolos)
+    out = np.empty(simbolos.size * M) if out is None else out
+    i = 0
+    for k in range(0, simbolos.size, bloque):
+        y = c.procesar(simbolos[k:k + bloque])
+        out[i:i + y.size] = y
+        i += y.size
+    y = c.fin()
+    out[i:i + y.size] = y
+    return out
+
+
+def senal_pam_bloques(bloques, M=8, alpha=0.1, L=20, tipo="rc", dtype=np.float64):
+    """Generador: conforma un flujo de bloques de símbolos (memoria acotada al bloque)."""
+    c = Conformador.rc(M, alpha, L, tipo, dtype)
+    for b in bloques:
+        y = c.procesar(b)
+        if y.size:
+            yield y
+    y = c.fin()
+    if y.size:
+        yield y
+
+
+def trazas_ojo(y, M, spans=2, start_sym=20, ntraces=1000):
+    """(x_eye, Y): trazas de `spans` símbolos como vista (n, spans·M) sin copiar."""
+    seg = spans * M
+    start = start_sym * M
+    n = len(range(start, len(y) - seg, M))           # mismas trazas que eye_diagram
+    Y = np.lib.stride_tricks.sliding_window_view(y[start:], seg)[::M][:min(ntraces, n)]
+    return np.linspace(0, spans, seg, endpoint=False), Y
+
+
+def apertura_ojo(y, simbolos, M, niveles=NIVELES_PAM4, descarte=20):
+    """
+    Apertura vertical de cada sub-ojo (entre niveles contiguos) en la fase
+    de muestreo que la maximiza. Descarta `descarte` símbolos en cada borde.
+    Devuelve {'fase', 'aperturas', 'apertura_min'}.
+    """
+    s = simbolos[descarte:len(simbolos) - descarte]
+    mejor = None
+    for fase in range(M):
+        v = y[(np.arange(descarte, descarte + s.size) * M + fase) % len(y)]
+        ab = [float(np.min(v[s == hi]) - np.max(v[s == lo]))
+              for lo, hi in zip(niveles[:-1], niveles[1:])]
+        if mejor is None or min(ab) > min(mejor[1]):
+            mejor = (fase, ab)
+    fase, ab = mejor
+    return {"fase": fase, "aperturas": ab, "apertura_min": min(ab)}
@@ -0,0 +1,178 @@
+"""
+Seguimiento de pitch por tramas.
+
+`peak_interp_parabolic` (clase03-06) estima UN pitch por toma: arma una
+máscara booleana sobre todo el eje de frecuencias en cada llamada y
+rellena a ≥ 2^14 puntos. Acá:
+  - la banda [fmin, fmax] se convierte una vez en un rango de índices
+    (bins o retardos) y sólo ese rango se recorre,
+  - el argmax y el ajuste parabólico sub-bin son vectorizados sobre
+    todas las tramas de un lote a la vez,
+  - las tramas son vistas con strides y la FFT es por lotes (dsp.cache).
+Métodos:
+  - "fft": pico del espectro Hann (parábola sobre log|X|).
+  - "yin": YIN (de Cheveigné & Kawahara 2002), función diferencia vía FFT.
+  - "acf": primer pico (≥ 90 % del máximo) de la autocorrelación normalizada.
+Acepta un array o un `dsp.wav.WavPCM` (se lee por lotes de tramas, con
+memoria constante: un archivo de una hora no se carga entero).
+
+Uso:
+    python -m dsp.pitch archivo.wav [fft|yin|acf]
+"""
+import sys
+
+import numpy as np
+import scipy.fft as sfft
+
+from dsp import cache
+from dsp.stft import tramas
+from dsp.wav import WavPCM
+
+TRAMAS_POR_LOTE = 1024
+
+
+def rango_bins(nfft, fs, fmin, fmax):
+    """Índices [k0, k1) de rfftfreq(nfft, 1/fs) dentro de [fmin, fmax]."""
+    f = cache.eje_frec(nfft, fs)
+    k0, k1 = int(np.searchsorted(f, fmin, "left")), int(np.searchsorted(f, fmax, "right"))
+    return max(k0, 1), min(max(k1, k0 + 1), len(f) - 1)     # vecinos válidos para la parábola
+
+
+def rango_retardos(nfft, fs, fmin, fmax):
+    """Retardos [τ0, τ1) para buscar periodos entre 1/fmax y 1/fmin (τ1 ≤ nfft/2)."""
+    t0 = max(int(np.floor(fs / fmax)), 2)
+    t1 = min(int(np.ceil(fs / fmin)) + 1, nfft // 2)
+    return t0, max(t1, t0 + 1)
+
+
+def parabola(y, k):
+    """
+    Desplazamiento sub-muestra del extremo en k de cada fila de y (2-D),
+    con los vecinos k-1, k+1: p = (a - c) / (2(a - 2b + c)).
+    """
+    filas = np.arange(y.shape[0])
+    a, b, c = y[filas, k - 1], y[filas, k], y[filas, k + 1]
+    den = a - 2 * b + c
+    return np.where(np.abs(den) > 1e-12, 0.5 * (a - c) / np.where(den == 0, 1, den), 0.0)
+
+
+def _pitch_fft(T, fs, k0, k1, workers):
+    nfft = T.shape[1]
+    X = cache.rfft(T * cache.ventana("hann", nfft, False, T.dtype), workers=workers)
+    mag = np.abs(X)
+    k = k0 + np.argmax(mag[:, k0:k1], axis=1)
+    p = parabola(np.log(mag + 1e-20), k)
+    banda = np.sum(mag[:, k0:k1] ** 2, axis=1) + 1e-20
+    filas = np.arange(len(k))
+    pico = mag[filas, k - 1] ** 2 + mag[filas, k] ** 2 + mag[filas, k + 1] ** 2
+    return (k + p) * fs / nfft, np.minimum(pico / banda, 1.0)
+
+
+def _diferencia(T, tmax, workers):
+    """
+    Función diferencia de YIN para τ = 0..tmax-1 con ventana de integración
+    W = nfft - tmax: d(τ) = E(0) + E(τ) - 2·r(τ), r por FFT, E por cumsum.
+    También devuelve r (autocorrelación) para el método "acf".
+    """
+    nfft = T.shape[1]
+    W = nfft - tmax
+    n = sfft.next_fast_len(nfft + W)
+    workers = cache.WORKERS if workers is None else workers
+    A = sfft.rfft(T[:, :W], n=n, axis=1, workers=workers)
+    B = sfft.rfft(T, n=n, axis=1, workers=workers)
+    r = sfft.irfft(np.conj(A) * B, n=n, axis=1, workers=workers)[:, :tmax]
+    c = np.concatenate([np.zeros((T.shape[0], 1), T.dtype), np.cumsum(T * T, axis=1)], axis=1)
+    E = c[:, W:W + tmax] - c[:, :tmax]                  # energía de x[τ : τ+W]
+    return E[:, :1] + E - 2 * r, r, E
+
+
+def _primer_tramo(cond, rango, t1):
+    """
+    Máscara del primer tramo contiguo donde `cond` es verdadera (por fila);
+    en las filas sin ningún verdadero devuelve `rango`.
+    """
+    tau = np.arange(cond.shape[1])
+    primero = np.argmax(cond, axis=1)
+    fin = np.argmax(~cond & (tau >= primero[:, None]), axis=1)
+    fin = np.where(fin > primero, fin, t1)
+    tramo = (tau >= primero[:, None]) & (tau < fin[:, None])
+    return np.where(cond.any(axis=1)[:, None], tramo, rango)
+
+
+def _pitch_yin(T, fs, t0, t1, umbral, workers):
+    d, _, _ = _diferencia(T, t1 + 1, workers)
+    tau = np.arange(d.shape[1])
+    cm = np.cumsum(d[:, 1:], axis=1)
+    dn = np.ones_like(d)
+    dn[:, 1:] = d[:, 1:] * tau[1:] / np.where(cm > 0, cm, 1)   # diferencia normalizada
+    rango = (tau >= t0) & (tau < t1)
+    valle = _primer_tramo((dn < umbral) & rango, rango, t1)     # sin cruce: mínimo global
+    k = np.argmin(np.where(valle, dn, np.inf), axis=1)
+    p = parabola(dn, k)
+    filas = np.arange(len(k))
+    return fs / (k + p), np.clip(1.0 - dn[filas, k], 0.0, 1.0)
+
+
+def _pitch_acf(T, fs, t0, t1, workers, relativo=0.9):
+    _, r, E = _diferencia(T, t1 + 1, workers)
+    rn = r / (np.sqrt(E[:, :1] * E) + 1e-20)                  # correlación normalizada
+    tau = np.arange(rn.shape[1])
+    rango = (tau >= t0) & (tau < t1)
+    tope = np.max(np.where(rango, rn, -np.inf), axis=1, keepdims=True)
+    # primer pico ≥ 90 % del máximo: evita saltar a 2τ, 3τ (errores de octava)
+    pico = _primer_tramo((rn >= relativo * tope) & rango, rango, t1)
+    k = np.argmax(np.where(pico, rn, -np.inf), axis=1)
+    p = parabola(rn, k)
+    filas = np.arange(len(k))
+    return fs / (k + p), np.clip(rn[filas, k], 0.0, 1.0)
+
+
+def seguir_pitch(x, fs=None, nfft=2048, paso=512, fmin=50.0, fmax=1000.0,
+                 metodo="fft", umbral=0.15, dtype=np.float32, workers=None):
+    """
+    Pitch por trama. `x` es un array (entonces hace falta fs) o un WavPCM.
+    Devuelve (t, f0, confianza):
+      - t:         centro de cada trama [s]
+      - f0:        pitch estimado [Hz]
+      - confianza: "fft" fracción de energía de la banda en el pico;
+                   "yin" 1 - d'(τ); "acf" correlación normalizada en τ.
+    """
+    wav = x if isinstance(x, WavPCM) else None
+    if wav is not None:
+        fs, n = wav.fs, wav.n
+    else:
+        x = np.asarray(x, dtype=dtype)
+        n = x.size
+    if metodo == "fft":
+        k0, k1 = rango_bins(nfft, fs, fmin, fmax)
+    elif metodo in ("yin", "acf"):
+        t0, t1 = rango_retardos(nfft, fs, fmin, fmax)
+    else:
+        raise ValueError(f"metodo desconocido: {metodo!r}")
+
+    K = max((n - nfft) // paso + 1, 0)
+    f0 = np.empty(K)
+    conf = np.empty(K)
+    for j0 in range(0, K, TRAMAS_POR_LOTE):
+        j1 = min(j0 + TRAMAS_POR_LOTE, K)
+        i0, i1 = j0 * paso, (j1 - 1) * paso + nfft
+        seg = wav.leer(i0, i1).astype(dtype, copy=False) if wav is not None else x[i0:i1]
+        T = tramas(seg, nfft, paso)
+        if metodo == "fft":
+            f0[j0:j1], conf[j0:j1] = _pitch_fft(T, fs, k0, k1, workers)
+        elif metodo == "yin":
+            f0[j0:j1], conf[j0:j1] = _pitch_yin(T, fs, t0, t1, umbral, workers)
+        else:
+            f0[j0:j1], conf[j0:j1] = _pitch_acf(T, fs, t0, t1, workers)
+    t = (np.arange(K) * paso + nfft / 2) / fs
+    return t, f0, conf
+
+
+if __name__ == "__main__":
+    metodo = sys.argv[2] if len(sys.argv) > 2 else "fft"
+    t, f0, conf = seguir_pitch(WavPCM(sys.argv[1]), metodo=metodo)
+    ok = conf >= 0.5
+    print(f"{len(t)} tramas | con confianza ≥ 0.5: {ok.sum()}")
+    if ok.any():
+        print(f"f0 mediana = {np.median(f0[ok]):.2f} Hz | "
+              f"p10–p90 = {np.percentile(f0[ok], 10):.2f}–{np.percentile(f0[ok], 90):.2f} Hz")
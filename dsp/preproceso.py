@@ -0,0 +1,152 @@
+"""
+Preproceso de tomas (antes en clase03-06): recorte de silencio, DC +
+normalización y pico espectral con interpolación parabólica.
+
+`recortar_silencio` + `quitar_dc_normalizar` recorren la señal cinco o
+seis veces (abs, max, where, astype, mean, abs, max) y crean temporales
+del tamaño de la señal. `recortar_y_normalizar` hace lo mismo en dos
+pasadas por bloques:
+  1. por bloque: máx |x|, suma, mínimo y máximo (cuatro números);
+     con eso salen el umbral, los bloques donde caen el primer/último
+     cruce, la DC y el pico sobre [s, e); sólo los (a lo sumo dos)
+     bloques de borde se vuelven a leer para afinar índices y sumas.
+  2. escribe (x[s:e] - DC) · escala bloque a bloque, en el mismo array
+     (en_sitio=True) o en uno nuevo de e - s muestras.
+`recortar_y_normalizar_bloques` es la versión streaming sobre un WAV
+(o array): genera los bloques ya recortados y normalizados.
+"""
+import numpy as np
+
+from dsp.wav import BLOQUE, WavPCM
+
+
+def recortar_silencio(x, fs, thr_db=-40.0, pad_ms=20.0):
+    """Recorta inicio/fin con nivel < umbral relativo (thr_db)."""
+    x = np.asarray(x, dtype=np.float32)
+    thr = 10 ** (thr_db / 20.0) * (np.max(np.abs(x)) + 1e-12)
+    idx = np.where(np.abs(x) > thr)[0]
+    if idx.size == 0:
+        return x
+    pad = int((pad_ms / 1000.0) * fs)
+    s = max(0, idx[0] - pad)
+    e = min(len(x), idx[-1] + pad)
+    return x[s:e]
+
+
+def quitar_dc_normalizar(x, target_dbfs=-1.0):
+    """Quita DC y normaliza el pico a target_dbfs (comparación justa entre tomas)."""
+    x = x.astype(np.float32)
+    x -= np.mean(x)
+    peak = np.max(np.abs(x)) + 1e-12
+    target = 10 ** (target_dbfs / 20.0)
+    return x * (target / peak)
+
+
+def pico_parabolico(f, mag, fmin=None, fmax=None):
+    """
+    Pico con búsqueda opcional en banda y ajuste parabólico sub-bin.
+    f debe ser creciente (rfftfreq): la banda es un rango de índices
+    [k0, k1) por búsqueda binaria, sin máscara sobre todo el eje.
+    """
+    k0 = 0 if fmin is None else int(np.searchsorted(f, fmin, "left"))
+    k1 = len(f) if fmax is None else int(np.searchsorted(f, fmax, "right"))
+    if k1 > k0:
+        k = k0 + int(np.argmax(mag[k0:k1]))
+    else:  # sin banda válida
+        k = int(np.argmax(mag))
+
+    if 1 <= k < len(mag) - 1:
+        a, b, c = mag[k - 1], mag[k], mag[k + 1]
+        p = 0.5 * (a - c) / (a - 2 * b + c + 1e-12)
+        return f[k] + p * (f[1] - f[0])
+    return f[k]
+
+
+# ---------------- núcleo fusionado (dos pasadas) ----------------
+def _plan(leer, n, fs, thr_db, pad_ms, target_dbfs, bloque):
+    """
+    Pasada 1 + bordes: (s, e, dc, escala) con la misma semántica que
+    recortar_silencio → quitar_dc_normalizar. `leer(i0, i1)` da float32.
+    """
+    nb = -(-n // bloque)
+    amax = np.zeros(nb, np.float32)
+    suma = np.zeros(nb)
+    vmin = np.zeros(nb, np.float32)
+    vmax = np.zeros(nb, np.float32)
+    for b in range(nb):
+        x = leer(b * bloque, min((b + 1) * bloque, n))
+        vmin[b], vmax[b] = x.min(), x.max()
+        amax[b] = max(-vmin[b], vmax[b])
+        suma[b] = np.sum(x, dtype=np.float64)
+
+    thr = 10 ** (thr_db / 20.0) * (amax.max() + np.float32(1e-12))
+    activos = np.flatnonzero(amax > thr)
+    if activos.size == 0:                              # nada supera el umbral: sin recorte
+        s, e = 0, n
+    else:
+        pad = int((pad_ms / 1000.0) * fs)
+        b0, b1 = activos[0], activos[-1]
+        x = leer(b0 * bloque, min((b0 + 1) * bloque, n))
+        primero = b0 * bloque + int(np.argmax(np.abs(x) > thr))
+        x = leer(b1 * bloque, min((b1 + 1) * bloque, n))
+        ultimo = b1 * bloque + len(x) - 1 - int(np.argmax(np.abs(x[::-1]) > thr))
+        s, e = max(0, primero - pad), min(n, ultimo + pad)
+
+    # DC y extremos sobre [s, e): bloques internos por sus estadísticas, bordes releídos
+    c0, c1 = -(-s // bloque), e // bloque              # bloques enteros dentro de [s, e)
+    tot = float(np.sum(suma[c0:c1])) if c1 > c0 else 0.0
+    lo = vmin[c0:c1].min() if c1 > c0 else np.inf
+    hi = vmax[c0:c1].max() if c1 > c0 else -np.inf
+    bordes = [(s, min(e, c0 * bloque))] if c1 > c0 else [(s, e)]
+    if c1 > c0:
+        bordes.append((max(s, c1 * bloque), e))
+    for i0, i1 in bordes:
+        if i1 > i0:
+            x = leer(i0, i1)
+            tot += float(np.sum(x, dtype=np.float64))
+            lo, hi = min(lo, x.min()), max(hi, x.max())
+    dc = np.float32(tot / max(e - s, 1))
+    peak = max(hi - dc, dc - lo) + np.float32(1e-12)
+    return s, e, dc, np.float32(10 ** (target_dbfs / 20.0) / peak)
+
+
+def recortar_y_normalizar(x, fs, thr_db=-40.0, pad_ms=20.0, target_dbfs=-1.0,
+                          en_sitio=False, bloque=BLOQUE):
+    """
+    quitar_dc_normalizar(recortar_silencio(x, fs, thr_db, pad_ms), target_dbfs)
+    en dos pasadas y sin temporales del tamaño de la señal.
+    en_sitio=True (x float32 escribible) escribe el resultado al comienzo
+    de x y devuelve la vista x[:e-s]; si no, devuelve un array nuevo.
+    """
+    if en_sitio:
+        assert x.dtype == np.float32 and x.flags.writeable, "en_sitio requiere float32 escribible"
+        leer = lambda i0, i1: x[i0:i1]
+    else:
+        x = np.asarray(x)
+        leer = lambda i0, i1: x[i0:i1].astype(np.float32, copy=False)
+    s, e, dc, escala = _plan(leer, len(x), fs, thr_db, pad_ms, target_dbfs, bloque)
+    out = x if en_sitio else np.empty(e - s, np.float32)
+    for i0 in range(s, e, bloque):                     # pasada 2 (destino ≤ origen: seguro en sitio)
+        y = leer(i0, min(i0 + bloque, e)) - dc
+        y *= escala
+        out[i0 - s:i0 - s + len(y)] = y
+    return out[:e - s]
+
+
+def recortar_y_normalizar_bloques(fuente, fs=None, thr_db=-40.0, pad_ms=20.0,
+                                  target_dbfs=-1.0, bloque=BLOQUE, canal=None):
+    """
+    Streaming: `fuente` es un WavPCM, una ruta a WAV o un array (con fs).
+    Genera bloques float32 de la toma ya recortada (el relleno de pad_ms
+    se resuelve dentro de los bloques de borde), sin DC y a target_dbfs.
+    """
+    if isinstance(fuente, np.ndarray):
+        leer, n = (lambda i0, i1: fuente[i0:i1].astype(np.float32, copy=False)), len(fuente)
+    else:
+        wav = fuente if isinstance(fuente, WavPCM) else WavPCM(fuente)
+        leer, n, fs = (lambda i0, i1: wav.leer(i0, i1, canal)), wav.n, wav.fs
+    s, e, dc, escala = _plan(leer, n, fs, thr_db, pad_ms, target_dbfs, bloque)
+    for i0 in range(s, e, bloque):
+        y = leer(i0, min(i0 + bloque, e)) - dc
+        y *= escala
+        yield y
@@ -0,0 +1,159 @@
+"""
+Remuestreo racional polifásico (antes `scipy.signal.resample` en clase04-8).
+
+`resample` hace una FFT de toda la señal: memoria y tiempo O(N log N),
+muy lento si N es primo y sin forma de procesar por partes. Acá:
+  - L/M sale de fs_out/fs_in (fracción reducida) y el FIR (Kaiser, el
+    mismo diseño que `scipy.signal.resample_poly`) queda en dsp.cache por
+    razón; se guarda partido en sus L fases.
+  - cada salida es el producto de UNA fase (≈ largo/L coeficientes) con
+    una ventana de la entrada: las salidas de una misma fase usan
+    ventanas espaciadas M muestras, o sea una vista con strides y un
+    producto matriz-vector por fase y por bloque.
+  - decimación entera (L = 1): una sola fase, un solo producto por bloque.
+  - `Remuestreador` guarda entre bloques sólo las últimas muestras que el
+    filtro necesita: un WAV de horas se remuestrea con memoria constante.
+  - antialias=False: el filtro sólo interpola (corte en la Nyquist de
+    entrada) y no evita el aliasing al bajar fs, como muestrear la señal
+    "continua" (demos sub-Nyquist). Con L = 1 es tomar 1 de cada M.
+
+Uso:
+    python -m dsp.remuestreo entrada.wav salida.wav 16000
+"""
+import sys
+from fractions import Fraction
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+from scipy.signal import firwin
+
+from dsp import cache
+from dsp.wav import BLOQUE
+
+
+def razon(fs_in, fs_out, max_den=10_000):
+    """(L, M) con fs_out/fs_in = L/M reducida."""
+    r = Fraction(fs_out).limit_denominator(max_den) / Fraction(fs_in).limit_denominator(max_den)
+    return r.numerator, r.denominator
+
+
+def filtro_polifasico(L, M, antialias=True, semiancho=10, beta=5.0, dtype=np.float64):
+    """
+    FIR del remuestreo partido en fases (cacheado): (H, retardo) con
+    H[φ] = h[φ::L] invertido (T coeficientes por fase, relleno con ceros)
+    y retardo = semiancho del filtro en muestras de la tasa L·fs_in.
+    """
+    dtype = np.dtype(dtype)
+
+    def crear():
+        if L == 1 and (not antialias or M == 1):       # decimación pura (o identidad)
+            h, mitad = np.ones(1), 0
+        else:
+            tope = max(L, M) if antialias else L
+            mitad = semiancho * tope
+            h = firwin(2 * mitad + 1, 1.0 / tope, window=("kaiser", beta)) * L
+        T = -(-h.size // L)
+        H = np.zeros(T * L)
+        H[:h.size] = h
+        H = np.ascontiguousarray(H.reshape(T, L).T[:, ::-1], dtype=dtype)
+        H.setflags(write=False)
+        return H, mitad
+    return cache.CACHE.obtener(("polifasico", L, M, antialias, semiancho, beta, dtype.str), crear)
+
+
+class Remuestreador:
+    """
+    Remuestreo por bloques con estado: `procesar(bloque)` devuelve las
+    salidas ya calculables y `fin()` las últimas (la entrada se completa
+    con ceros). En total salen ceil(N·L/M) muestras, alineadas como
+    `resample_poly` (la salida k corresponde al instante k/fs_out).
+    """
+
+    def __init__(self, fs_in, fs_out, antialias=True, semiancho=10, beta=5.0,
+                 dtype=np.float64):
+        self.L, self.M = razon(fs_in, fs_out)
+        self.H, self.retardo = filtro_polifasico(self.L, self.M, antialias, semiancho, beta, dtype)
+        self.T = self.H.shape[1]
+        self.dtype = np.dtype(dtype)
+        self.n_in = 0                                   # muestras de entrada recibidas
+        self.k = 0                                      # próxima salida
+        self.b0 = -(self.T - 1)                         # índice global de buf[0]
+        self.buf = np.zeros(self.T - 1, self.dtype)     # (arranca con ceros a la izquierda)
+
+    def _n0(self, k):
+        """Última muestra de entrada que usa la salida k."""
+        return (k * self.M + self.retardo) // self.L
+
+    def _salidas(self, k1):
+        """Calcula las salidas [self.k, k1) con lo que hay en buf."""
+        k0, L, M = self.k, self.L, self.M
+        y = np.empty(max(k1 - k0, 0), self.dtype)
+        if y.size:
+            W = sliding_window_view(self.buf, self.T)   # W[i] termina en buf[i + T - 1]
+            for j in range(min(L, y.size)):             # una fase por clase de k mód L
+                ks = k0 + j
+                n = -(-(k1 - ks) // L)
+                s = self._n0(ks) - self.T + 1 - self.b0
+                fase = (ks * M + self.retardo) % L
+                if self.T == 1:                         # sin filtro: tomar 1 de cada M
+                    y[j::L] = self.buf[s:s + (n - 1) * M + 1:M] * self.H[fase, 0]
+                else:
+                    y[j::L] = W[s:s + (n - 1) * M + 1:M] @ self.H[fase]
+        self.k = max(k1, k0)
+        s = self._n0(self.k) - self.T + 1 - self.b0     # lo que la próxima salida ya no usa
+        if s > 0:
+            self.buf = self.buf[s:]
+            self.b0 += s
+        return y
+
+    def procesar(self, x):
+        x = np.asarray(x, dtype=self.dtype)
+        self.buf = np.concatenate([self.buf, x])
+        self.n_in += x.size
+        k1 = (self.n_in * self.L - 1 - self.retardo) // self.M + 1   # salidas con n0 ≤ n_in - 1
+        return self._salidas(k1)
+
+    def fin(self):
+        n_out = -(-self.n_in * self.L // self.M)
+        falta = self._n0(n_out - 1) + 1 - (self.b0 + self.buf.size) if n_out else 0
+        if falta > 0:
+            self.buf = np.concatenate([self.buf, np.zeros(falta, self.dtype)])
+        return self._salidas(n_out)
+
+
+def remuestrear(x, fs_in, fs_out, antialias=True, dtype=np.float64, bloque=BLOQUE):
+    """Remuestrea un array 1-D de fs_in a fs_out → ceil(N·L/M) muestras."""
+    r = Remuestreador(fs_in, fs_out, antialias, dtype=dtype)
+    x = np.asarray(x)
+    out = np.empty(-(-x.size * r.L // r.M), r.dtype)
+    i = 0
+    for i0 in range(0, x.size, bloque):
+        y = r.procesar(x[i0:i0 + bloque])
+        out[i:i + y.size] = y
+        i += y.size
+    y = r.fin()
+    out[i:i + y.size] = y
+    return out
+
+
+def remuestrear_bloques(bloques, fs_in, fs_out, antialias=True, dtype=np.float32):
+    """Generador: remuestrea un flujo de bloques (p. ej. dsp.wav.leer_bloques)."""
+    r = Remuestreador(fs_in, fs_out, antialias, dtype=dtype)
+    for b in bloques:
+        y = r.procesar(b)
+        if y.size:
+            yield y
+    y = r.fin()
+    if y.size:
+        yield y
+
+
+if __name__ == "__main__":
+    from scipy.io import wavfile
+
+    from dsp.wav import info_wav, leer_bloques
+    entrada, salida, fs_out = sys.argv[1], sys.argv[2], int(sys.argv[3])
+    fs_in = info_wav(entrada)[0]
+    y = np.concatenate(list(remuestrear_bloques(leer_bloques(entrada), fs_in, fs_out)))
+    wavfile.write(salida, fs_out, y)
+    print(f"{entrada}: {fs_in} Hz → {salida}: {fs_out} Hz ({y.size} muestras)")
@@ -0,0 +1,159 @@
+"""
+Tonos de Shepard (clase07): tono, escala y glissando continuo.
+
+Un tono de Shepard suma senos separados por octavas bajo una envolvente
+espectral gaussiana en log2(f): al rotar las componentes una fracción de
+octava la envolvente queda fija, y la altura parece subir (o bajar) sin
+fin. Hecho "a mano" se suma cada octava en un lazo de Python y se
+concatena cada paso de la escala. Acá:
+  - las componentes de un paso son un acorde de `dsp.sintesis`: el banco
+    de osciladores las sintetiza todas juntas (matriz componentes ×
+    muestras, producto matriz-vector) con fase continua,
+  - la envolvente sólo depende de la posición dentro de la octava: una
+    tabla (pasos × componentes) cacheada por escala,
+  - la escala se escribe en un único buffer (`sintesis.renderizar`),
+  - `glissando_bloques` es un generador de bloques de tamaño fijo: la
+    posición y la fase de cada componente pasan de un bloque al
+    siguiente, así que una hora de glissando usa la misma memoria que un
+    segundo.
+
+Uso:
+    python -m dsp.shepard glissando.wav [--dur 3600] [--vel 0.1] [--baja]
+"""
+import argparse
+import wave
+
+import numpy as np
+
+from dsp import cache
+from dsp.sintesis import Oscilador, muestras, renderizar
+
+DOS_PI = 2 * np.pi
+
+
+def envolvente(pos, num_tones, sigma=None):
+    """
+    Peso gaussiano de una componente a `pos` octavas de la más grave
+    (0 ≤ pos < num_tones), centrado en el medio del rango; sigma por
+    defecto num_tones/6 (los extremos quedan en ≈ -40 dB).
+    """
+    sigma = num_tones / 6 if sigma is None else sigma
+    return np.exp(-0.5 * ((np.asarray(pos) - num_tones / 2) / sigma) ** 2)
+
+
+def _escala_amplitud(num_tones, sigma=None):
+    """1 / máximo de Σ envolvente sobre las posiciones: la suma nunca pasa de 1."""
+    def crear():
+        p = (np.arange(num_tones)[:, None] + np.linspace(0, 1, 1025)[None, :]) % num_tones
+        return 1.0 / float(envolvente(p, num_tones, sigma).sum(axis=0).max())
+    return cache.CACHE.obtener(("shepard_norm", int(num_tones), sigma), crear)
+
+
+def tabla_envolvente(num_tones, pasos, sigma=None):
+    """
+    Posiciones (pasos × componentes, en octavas) y amplitudes normalizadas
+    de cada paso de una escala de `pasos` por octava (sólo lectura, cacheada).
+    """
+    def crear():
+        pos = (np.arange(num_tones)[None, :] + np.arange(pasos)[:, None] / pasos) % num_tones
+        amp = envolvente(pos, num_tones, sigma) * _escala_amplitud(num_tones, sigma)
+        return cache._solo_lectura(pos), cache._solo_lectura(amp)
+    return cache.CACHE.obtener(("shepard", int(num_tones), int(pasos), sigma), crear)
+
+
+def generate_shepard_tone(base_freq, num_tones, duration, sample_rate, paso=0, pasos=12,
+                          sigma=None, out=None):
+    """
+    Tono de Shepard: num_tones componentes en octavas desde base_freq,
+    rotadas `paso`/`pasos` de octava, con envolvente gaussiana. Las
+    componentes por encima de sample_rate/2 se descartan. → float32.
+    """
+    pos, amp = tabla_envolvente(num_tones, pasos, sigma)
+    f, a = _componentes(base_freq, pos[paso % pasos], amp[paso % pasos], sample_rate)
+    n = muestras(duration, sample_rate)
+    return Oscilador(sample_rate).generar(f, n, out=out, A=a)
+
+
+def _componentes(base_freq, pos, amp, fs):
+    f = base_freq * np.exp2(pos)
+    ok = f < fs / 2
+    return f[ok], amp[ok]
+
+
+def escala_shepard(base_freq, num_tones, fs, dur_paso=0.3, pasos=12, vueltas=1,
+                   descendente=False, gap=0.0, sigma=None, A=0.8, fade=0.01):
+    """
+    Escala de Shepard de `vueltas` × `pasos` notas (ascendente o
+    descendente) en un único buffer float32; gap segundos de silencio
+    entre notas.
+    """
+    pos, amp = tabla_envolvente(num_tones, pasos, sigma)
+    orden = np.arange(vueltas * pasos) % pasos
+    if descendente:
+        orden = (-orden) % pasos
+    eventos = []
+    for k in orden:
+        f, a = _componentes(base_freq, pos[k], amp[k], fs)
+        eventos.append((f, dur_paso, a))
+        if gap:
+            eventos.append((None, gap))
+    return renderizar(eventos, fs, A=A, fade=fade)
+
+
+def glissando_bloques(base_freq, num_tones, duracion, fs, velocidad=0.1, descendente=False,
+                      sigma=None, A=0.8, bloque=1 << 13):
+    """
+    Generador de bloques float32 de un glissando de Shepard continuo:
+    `velocidad` octavas por segundo, `duracion` segundos (None → sin fin).
+    Cada componente barre su octava en forma exponencial y al llegar al
+    tope vuelve a la más grave, donde la envolvente es ≈ 0.
+    """
+    v = (-velocidad if descendente else velocidad) / fs       # octavas por muestra
+    escala = A * _escala_amplitud(num_tones, sigma)
+    j = np.arange(num_tones, dtype=np.float64)[:, None]
+    r = np.arange(bloque, dtype=np.float64)[None, :]
+    p0 = 0.0                                                   # posición de la componente 0
+    fase = np.zeros((num_tones, 1))
+    total = None if duracion is None else muestras(duracion, fs)
+    hecho = 0
+    while total is None or hecho < total:
+        m = bloque if total is None else min(bloque, total - hecho)
+        pos = (j + p0 + v * r[:, :m]) % num_tones              # (componentes, m)
+        f = base_freq * np.exp2(pos)
+        dphi = DOS_PI / fs * np.where(f < fs / 2, f, 0.0)
+        ph = np.cumsum(dphi, axis=1)
+        ph -= dphi                                             # fase al inicio de cada muestra
+        ph += fase
+        fase = (ph[:, -1:] + dphi[:, -1:]) % DOS_PI
+        a = envolvente(pos, num_tones, sigma) * (dphi > 0)
+        y = np.einsum("km,km->m", a, np.sin(ph)) * escala
+        p0 = (p0 + v * m) % num_tones
+        hecho += m
+        yield y.astype(np.float32)
+
+
+def escribir_wav(ruta, bloques, fs):
+    """Escribe bloques float32 en un WAV PCM de 16 bits, bloque a bloque."""
+    n = 0
+    with wave.open(str(ruta), "wb") as w:
+        w.setnchannels(1)
+        w.setsampwidth(2)
+        w.setframerate(fs)
+        for b in bloques:
+            w.writeframes(np.round(np.clip(b, -1, 1) * 32767).astype("<i2").tobytes())
+            n += b.size
+    return n
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description="Glissando de Shepard a WAV (memoria constante).")
+    ap.add_argument("salida", help="WAV de salida (PCM 16 bits)")
+    ap.add_argument("--dur", type=float, default=60.0, help="duración [s]")
+    ap.add_argument("--vel", type=float, default=0.1, help="velocidad [octavas/s]")
+    ap.add_argument("--base", type=float, default=27.5, help="frecuencia más grave [Hz]")
+    ap.add_argument("--tonos", type=int, default=9, help="componentes (octavas)")
+    ap.add_argument("--fs", type=int, default=44100, help="frecuencia de muestreo [Hz]")
+    ap.add_argument("--baja", action="store_true", help="glissando descendente")
+    a = ap.parse_args()
+    n = escribir_wav(a.salida, glissando_bloques(a.base, a.tonos, a.dur, a.fs, a.vel, a.baja), a.fs)
+    print(f"{a.salida}: {n} muestras ({n / a.fs:.1f} s) a {a.fs} Hz")
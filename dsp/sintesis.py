@@ -0,0 +1,141 @@
+"""
+Síntesis de secuencias de notas en un solo buffer (antes `tone` +
+`silence` + `np.concatenate` en clase02-4).
+
+El camino original arma cada nota con su propio `np.arange(0, dur, 1/fs)`
+en float64 (el largo puede variar en ±1 muestra por acumulación del paso
+flotante), multiplica los fades por rebanadas y concatena una lista de
+notas: el pico de memoria es el doble del audio final. Acá:
+  - `muestras(dur, fs)` da el largo exacto de cada evento (redondeo, no
+    acumulación) y el total se conoce antes de sintetizar: un único buffer
+    float32 preasignado (o `out=` del llamador), escrito por tramos,
+  - `Oscilador` es un banco de senos con acumulador de fase (float64)
+    que se conserva entre bloques y entre notas: la fase es continua y no
+    hay vector de tiempo por nota (una rampa 0..bloque-1 cacheada),
+  - la envolvente sale de una tabla de fade (medio coseno) cacheada por
+    largo y se aplica en sitio sobre los extremos de cada nota,
+  - una nota puede ser un acorde (varias frecuencias, con amplitudes
+    propias): el banco suma las componentes con un producto matriz-vector.
+
+Eventos: (f, dur) o (f, dur, A); f = None o 0 → silencio; f secuencia →
+acorde (A escalar o una amplitud por componente).
+"""
+import numpy as np
+
+from dsp import cache
+from dsp.wav import BLOQUE
+
+DOS_PI = 2 * np.pi
+
+
+def muestras(dur, fs):
+    """Largo exacto (en muestras) de un evento de `dur` segundos."""
+    return int(round(dur * fs))
+
+
+def rampa(n):
+    """0, 1, ..., n-1 en float64 (sólo lectura, cacheada)."""
+    return cache.CACHE.obtener(("rampa", int(n)),
+                               lambda: cache._solo_lectura(np.arange(n, dtype=np.float64)))
+
+
+def tabla_fade(n, dtype=np.float32):
+    """Fade-in de n muestras: 0.5·(1 - cos(0..π)) (sólo lectura, cacheada)."""
+    dtype = np.dtype(dtype)
+    return cache.CACHE.obtener(
+        ("fade", int(n), dtype.str),
+        lambda: cache._solo_lectura((0.5 * (1 - np.cos(np.linspace(0, np.pi, n)))).astype(dtype)))
+
+
+def n_fade(dur, fs, fade=0.01):
+    """Largo del fade: `fade` segundos o el 10% de la nota si es muy corta."""
+    return max(1, int(min(fade, dur * 0.1) * fs))
+
+
+def aplicar_fade(y, nf):
+    """Fade-in y fade-out de nf muestras sobre y (en sitio)."""
+    nf = min(nf, y.size // 2) if y.size > 1 else y.size
+    if nf:
+        f = tabla_fade(nf, y.dtype if y.dtype.kind == "f" else np.float64)
+        y[:nf] *= f
+        y[-nf:] *= f[::-1]
+    return y
+
+
+class Oscilador:
+    """
+    Banco de osciladores senoidales con fase acumulada. `generar(f, n)`
+    escribe n muestras de Σ A_i·sin(φ_i) y deja cada φ_i donde terminó:
+    la próxima llamada sigue sin salto de fase (aunque cambie f).
+    """
+
+    def __init__(self, fs, fase=0.0, bloque=BLOQUE):
+        self.fs = fs
+        self.bloque = bloque
+        self.fase = np.array([fase], dtype=np.float64)   # una fase por componente
+
+    def generar(self, f, n, out=None, A=1.0):
+        """
+        f escalar o secuencia (acorde), A escalar o una por componente.
+        Escribe en `out` (n muestras; por defecto float32 nuevo) y lo devuelve.
+        """
+        f = np.atleast_1d(np.asarray(f, dtype=np.float64))
+        A = np.broadcast_to(np.asarray(A, dtype=np.float64), f.shape)
+        if self.fase.size != f.size:                     # cambia el tamaño del banco
+            self.fase = np.resize(self.fase, f.size)
+        out = np.empty(n, np.float32) if out is None else out
+        assert out.shape == (n,), "out debe tener n muestras"
+        w = DOS_PI * f / self.fs                         # incremento de fase por muestra
+        r = rampa(min(n, self.bloque))
+        fase = np.empty((f.size, r.size))
+        for i0 in range(0, n, self.bloque):
+            m = min(self.bloque, n - i0)
+            ph = fase[:, :m]
+            np.multiply(w[:, None], r[None, :m], out=ph)
+            ph += self.fase[:, None]
+            np.sin(ph, out=ph)
+            if f.size == 1:
+                np.multiply(ph[0], A[0], out=out[i0:i0 + m], casting="same_kind")
+            else:
+                out[i0:i0 + m] = A @ ph
+            self.fase = (self.fase + w * m) % DOS_PI
+        return out
+
+
+def _normalizar(ev):
+    f, dur = ev[0], ev[1]
+    A = ev[2] if len(ev) > 2 else 1.0
+    sonora = f is not None and np.any(np.asarray(f) != 0)
+    return (f if sonora else None), dur, A
+
+
+def duracion_total(eventos, fs):
+    """Muestras totales de la secuencia (suma de los largos exactos)."""
+    return sum(muestras(ev[1], fs) for ev in eventos)
+
+
+def renderizar(eventos, fs, A=1.0, fade=0.01, out=None, dtype=np.float32, continua=True):
+    """
+    Sintetiza la lista de eventos en un solo buffer (`out` o uno nuevo de
+    `dtype`). A escala todos los eventos; fade en segundos (≤ 10% de la
+    nota); continua=False reinicia la fase en 0 en cada nota (como el
+    `np.arange` por nota original).
+    """
+    eventos = [_normalizar(ev) for ev in eventos]
+    N = duracion_total(eventos, fs)
+    out = np.empty(N, dtype) if out is None else out
+    assert out.shape == (N,), f"out debe tener {N} muestras"
+    osc = Oscilador(fs)
+    i = 0
+    for f, dur, a in eventos:
+        n = muestras(dur, fs)
+        y = out[i:i + n]
+        if f is None:
+            y[:] = 0
+        else:
+            if not continua:
+                osc.fase[:] = 0
+            osc.generar(f, n, out=y, A=np.asarray(a, dtype=np.float64) * A)
+            aplicar_fade(y, n_fade(dur, fs, fade))
+        i += n
+    return out
@@ -0,0 +1,65 @@
+"""
+STFT / espectrograma sin matplotlib.
+
+Los scripts obtenían el espectrograma como efecto colateral de
+`plt.specgram`, que obliga a crear una figura. `stft` devuelve los arrays
+(freqs, times, Pxx) con la MISMA escala que specgram (PSD unilateral,
+ventana Hann simétrica, sin detrend):
+  - las tramas son una vista con strides del buffer (sin copias),
+  - la rFFT es por lotes de tramas, con `workers` hilos,
+  - dtype=np.float32 calcula todo en simple precisión.
+Para graficar: `dsp.graficos.graficar_espectrograma(ax, f, t, Pxx)`.
+"""
+import numpy as np
+
+from dsp import cache
+
+TRAMAS_POR_LOTE = 512   # tramas por rFFT (acota el temporal ventana·trama)
+
+
+def tramas(x, nfft, paso):
+    """Vista (K, nfft) de las tramas de x con salto `paso` (sin copiar)."""
+    return np.lib.stride_tricks.sliding_window_view(x, nfft)[::paso]
+
+
+def escala_psd(nfft, fs, ventana="hann", simetrica=True):
+    """Factor por bin para |X|² → PSD unilateral (como mlab, scale_by_freq)."""
+    def crear():
+        w = cache.ventana(ventana, nfft, simetrica)
+        esc = np.full(nfft // 2 + 1, 1.0 / (fs * np.sum(w ** 2)))
+        esc[1:-1 if nfft % 2 == 0 else None] *= 2.0  # salvo DC / Nyquist
+        esc.setflags(write=False)
+        return esc
+    return cache.CACHE.obtener(("escala_psd", ventana, int(nfft), float(fs), bool(simetrica)), crear)
+
+
+def psd_tramas(T, fs, ventana="hann", simetrica=True, dtype=np.float64, workers=None):
+    """PSD de un lote de tramas (K, nfft) → (nfft//2+1, K)."""
+    nfft = T.shape[-1]
+    w = cache.ventana(ventana, nfft, simetrica, dtype)
+    X = cache.rfft(T * w, workers=workers)
+    P = np.square(X.real) + np.square(X.imag)
+    P *= escala_psd(nfft, fs, ventana, simetrica).astype(P.dtype)
+    return P.T
+
+
+def stft(x, fs, nfft=2048, noverlap=1024, ventana="hann", simetrica=True,
+         dtype=np.float64, workers=None):
+    """
+    Espectrograma (PSD) equivalente a plt.specgram(x, NFFT=nfft, Fs=fs,
+    noverlap=noverlap). Devuelve (freqs, times, Pxx) con Pxx de shape
+    (nfft//2+1, K); times son los centros de las tramas en segundos.
+    """
+    paso = nfft - noverlap
+    assert paso > 0, "noverlap debe ser menor que nfft"
+    x = np.asarray(x, dtype=dtype)
+    if x.size < nfft:                                  # specgram rellena con ceros
+        x = np.concatenate([x, np.zeros(nfft - x.size, dtype=dtype)])
+    T = tramas(x, nfft, paso)
+    K = T.shape[0]
+    Pxx = np.empty((nfft // 2 + 1, K), dtype=dtype)
+    for k0 in range(0, K, TRAMAS_POR_LOTE):
+        Pxx[:, k0:k0 + TRAMAS_POR_LOTE] = psd_tramas(
+            T[k0:k0 + TRAMAS_POR_LOTE], fs, ventana, simetrica, dtype, workers)
+    times = (np.arange(K) * paso + nfft / 2) / fs
+    return cache.eje_frec(nfft, fs), times, Pxx
@@ -0,0 +1,231 @@
+"""
+Análisis por bloques con memoria constante (archivos de varias horas).
+
+Versiones streaming de lo que los scripts hacen sobre el array completo:
+  - DC y RMS                  → `Estadisticas` + `quitar_dc`
+  - find_loudest_window       → `VentanaMasFuerte` (y las k más fuertes)
+  - espectrograma (specgram)  → `espectrograma_stream`
+y `analizar_wav`, que las encadena sobre un WAV en dos pasadas (la
+primera sólo mide la DC, como `x - np.mean(x)` en clase04).
+
+Uso:
+    python -m dsp.stream archivo.wav
+"""
+import sys
+
+import numpy as np
+
+from dsp.stft import psd_tramas, tramas
+from dsp.wav import BLOQUE, info_wav, leer_bloques
+
+
+class Estadisticas:
+    """Acumula N, suma, suma de cuadrados y pico en float64."""
+
+    def __init__(self):
+        self.n = 0
+        self.suma = 0.0
+        self.suma2 = 0.0
+        self.pico = 0.0
+
+    def actualizar(self, x):
+        x = np.asarray(x)
+        if x.size == 0:
+            return self
+        self.n += x.size
+        self.suma += float(np.sum(x, dtype=np.float64))
+        self.suma2 += float(np.dot(x.astype(np.float64, copy=False), x))
+        self.pico = max(self.pico, float(np.max(np.abs(x))))
+        return self
+
+    @property
+    def media(self):
+        return self.suma / self.n if self.n else 0.0
+
+    @property
+    def rms(self):
+        """RMS sin quitar la DC."""
+        return float(np.sqrt(self.suma2 / self.n)) if self.n else 0.0
+
+    @property
+    def rms_ac(self):
+        """RMS de x - media (lo que imprime clase04 tras quitar la DC)."""
+        if not self.n:
+            return 0.0
+        return float(np.sqrt(max(self.suma2 / self.n - self.media ** 2, 0.0)))
+
+
+def quitar_dc(bloques, media):
+    """Generador: resta la DC (medida antes) a cada bloque."""
+    media = np.float32(media)
+    for b in bloques:
+        yield b - media
+
+
+class VentanaMasFuerte:
+    """
+    find_loudest_window por bloques: ventana de W muestras con mayor
+    energía (Σ x²), por suma acumulada: O(N) y memoria constante (sólo
+    guarda las últimas W-1 energías entre bloques).
+
+    Con k > 1 también junta las k ventanas más fuertes que no se solapan
+    (`mejores()`), por supresión de no máximos golosa: la de mayor
+    energía, se descartan los inicios a menos de W de ella, y así k veces
+    (ante un empate gana la primera). Las energías de ventana se agrupan
+    en regiones de W inicios; si 2k-1 regiones de la misma paridad (sus
+    ventanas nunca se solapan) tienen máximo ≥ e, las k elegidas tienen
+    energía ≥ e, así que las regiones con máximo menor se descartan: la
+    memoria queda en O(k·W) y el resultado es el mismo que sobre todo.
+    """
+
+    def __init__(self, W, k=1):
+        assert W >= 1, "W debe ser >= 1"
+        self.W = int(W)
+        self.k = int(k)
+        self.n = 0                       # muestras vistas
+        self.cola = np.zeros(0)          # x² de las últimas W-1 muestras
+        self.mejor = -np.inf
+        self.i0 = 0
+        # top-k: regiones de W inicios de ventana [j·W, (j+1)·W)
+        self.region = np.zeros(0)        # energías de la región en curso (incompleta)
+        self.hechas = 0                  # regiones completas vistas
+        self.regiones = []               # [(j, energía máx., inicio del máx., energías)]
+        self.umbral = (-np.inf, 0)       # clave (energía, -inicio) mínima que puede ganar
+
+    def actualizar(self, x):
+        e = np.concatenate([self.cola, np.square(x, dtype=np.float64)])
+        if e.size >= self.W:
+            c = np.concatenate([[0.0], np.cumsum(e)])
+            p = c[self.W:] - c[:-self.W]               # energía de cada ventana completa
+            k = int(np.argmax(p))
+            if p[k] > self.mejor:
+                self.mejor = float(p[k])
+                self.i0 = self.n - self.cola.size + k  # índice global de inicio
+            if self.k > 1:
+                self._agrupar(p)
+        self.n += len(x)
+        self.cola = e[-(self.W - 1):] if self.W > 1 else e[:0]
+        return self
+
+    def _agrupar(self, p):
+        """Cierra las regiones completas y guarda las que superan el umbral."""
+        W = self.W
+        P = np.concatenate([self.region, p])
+        m = P.size // W
+        if m:
+            E = P[:m * W].reshape(m, W)
+            im = np.argmax(E, axis=1)
+            em = E[np.arange(m), im]
+            j = self.hechas + np.arange(m)
+            inicio = j * W + im
+            e_u, i_u = self.umbral
+            ok = (em > e_u) | ((em == e_u) & (-inicio >= i_u))
+            for r in np.flatnonzero(ok):
+                self.regiones.append((int(j[r]), float(em[r]), int(inicio[r]), E[r].copy()))
+            self.hechas += m
+            if len(self.regiones) > 8 * self.k:
+                self._podar()
+        self.region = P[m * W:].copy()
+
+    def _podar(self):
+        """Sube el umbral a la (2k-1)-ésima clave de cada paridad y descarta las regiones debajo."""
+        umbral = self.umbral
+        for par in (0, 1):
+            claves = sorted(((e, -i) for j, e, i, _ in self.regiones if j % 2 == par),
+                            reverse=True)
+            if len(claves) >= 2 * self.k - 1:
+                umbral = max(umbral, claves[2 * self.k - 2])
+        self.umbral = umbral
+        self.regiones = [r for r in self.regiones if (r[1], -r[2]) >= umbral]
+
+    def resultado(self):
+        """Índices [i0, i1) como find_loudest_window (todo si W >= N)."""
+        if self.W >= self.n:
+            return 0, self.n
+        return self.i0, self.i0 + self.W
+
+    def mejores(self):
+        """
+        Hasta k ventanas [(i0, i1, energía), ...] sin solape, de mayor a
+        menor energía (con k=1, la de `resultado`). Devuelve menos de k
+        sólo si no entran k ventanas disjuntas en la señal.
+        """
+        if self.W > self.n:                            # ninguna ventana completa: todo
+            return [(0, self.n, float(np.sum(self.cola)))]
+        if self.k == 1 or self.W == self.n:            # W == n: la única ventana completa
+            return [(self.i0, self.i0 + self.W, self.mejor)]
+        partes = [(j * self.W, E) for j, _, _, E in self.regiones]
+        partes.append((self.hechas * self.W, self.region))
+        inicio = np.concatenate([i0 + np.arange(E.size) for i0, E in partes])
+        v = np.concatenate([E for _, E in partes])    # ordenadas por inicio
+        out = []
+        for _ in range(self.k):
+            i = int(np.argmax(v))                      # ante un empate, la primera
+            if v[i] == -np.inf:
+                break
+            out.append((int(inicio[i]), int(inicio[i]) + self.W, float(v[i])))
+            v[np.abs(inicio - inicio[i]) < self.W] = -np.inf
+        return out
+
+
+def ventanas_mas_fuertes(x, W, k=1, bloque=BLOQUE):
+    """Atajo sobre un array: VentanaMasFuerte(W, k) alimentada por bloques → mejores()."""
+    vm = VentanaMasFuerte(W, k)
+    for i0 in range(0, len(x), bloque):
+        vm.actualizar(x[i0:i0 + bloque])
+    return vm.mejores()
+
+
+def espectrograma_stream(bloques, fs, nfft=2048, noverlap=1024):
+    """
+    Generador de (t, Pxx) por bloque, con la misma escala que
+    plt.specgram (PSD unilateral, ventana Hann, sin detrend).
+      - t:   centros de cada trama [s], shape (K,)
+      - Pxx: densidad espectral, shape (nfft//2+1, K)
+    Entre bloques sólo se guarda el solapamiento pendiente; cada trama se
+    procesa con el mismo núcleo que `dsp.stft.stft` (float32).
+    """
+    paso = nfft - noverlap
+    assert paso > 0, "noverlap debe ser menor que nfft"
+    buf = np.zeros(0, dtype=np.float32)
+    k0 = 0                                             # índice global de la próxima trama
+    for b in bloques:
+        buf = np.concatenate([buf, np.asarray(b, dtype=np.float32)])
+        if buf.size < nfft:
+            continue
+        K = (buf.size - nfft) // paso + 1
+        T = tramas(buf, nfft, paso)[:K]
+        t = (k0 + np.arange(K)) * paso / fs + nfft / (2 * fs)
+        yield t, psd_tramas(T, fs, dtype=np.float32)
+        k0 += K
+        buf = buf[K * paso:]
+
+
+def analizar_wav(path, win_s=0.06, bloque=BLOQUE, canal=None):
+    """
+    Resumen de un WAV con memoria constante: fs, duración, DC, RMS (sin DC),
+    pico y ventana más enérgica de `win_s` segundos sobre la señal sin DC.
+    """
+    fs, n, ch, _ = info_wav(path)
+    st = Estadisticas()
+    for b in leer_bloques(path, bloque, canal):
+        st.actualizar(b)
+
+    W = max(8, int(win_s * fs))            # mismo W que find_loudest_window
+    vm = VentanaMasFuerte(W)
+    pico = Estadisticas()
+    for b in quitar_dc(leer_bloques(path, bloque, canal), st.media):
+        vm.actualizar(b)
+        pico.actualizar(b)
+    i0, i1 = vm.resultado()
+    return {"fs": fs, "canales": ch, "n": n, "duracion": n / fs,
+            "dc": st.media, "rms": st.rms_ac, "pico": pico.pico,
+            "ventana": (i0, i1)}
+
+
+if __name__ == "__main__":
+    r = analizar_wav(sys.argv[1])
+    print(f"fs = {r['fs']} Hz | canales = {r['canales']} | duración = {r['duracion']:.2f} s")
+    print(f"DC = {r['dc']:.3e} | RMS = {r['rms']:.3e} | pico = {r['pico']:.3f}")
+    i0, i1 = r["ventana"]
+    print(f"Ventana más enérgica: [{i0/r['fs']:.3f}, {i1/r['fs']:.3f}) s")
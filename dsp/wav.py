@@ -0,0 +1,144 @@
+"""
+Lectura de WAV por bloques (float32 mono) sin cargar el archivo entero.
+
+`load_wav` (clase05) y `to_float`/`to_mono` (clase03) leen todo, lo pasan
+a float32 y después mezclan a mono: varias copias del audio completo en
+memoria. Acá el archivo se abre con memory-map y cada bloque se convierte
+y se mezcla por separado, así que la memoria no depende de la duración.
+
+`WavPCM` parsea el encabezado RIFF directamente: los bits por muestra
+salen del bloque 'fmt ' (sin recorrer las muestras como hacía
+infer_wav_bit_depth_from_dtype) y abrir un archivo de GB tarda ms.
+"""
+import os
+import struct
+
+import numpy as np
+
+BLOQUE = 1 << 16   # muestras por bloque (por defecto)
+
+
+def a_float32(data):
+    """PCM (int16/int32/uint8) o float → float32 en [-1, 1], misma escala que load_wav."""
+    if data.dtype == np.int16:
+        return data.astype(np.float32) / 32768.0
+    if data.dtype == np.int32:
+        return data.astype(np.float32) / 2147483648.0
+    if data.dtype == np.uint8:
+        return (data.astype(np.float32) - 128.0) / 128.0
+    return data.astype(np.float32)
+
+
+def a_mono(x, canal=None):
+    """(N, C) → (N,): promedio de canales (canal=None) o un canal puntual."""
+    if x.ndim == 1:
+        return x
+    if canal is None:
+        return x.mean(axis=1, dtype=np.float32)
+    return x[:, canal]
+
+
+class WavPCM:
+    """
+    WAV abierto sin leer las muestras: el encabezado RIFF se parsea acá
+    (formato, canales, fs y bits reales, incluso 24 bits y
+    WAVE_FORMAT_EXTENSIBLE) y el bloque `data` queda como np.memmap.
+    Sólo se convierte a float32 el tramo que se pide:
+        wav = WavPCM("largo.wav")
+        x = wav.leer(i0, i1)        # float32 mono, sólo [i0, i1)
+        x = wav[i0:i1]              # float32 (N,) o (N, C)
+    """
+    PCM, FLOAT, EXTENSIBLE = 0x0001, 0x0003, 0xFFFE
+
+    def __init__(self, path):
+        self.path = str(path)
+        with open(self.path, "rb") as f:
+            riff, _, wave = struct.unpack("<4sI4s", f.read(12))
+            if riff != b"RIFF" or wave != b"WAVE":
+                raise ValueError(f"{self.path}: no es un WAV RIFF")
+            fmt = None
+            while True:
+                cab = f.read(8)
+                if len(cab) < 8:
+                    raise ValueError(f"{self.path}: falta el bloque 'data'")
+                cid, tam = struct.unpack("<4sI", cab)
+                if cid == b"fmt ":
+                    fmt = f.read(tam)
+                    f.seek(tam % 2, 1)                   # relleno a par
+                elif cid == b"data":
+                    offset = f.tell()
+                    break
+                else:
+                    f.seek(tam + tam % 2, 1)
+        if fmt is None:
+            raise ValueError(f"{self.path}: falta el bloque 'fmt '")
+
+        tag, self.canales, self.fs, _, self.bloque_alin, self.bits_contenedor = \
+            struct.unpack("<HHIIHH", fmt[:16])
+        self.bits = self.bits_contenedor                 # bits "útiles" (ADC)
+        if tag == self.EXTENSIBLE and len(fmt) >= 26:
+            valid, = struct.unpack("<H", fmt[18:20])
+            tag, = struct.unpack("<H", fmt[24:26])       # primeros 2 bytes del GUID
+            self.bits = valid or self.bits_contenedor
+        if tag not in (self.PCM, self.FLOAT):
+            raise ValueError(f"{self.path}: formato {tag:#06x} no soportado (sólo PCM/float)")
+        self.es_float = tag == self.FLOAT
+
+        tam_archivo = os.path.getsize(self.path)
+        tam = min(tam, tam_archivo - offset)             # encabezados "streaming" (0xFFFFFFFF)
+        self.n = tam // self.bloque_alin
+        b = self.bits_contenedor // 8
+        if self.es_float:
+            dt, forma = {4: "<f4", 8: "<f8"}[b], (self.n, self.canales)
+        elif b == 3:                                     # 24 bits: 3 bytes sueltos
+            dt, forma = np.uint8, (self.n, self.canales, 3)
+        else:
+            dt, forma = {1: np.uint8, 2: "<i2", 4: "<i4"}[b], (self.n, self.canales)
+        self._raw = np.memmap(self.path, dtype=dt, mode="r", offset=offset, shape=forma) \
+            if self.n else np.zeros(forma, dtype=dt)
+
+    def __len__(self):
+        return self.n
+
+    @property
+    def duracion(self):
+        return self.n / self.fs
+
+    def _convertir(self, raw):
+        if raw.ndim == 3:                                # 24 bits little-endian con signo
+            v = raw.astype(np.int32)
+            v = (v[..., 0] | (v[..., 1] << 8) | (v[..., 2] << 16)) << 8
+            return v.astype(np.float32) / 2147483648.0
+        return a_float32(raw)
+
+    def __getitem__(self, idx):
+        """wav[i0:i1] → float32 (N,) si es mono, (N, C) si no."""
+        if not isinstance(idx, slice):
+            idx = slice(idx, idx + 1 or None)
+        x = self._convertir(self._raw[idx])
+        return x[:, 0] if self.canales == 1 else x
+
+    def leer(self, i0=0, i1=None, canal=None):
+        """Tramo [i0, i1) en float32 mono (promedio de canales o `canal`)."""
+        return a_mono(self[i0:i1], canal)
+
+
+def abrir_wav(path):
+    """Atajo: WavPCM(path)."""
+    return WavPCM(path)
+
+
+def leer_bloques(path, bloque=BLOQUE, canal=None):
+    """
+    Generador de bloques float32 mono de `bloque` muestras (el último puede
+    ser más corto). Sólo el bloque actual se convierte a float.
+    """
+    wav = path if isinstance(path, WavPCM) else WavPCM(path)
+    for i0 in range(0, wav.n, bloque):
+        yield wav.leer(i0, i0 + bloque, canal)
+
+
+def info_wav(path):
+    """(fs, n_muestras, canales, bits) leídos sólo del encabezado."""
+    wav = WavPCM(path)
+    return wav.fs, wav.n, wav.canales, wav.bits